@@ -2,6 +2,16 @@ use crate::cmd_utils::{new_tokio_command, get_adb_program};
 use serde::{Deserialize, Serialize};
 use tauri::AppHandle;
 use crate::adb::stats::{parse_battery_info, parse_mem_info};
+use once_cell::sync::Lazy;
+use std::collections::HashMap;
+use std::sync::Mutex;
+
+/// Model and Android version per udid. These don't change while a device stays connected,
+/// so after the first successful lookup the device poll only asks for the live stats.
+static DEVICE_PROPS_CACHE: Lazy<Mutex<HashMap<String, (String, Option<String>)>>> = Lazy::new(|| Mutex::new(HashMap::new()));
+
+const DEVICE_PROPS_SCRIPT: &str = "getprop ro.product.model; echo '---SEP---'; getprop ro.build.version.release; echo '---SEP---'; ";
+const DEVICE_STATS_SCRIPT: &str = "dumpsys battery; echo '---SEP---'; cat /proc/meminfo || dumpsys meminfo; echo '---SEP---'; df -k /data";
 
 #[derive(Debug, Serialize, Deserialize)]
 pub struct Device {
@@ -62,8 +72,13 @@ pub async fn get_connected_devices(app: AppHandle) -> Result<Vec<Device>, String
             device_tasks.push(tokio::spawn(async move {
                 let program = get_adb_program(&app_clone);
                 let mut cmd = new_tokio_command(&program);
-                let script = "getprop ro.product.model; echo '---SEP---'; getprop ro.build.version.release; echo '---SEP---'; dumpsys battery; echo '---SEP---'; cat /proc/meminfo || dumpsys meminfo; echo '---SEP---'; df -k /data";
-                cmd.args(&["-s", &udid, "shell", script]);
+                let cached_props = DEVICE_PROPS_CACHE.lock().unwrap().get(&udid).cloned();
+                let script = if cached_props.is_some() {
+                    DEVICE_STATS_SCRIPT.to_string()
+                } else {
+                    format!("{}{}", DEVICE_PROPS_SCRIPT, DEVICE_STATS_SCRIPT)
+                };
+                cmd.args(&["-s", &udid, "shell", &script]);
                 
                 let output = cmd.output().await;
                 let stdout = if let Ok(o) = output {
@@ -74,18 +89,27 @@ pub async fn get_connected_devices(app: AppHandle) -> Result<Vec<Device>, String
 
                 let parts: Vec<&str> = stdout.split("---SEP---").collect();
 
-                let model = parts.get(0).map(|s| s.trim().to_string()).filter(|s| !s.is_empty()).unwrap_or_else(|| "Unknown".to_string());
-                let android_version = parts.get(1).map(|s| s.trim().to_string()).filter(|s| !s.is_empty());
+                let (model, android_version, stats) = match cached_props {
+                    Some((model, android_version)) => (model, android_version, &parts[..]),
+                    None => {
+                        let model = parts.get(0).map(|s| s.trim().to_string()).filter(|s| !s.is_empty()).unwrap_or_else(|| "Unknown".to_string());
+                        let android_version = parts.get(1).map(|s| s.trim().to_string()).filter(|s| !s.is_empty());
+                        if model != "Unknown" {
+                            DEVICE_PROPS_CACHE.lock().unwrap().insert(udid.clone(), (model.clone(), android_version.clone()));
+                        }
+                        (model, android_version, parts.get(2..).unwrap_or(&[]))
+                    }
+                };
                 
-                let battery_level = parts.get(2)
+                let battery_level = stats.get(0)
                     .and_then(|s| parse_battery_info(s))
                     .map(|(lvl, _, _, _)| lvl);
 
-                let (ram_total, ram_used) = parts.get(3)
+                let (ram_total, ram_used) = stats.get(1)
                     .map(|s| parse_mem_info(s).unwrap_or((0, 0)))
                     .unwrap_or((0, 0));
 
-                let (storage_total, storage_used) = parts.get(4)
+                let (storage_total, storage_used) = stats.get(2)
                     .map(|s| {
                         let mut found = None;
                         let mut is_first_line = true;
@@ -1,7 +1,7 @@
 use crate::cmd_utils::{new_std_command, get_adb_program};
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
 use std::fs::OpenOptions;
-use std::io::{BufRead, BufReader, Write};
+use std::io::{BufRead, BufReader, BufWriter, Write};
 use std::process::{Child, Stdio};
 use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::{Arc, Mutex};
@@ -12,12 +12,16 @@ use tauri::{State, AppHandle, Emitter};
 pub struct DmesgProcess {
     child: Arc<Mutex<Option<Child>>>,
     should_stop: Arc<AtomicBool>,
-    buffer: Arc<Mutex<Vec<String>>>,
+    // Oldest lines are dropped from the front once the cap is hit, so a deque avoids shifting the rest
+    buffer: Arc<Mutex<VecDeque<String>>>,
     output_file: Option<String>,
 }
 
 pub struct DmesgState(pub Mutex<HashMap<String, DmesgProcess>>);
 
+/// Write buffer for the optional log file.
+const LOG_FILE_BUFFER: usize = 64 * 1024;
+
 #[tauri::command]
 pub fn start_dmesg(
     app: AppHandle,
@@ -33,11 +37,11 @@ pub fn start_dmesg(
 
     let adb_program = get_adb_program(&app);
 
-    let buffer = Arc::new(Mutex::new(Vec::new()));
+    let buffer = Arc::new(Mutex::new(VecDeque::new()));
     match output_file.clone() {
         Some(path) => {
             if let Ok(mut b) = buffer.lock() {
-                b.push(format!(
+                b.push_back(format!(
                     "--- Kernel Logs (dmesg) started for device: {} (Writing to {}) ---",
                     device, path
                 ));
@@ -45,7 +49,7 @@ pub fn start_dmesg(
         }
         None => {
             if let Ok(mut b) = buffer.lock() {
-                b.push(format!("--- Kernel Logs (dmesg) started for device: {} ---", device));
+                b.push_back(format!("--- Kernel Logs (dmesg) started for device: {} ---", device));
             }
         }
     }
@@ -70,7 +74,8 @@ pub fn start_dmesg(
             // Some devices might not support -w, but we'll try it.
             // If it exits immediately, we sleep and retry, acting as a fallback poll if -w behaves like normal dmesg.
             cmd.args(&["-s", &device_id, "shell", "dmesg", "-w"]);
-            cmd.stdout(Stdio::piped()).stderr(Stdio::piped());
+            // stderr is never read; an unread pipe could fill and stall adb
+            cmd.stdout(Stdio::piped()).stderr(Stdio::null());
 
             match cmd.spawn() {
                 Ok(mut child_proc) => {
@@ -89,13 +94,17 @@ pub fn start_dmesg(
                         let reader_device_id = device_id.clone();
 
                         thread::spawn(move || {
-                            let reader = BufReader::new(out);
+                            let mut reader = BufReader::new(out);
                             let mut file_writer = if let Some(ref path) = reader_output_file {
+                                // Buffered so each log line is not its own write syscall; flushed
+                                // whenever the reader has caught up with the device
                                 OpenOptions::new().create(true).append(true).open(path).ok()
+                                    .map(|f| BufWriter::with_capacity(LOG_FILE_BUFFER, f))
                             } else {
                                 None
                             };
 
+                            let mut line = String::new();
                             let mut chunk = Vec::new();
                             let mut last_emit = Instant::now();
 
@@ -105,39 +114,50 @@ pub fn start_dmesg(
                                 lines: Vec<String>,
                             }
 
-                            for line in reader.lines() {
+                            loop {
                                 if reader_should_stop.load(Ordering::Relaxed) {
                                     break;
                                 }
 
-                                if let Ok(l) = line {
-                                    if let Some(ref mut f) = file_writer {
-                                        let _ = writeln!(f, "{}", l);
-                                    }
-                                    if let Ok(mut b) = reader_buffer.lock() {
-                                        b.push(l.clone());
-                                        if b.len() > 10000 {
-                                            b.drain(0..1000);
-                                        }
-                                    }
-
-                                    chunk.push(l);
-
-                                    if chunk.len() >= 50 || last_emit.elapsed().as_millis() >= 200 {
-                                        let payload = DmesgPayload {
-                                            device: reader_device_id.clone(),
-                                            lines: chunk.clone(),
-                                        };
-                                        let _ = reader_app_handle.emit("dmesg-data", payload);
-                                        chunk.clear();
-                                        last_emit = Instant::now();
+                                line.clear();
+                                match reader.read_line(&mut line) {
+                                    Ok(0) | Err(_) => break,
+                                    Ok(_) => {}
+                                }
+                                let l = line.trim_end_matches(['\r', '\n']).to_string();
+
+                                if let Some(ref mut f) = file_writer {
+                                    let _ = writeln!(f, "{}", l);
+                                    // Nothing more is buffered, so the next read waits on the device:
+                                    // get what we have onto disk rather than holding it until then
+                                    if reader.buffer().is_empty() {
+                                        let _ = f.flush();
                                     }
-                                } else {
-                                    break;
+                                }
+                                chunk.push(l);
+
+                                // Also publish once everything read so far is consumed: the next read
+                                // waits on the device, and a quiet device must not hold back the tail
+                                let caught_up = reader.buffer().is_empty();
+                                if chunk.len() >= 50 || last_emit.elapsed().as_millis() >= 200 || caught_up {
+                                    // One buffer lock per batch rather than per line, and the
+                                    // batch is handed to the event instead of being copied
+                                    append_to_buffer(&reader_buffer, &chunk);
+                                    let payload = DmesgPayload {
+                                        device: reader_device_id.clone(),
+                                        lines: std::mem::take(&mut chunk),
+                                    };
+                                    let _ = reader_app_handle.emit("dmesg-data", payload);
+                                    last_emit = Instant::now();
                                 }
                             }
-                            
+
+                            if let Some(ref mut f) = file_writer {
+                                let _ = f.flush();
+                            }
+
                             if !chunk.is_empty() {
+                                append_to_buffer(&reader_buffer, &chunk);
                                 let payload = DmesgPayload {
                                     device: reader_device_id.clone(),
                                     lines: chunk,
@@ -253,6 +273,16 @@ pub fn get_dmesg_details(
     }
 }
 
+/// Appends a batch of lines to a device's shared buffer, dropping the oldest when it grows too large.
+fn append_to_buffer(buffer: &Mutex<VecDeque<String>>, lines: &[String]) {
+    if let Ok(mut b) = buffer.lock() {
+        b.extend(lines.iter().cloned());
+        if b.len() > 10000 {
+            b.drain(..1000);
+        }
+    }
+}
+
 #[tauri::command]
 pub fn fetch_dmesg_buffer(
     state: State<'_, DmesgState>,
@@ -269,7 +299,7 @@ pub fn fetch_dmesg_buffer(
             return Ok((Vec::new(), len));
         }
 
-        let new_lines = buf[offset..].to_vec();
+        let new_lines: Vec<String> = buf.range(offset..).cloned().collect();
         Ok((new_lines, len))
     } else {
         Ok((Vec::new(), 0))
@@ -1,9 +1,11 @@
-use crate::cmd_utils::{new_std_command, get_adb_program};
-use std::collections::HashMap;
+use crate::adb::shell::run_adb_shell_persistent;
+use crate::cmd_utils::{grow_pipe_buffer, new_std_command, get_adb_program};
+use std::collections::{HashMap, VecDeque};
 use std::fs::OpenOptions;
-use std::io::{BufRead, BufReader, Write};
+use std::io::{BufRead, BufReader, BufWriter, Write};
 use std::process::{Child, Stdio};
 use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::mpsc::{self, Sender};
 use std::sync::{Arc, Mutex};
 use std::thread;
 use std::time::{Duration, Instant};
@@ -15,12 +17,23 @@ pub struct LogcatProcess {
     child: Arc<Mutex<Option<Child>>>,
     // Flag to signal the monitoring thread to stop
     should_stop: Arc<AtomicBool>,
-    buffer: Arc<Mutex<Vec<String>>>,
+    // Oldest lines are dropped from the front once the cap is hit, so a deque avoids shifting the rest
+    buffer: Arc<Mutex<VecDeque<String>>>,
     output_file: Option<String>,
 }
 
 pub struct LogcatState(pub Mutex<HashMap<String, LogcatProcess>>);
 
+/// Read buffer for the logcat pipe; a busy device produces thousands of lines per second,
+/// so pull them in large blocks rather than the default 8 KiB.
+const LOGCAT_READ_BUFFER: usize = 64 * 1024;
+
+/// Longest gap, in one-second monitor ticks, between PID checks while the filtered app is stable.
+const PID_CHECK_MAX_TICKS: u32 = 4;
+
+/// Write buffer for the optional log file.
+const LOG_FILE_BUFFER: usize = 64 * 1024;
+
 #[tauri::command]
 pub fn start_logcat(
     app: AppHandle,
@@ -42,12 +55,12 @@ pub fn start_logcat(
     let adb_program = get_adb_program(&app);
 
     // Shared State for the supervisor thread
-    let buffer = Arc::new(Mutex::new(Vec::new()));
+    let buffer = Arc::new(Mutex::new(VecDeque::new()));
     match output_file.clone() {
         Some(path) => {
             // Add header to buffer
             if let Ok(mut b) = buffer.lock() {
-                b.push(format!(
+                b.push_back(format!(
                     "--- Logcat started for device: {} (Writing to {}) ---",
                     device, path
                 ));
@@ -55,7 +68,7 @@ pub fn start_logcat(
         }
         None => {
             if let Ok(mut b) = buffer.lock() {
-                b.push(format!("--- Logcat started for device: {} ---", device));
+                b.push_back(format!("--- Logcat started for device: {} ---", device));
             }
         }
     }
@@ -69,7 +82,8 @@ pub fn start_logcat(
     let thread_filter = filter.clone();
     let thread_level = level.clone();
     let thread_buffer = buffer.clone();
-    let thread_output_file = output_file.clone();
+    // One writer per session, shared by every logcat process the supervisor restarts
+    let thread_log_writer = output_file.as_deref().and_then(spawn_log_writer);
     let thread_extra_tags = extra_tags.clone();
     let thread_child_mutex = child_mutex.clone();
     let thread_should_stop = should_stop.clone();
@@ -89,7 +103,7 @@ pub fn start_logcat(
             // 1. Resolve PID if package is provided
             if let Some(ref package) = pkg {
                 // Try to find PID
-                match get_pid(&adb_bin, &device_id, package) {
+                match get_pid(&thread_app_handle, &device_id, package) {
                     Ok(Some(pid)) => {
                         current_pid = Some(pid);
                     }
@@ -134,11 +148,15 @@ pub fn start_logcat(
             // Spawn
             let mut cmd = new_std_command(&adb_bin);
             cmd.args(&args);
-            cmd.stdout(Stdio::piped()).stderr(Stdio::piped());
+            // stderr is never read; an unread pipe could fill and stall adb
+            cmd.stdout(Stdio::piped()).stderr(Stdio::null());
 
             match cmd.spawn() {
                 Ok(mut child_proc) => {
                     let stdout = child_proc.stdout.take();
+                    if let Some(ref out) = stdout {
+                        grow_pipe_buffer(out);
+                    }
 
                     // Store child
                     {
@@ -149,19 +167,15 @@ pub fn start_logcat(
                     // SPAWN READER THREAD
                     if let Some(out) = stdout {
                         let reader_buffer = thread_buffer.clone();
-                        let reader_output_file = thread_output_file.clone();
+                        let reader_log_writer = thread_log_writer.clone();
                         let reader_should_stop = thread_should_stop.clone();
                         let reader_app_handle = thread_app_handle.clone();
                         let reader_device_id = device_id.clone();
                         let reader_session_id = thread_session_id.clone();
 
                         thread::spawn(move || {
-                            let reader = BufReader::new(out);
-                            let mut file_writer = if let Some(ref path) = reader_output_file {
-                                OpenOptions::new().create(true).append(true).open(path).ok()
-                            } else {
-                                None
-                            };
+                            let mut reader = BufReader::with_capacity(LOGCAT_READ_BUFFER, out);
+                            let mut raw_line = Vec::new();
 
                             let mut chunk = Vec::new();
                             let mut last_emit = Instant::now();
@@ -173,44 +187,47 @@ pub fn start_logcat(
                                 lines: Vec<String>,
                             }
 
-                            for line in reader.lines() {
+                            loop {
                                 // Stop reading if global stop is requested
                                 if reader_should_stop.load(Ordering::Relaxed) {
                                     break;
                                 }
 
-                                if let Ok(l) = line {
-                                    // Write file
-                                    if let Some(ref mut f) = file_writer {
-                                        let _ = writeln!(f, "{}", l);
-                                    }
-                                    // Buffer
-                                    if let Ok(mut b) = reader_buffer.lock() {
-                                        b.push(l.clone());
-                                        if b.len() > 10000 {
-                                            b.drain(0..1000);
-                                        }
-                                    }
-
-                                    chunk.push(l);
-
-                                    if chunk.len() >= 50 || last_emit.elapsed().as_millis() >= 200 {
-                                        let payload = LogcatPayload {
-                                            device: reader_device_id.clone(),
-                                            session_id: reader_session_id.clone(),
-                                            lines: chunk.clone(),
-                                        };
-                                        let _ = reader_app_handle.emit("logcat-data", payload);
-                                        chunk.clear();
-                                        last_emit = Instant::now();
-                                    }
-                                } else {
-                                    break; // Stream broken or process killed
+                                raw_line.clear();
+                                match reader.read_until(b'\n', &mut raw_line) {
+                                    Ok(0) | Err(_) => break, // Stream broken or process killed
+                                    Ok(_) => {}
+                                }
+                                // Decode lossily so one malformed app log line doesn't end the stream
+                                let l = String::from_utf8_lossy(&raw_line)
+                                    .trim_end_matches(['\r', '\n'])
+                                    .to_string();
+
+                                // Every line goes to the file as soon as it is read; the writer's
+                                // buffer amortises the writes and flushes once its queue runs dry
+                                send_to_log_writer(&reader_log_writer, &l);
+                                chunk.push(l);
+
+                                // Also publish once everything read so far is consumed: the next read
+                                // waits on the device, and a quiet device must not hold back the tail
+                                let caught_up = reader.buffer().is_empty();
+                                if chunk.len() >= 50 || last_emit.elapsed().as_millis() >= 200 || caught_up {
+                                    // The shared buffer is only read by polling, so it takes the
+                                    // batch under one lock instead of being locked per line
+                                    append_to_buffer(&reader_buffer, &chunk);
+                                    let payload = LogcatPayload {
+                                        device: reader_device_id.clone(),
+                                        session_id: reader_session_id.clone(),
+                                        lines: std::mem::take(&mut chunk),
+                                    };
+                                    let _ = reader_app_handle.emit("logcat-data", payload);
+                                    last_emit = Instant::now();
                                 }
                             }
-                            
+
                             // Emit remaining lines if any
                             if !chunk.is_empty() {
+                                append_to_buffer(&reader_buffer, &chunk);
                                 let payload = LogcatPayload {
                                     device: reader_device_id.clone(),
                                     session_id: reader_session_id.clone(),
@@ -222,6 +239,10 @@ pub fn start_logcat(
                     }
 
                     // MONITOR LOOP
+                    // The PID check costs a device round trip, so it backs off while the app keeps
+                    // the same PID; the cheap child liveness check still runs every second
+                    let mut pid_check_every: u32 = 1;
+                    let mut ticks_since_pid_check: u32 = 0;
                     loop {
                         if thread_should_stop.load(Ordering::Relaxed) {
                             break;
@@ -248,9 +269,14 @@ pub fn start_logcat(
                         }
 
                         // 2. Check if App PID changed (Only if we are filtering by package)
+                        ticks_since_pid_check += 1;
+                        if ticks_since_pid_check < pid_check_every {
+                            continue;
+                        }
+                        ticks_since_pid_check = 0;
                         if let Some(ref package) = pkg {
                             if let Some(ref old_pid) = current_pid {
-                                match get_pid(&adb_bin, &device_id, package) {
+                                match get_pid(&thread_app_handle, &device_id, package) {
                                     Ok(Some(new_pid)) => {
                                         if new_pid != *old_pid {
                                             // PID Changed! App restarted.
@@ -260,6 +286,7 @@ pub fn start_logcat(
                                             }
                                             break;
                                         }
+                                        pid_check_every = (pid_check_every * 2).min(PID_CHECK_MAX_TICKS);
                                     }
                                     Ok(None) => {
                                         // App died
@@ -308,42 +335,38 @@ pub fn start_logcat(
     Ok("Logcat started".to_string())
 }
 
-fn get_pid(adb_bin: &str, device: &str, pkg: &str) -> Result<Option<String>, String> {
-    let mut pidof_cmd = new_std_command(adb_bin);
-    pidof_cmd.args(&["-s", device, "shell", "pidof", "-s", pkg]);
+/// Resolves the app's PID and its OOM score in one command, printing "<pid> <oom_score_adj>"
+/// (nothing when the app is not running).
+fn pid_query_script(pkg: &str) -> String {
+    format!(
+        "rr_pid=$(pidof -s {}); if [ -n \"$rr_pid\" ]; then echo \"$rr_pid $(cat /proc/$rr_pid/oom_score_adj 2>/dev/null)\"; fi",
+        pkg
+    )
+}
 
-    match pidof_cmd.output() {
-        Ok(output) => {
-            let pid = String::from_utf8_lossy(&output.stdout).trim().to_string();
-            if pid.is_empty() {
-                return Ok(None);
-            }
+/// Called from the supervisor thread every second, so it reuses the device's persistent shell
+/// instead of spawning two adb clients per check.
+fn get_pid(app: &AppHandle, device: &str, pkg: &str) -> Result<Option<String>, String> {
+    let output = tauri::async_runtime::block_on(run_adb_shell_persistent(
+        app,
+        device,
+        vec![pid_query_script(pkg)],
+    ))
+    .map_err(|e| e.to_string())?;
+
+    let mut parts = output.split_whitespace();
+    let pid = match parts.next() {
+        Some(pid) => pid.to_string(),
+        None => return Ok(None),
+    };
 
-            // Check process state (zombie/cached check)
-            let mut oom_cmd = new_std_command(adb_bin);
-            oom_cmd.args(&[
-                "-s",
-                device,
-                "shell",
-                "cat",
-                &format!("/proc/{}/oom_score_adj", pid),
-            ]);
-
-            if let Ok(oom_output) = oom_cmd.output() {
-                let score_str = String::from_utf8_lossy(&oom_output.stdout)
-                    .trim()
-                    .to_string();
-                if let Ok(score) = score_str.parse::<i32>() {
-                    // 900+ is cached
-                    if score >= 900 {
-                        return Ok(None);
-                    }
-                }
-            }
-            Ok(Some(pid))
+    // Check process state (zombie/cached check); 900+ is cached
+    if let Some(score) = parts.next().and_then(|s| s.parse::<i32>().ok()) {
+        if score >= 900 {
+            return Ok(None);
         }
-        Err(e) => Err(e.to_string()),
     }
+    Ok(Some(pid))
 }
 
 #[tauri::command]
@@ -402,6 +425,48 @@ pub fn get_logcat_details(
     }
 }
 
+/// Opens the session's log file and starts a thread that owns it, so disk writes never stall the
+/// pipe reader. Lines arrive as ready-to-write text; the thread exits once every sender is dropped.
+fn spawn_log_writer(path: &str) -> Option<Sender<String>> {
+    let file = OpenOptions::new().create(true).append(true).open(path).ok()?;
+    let (tx, rx) = mpsc::channel::<String>();
+
+    thread::spawn(move || {
+        let mut writer = BufWriter::with_capacity(LOG_FILE_BUFFER, file);
+        while let Ok(text) = rx.recv() {
+            let _ = writer.write_all(text.as_bytes());
+            // Drain whatever queued up meanwhile before paying for a flush
+            while let Ok(more) = rx.try_recv() {
+                let _ = writer.write_all(more.as_bytes());
+            }
+            let _ = writer.flush();
+        }
+        let _ = writer.flush();
+    });
+
+    Some(tx)
+}
+
+/// Hands a line to the session's log writer, if the session writes to a file.
+fn send_to_log_writer(writer: &Option<Sender<String>>, line: &str) {
+    if let Some(tx) = writer {
+        let mut text = String::with_capacity(line.len() + 1);
+        text.push_str(line);
+        text.push('\n');
+        let _ = tx.send(text);
+    }
+}
+
+/// Appends a batch of lines to a session's shared buffer, dropping the oldest when it grows too large.
+fn append_to_buffer(buffer: &Mutex<VecDeque<String>>, lines: &[String]) {
+    if let Ok(mut b) = buffer.lock() {
+        b.extend(lines.iter().cloned());
+        if b.len() > 10000 {
+            b.drain(..1000);
+        }
+    }
+}
+
 #[tauri::command]
 pub fn fetch_logcat_buffer(
     state: State<'_, LogcatState>,
@@ -420,73 +485,52 @@ pub fn fetch_logcat_buffer(
             return Ok((Vec::new(), len));
         }
 
-        let new_lines = buf[offset..].to_vec();
+        let new_lines: Vec<String> = buf.range(offset..).cloned().collect();
         Ok((new_lines, len))
     } else {
         Ok((Vec::new(), 0))
     }
 }
 
+/// Separates the focus lines from the transition count in the output of `UI_CHANGE_SCRIPT`.
+const UI_CHANGE_SPLIT: &str = "__RR_LOGCAT__";
+
+/// Reads the focused window and counts recent window/activity transitions in the last 50 logcat
+/// lines. Both are filtered on the device so only a couple of short lines come back per poll.
+const UI_CHANGE_SCRIPT: &str = "dumpsys window visible-apps | grep -m 1 -E 'mCurrentFocus|mFocusedApp' \
+    || dumpsys window | grep -m 1 -E 'mCurrentFocus|mFocusedApp'; \
+    echo __RR_LOGCAT__; \
+    logcat -d -t 50 | grep -c -E 'ActivityTaskManager: (START|Displayed)|WINDOW_STATE_CHANGE|focusChanged|InputDispatcher: Focus (entered|left)|AccessibilityManager: sendAccessibilityEvent' \
+    || true";
+
 #[tauri::command]
 pub async fn check_ui_change(
     app: AppHandle,
     device: String,
     last_focus: String,
 ) -> Result<(bool, String), String> {
-    let adb_program = get_adb_program(&app);
-    
-    // 1. Get current focused window/activity
-    let mut focus_cmd = new_std_command(&adb_program);
-    focus_cmd.args(&["-s", &device, "shell", "dumpsys", "window", "visible-apps"]);
-    
-    let mut focus_raw = String::new();
-    if let Ok(output) = focus_cmd.output() {
-        focus_raw = String::from_utf8_lossy(&output.stdout).to_string();
-    }
-    
-    if focus_raw.is_empty() {
-        let mut fallback_cmd = new_std_command(&adb_program);
-        fallback_cmd.args(&["-s", &device, "shell", "dumpsys", "window"]);
-        if let Ok(output) = fallback_cmd.output() {
-            focus_raw = String::from_utf8_lossy(&output.stdout).to_string();
-        }
-    }
+    // One round trip on the device's persistent shell instead of separate dumpsys and logcat clients.
+    // A failed check (adb hiccup, shell timeout) reports "no change" and keeps the last known focus
+    // rather than failing the caller's sync poll
+    let output = match run_adb_shell_persistent(&app, &device, vec![UI_CHANGE_SCRIPT.to_string()]).await {
+        Ok(output) => output,
+        Err(_) => return Ok((false, last_focus)),
+    };
 
-    let mut current_focus = String::new();
-    for line in focus_raw.lines() {
-        if line.contains("mCurrentFocus") || line.contains("mFocusedApp") {
-            current_focus = line.trim().to_string();
-            break;
-        }
-    }
+    let (focus_raw, logcat_raw) = output.split_once(UI_CHANGE_SPLIT).unwrap_or((output.as_str(), ""));
+
+    let current_focus = focus_raw
+        .lines()
+        .find(|line| line.contains("mCurrentFocus") || line.contains("mFocusedApp"))
+        .map(|line| line.trim().to_string())
+        .unwrap_or_default();
 
     let focus_changed = !last_focus.is_empty() && last_focus != current_focus;
     if focus_changed {
         return Ok((true, current_focus));
     }
 
-    // 2. Check recent logcat lines for transitions
-    let mut logcat_cmd = new_std_command(&adb_program);
-    logcat_cmd.args(&["-s", &device, "logcat", "-d", "-t", "50"]);
-    
-    let logcat_changed = if let Ok(output) = logcat_cmd.output() {
-        let stdout = String::from_utf8_lossy(&output.stdout);
-        let keywords = [
-            "ActivityTaskManager: START",
-            "ActivityTaskManager: Displayed",
-            "WINDOW_STATE_CHANGE",
-            "focusChanged",
-            "WindowManager: focusChanged",
-            "InputDispatcher: Focus entered",
-            "InputDispatcher: Focus left",
-            "AccessibilityManager: sendAccessibilityEvent",
-        ];
-        stdout.lines().any(|line| {
-            keywords.iter().any(|kw| line.contains(kw))
-        })
-    } else {
-        false
-    };
+    let logcat_changed = logcat_raw.trim().parse::<u32>().map_or(false, |count| count > 0);
 
     Ok((logcat_changed, current_focus))
 }
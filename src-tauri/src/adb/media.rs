@@ -1,44 +1,58 @@
+use crate::adb::shell::run_adb_shell_persistent;
 use crate::cmd_utils::{new_tokio_command, get_adb_program};
 use std::fs::File;
-use std::io::Write;
+use std::process::Stdio;
+use std::time::Instant;
 use tokio::time::{sleep, Duration};
 use tauri::AppHandle;
 
+/// Where screenrecord writes on the device until the recording is pulled.
+const RECORDING_REMOTE_PATH: &str = "/sdcard/robot_runner_rec.mp4";
+/// Interval between size checks while screenrecord finalizes the file after SIGINT.
+const RECORDING_SETTLE_POLL: Duration = Duration::from_millis(150);
+/// Upper bound on that wait (the old fixed delay), for devices where the size cannot be read.
+const RECORDING_SETTLE_TIMEOUT: Duration = Duration::from_secs(2);
+
+/// Owned argument list for `run_adb_shell_persistent`.
+fn shell_args(args: &[&str]) -> Vec<String> {
+    args.iter().map(|a| a.to_string()).collect()
+}
+
 #[tauri::command]
 pub async fn save_screenshot(app: AppHandle, device: String, path: String) -> Result<String, String> {
     let program = get_adb_program(&app);
-    // execute adb exec-out screencap -p
+    // execute adb exec-out screencap -p, handing the file to adb as its stdout so the PNG is
+    // written straight to disk instead of being collected in memory first
+    let file = File::create(&path).map_err(|e| format!("Failed to create file: {}", e))?;
     let mut cmd = new_tokio_command(&program);
     cmd.args(&["-s", &device, "exec-out", "screencap", "-p"]);
+    cmd.stdout(Stdio::from(file));
+
+    let captured: Result<(), String> = async {
+        let output = cmd
+            .output()
+            .await
+            .map_err(|e| format!("Failed to run {}: {}", program, e))?;
+
+        if output.status.success()
+            && std::fs::metadata(&path).map(|m| m.len() > 0).unwrap_or(false)
+        {
+            return Ok(());
+        }
 
-    let output = cmd
-        .output()
-        .await
-        .map_err(|e| format!("Failed to run {}: {}", program, e))?;
-
-    let bytes = if !output.status.success() || output.stdout.is_empty() {
         let remote_path = "/data/local/tmp/screencap_fallback.png";
-        
-        let mut cmd_cap = new_tokio_command(&program);
-        cmd_cap.args(&["-s", &device, "shell", "screencap", "-p", remote_path]);
-        let output_cap = cmd_cap.output().await
-            .map_err(|e| format!("Failed to execute fallback screencap on device: {}", e))?;
-        
-        if !output_cap.status.success() {
-            return Err(format!(
-                "Fallback screencap failed on device: {}",
-                String::from_utf8_lossy(&output_cap.stderr)
-            ));
-        }
+
+        // The device-side steps go through the device's persistent shell; only the pull needs its own adb process
+        run_adb_shell_persistent(&app, &device, shell_args(&["screencap", "-p", remote_path]))
+            .await
+            .map_err(|e| format!("Fallback screencap failed on device: {}", e))?;
 
         let mut cmd_pull = new_tokio_command(&program);
         cmd_pull.args(&["-s", &device, "pull", remote_path, &path]);
         let output_pull = cmd_pull.output().await
             .map_err(|e| format!("Failed to pull fallback screenshot: {}", e))?;
 
-        let mut cmd_rm = new_tokio_command(&program);
-        cmd_rm.args(&["-s", &device, "shell", "rm", remote_path]);
-        let _ = cmd_rm.output().await;
+        let _ = run_adb_shell_persistent(&app, &device, shell_args(&["rm", remote_path])).await;
 
         if !output_pull.status.success() {
             return Err(format!(
@@ -46,16 +60,15 @@ pub async fn save_screenshot(app: AppHandle, device: String, path: String) -> Re
                 String::from_utf8_lossy(&output_pull.stderr)
             ));
         }
+        Ok(())
+    }
+    .await;
 
-        return Ok(path);
-    } else {
-        output.stdout
-    };
-
-    // Write buffer to file
-    let mut file = File::create(&path).map_err(|e| format!("Failed to create file: {}", e))?;
-    file.write_all(&bytes)
-        .map_err(|e| format!("Failed to write to file: {}", e))?;
+    if let Err(e) = captured {
+        // The target was created up front; don't leave an empty or partial image behind
+        let _ = std::fs::remove_file(&path);
+        return Err(e);
+    }
 
     Ok(path)
 }
@@ -70,7 +83,7 @@ pub async fn start_screen_recording(app: AppHandle, device: String) -> Result<St
         "shell",
         "screenrecord",
         "--verbose",
-        "/sdcard/robot_runner_rec.mp4",
+        RECORDING_REMOTE_PATH,
     ]);
     cmd.stdout(std::process::Stdio::piped());
     cmd.stderr(std::process::Stdio::piped());
@@ -135,50 +148,72 @@ pub async fn stop_screen_recording(app: AppHandle, device: String, local_path: S
     let program = get_adb_program(&app);
     
     // 1. Send SIGINT (2) to screenrecord to make it finalize the MP4
-    let mut cmd_kill = new_tokio_command(&program);
-    cmd_kill.args(&["-s", &device, "shell", "pkill", "-2", "screenrecord"]);
-
-    let kill_output = cmd_kill
-        .output()
-        .await
-        .map_err(|e| format!("Failed to run pkill: {}", e))?;
-
     // If pkill fails (e.g. old android), try killall
-    if !kill_output.status.success() {
-        let mut cmd_killall = new_tokio_command(&program);
-        cmd_killall.args(&["-s", &device, "shell", "killall", "-2", "screenrecord"]);
-        let _ = cmd_killall.output().await;
+    if run_adb_shell_persistent(&app, &device, shell_args(&["pkill", "-2", "screenrecord"])).await.is_err() {
+        let _ = run_adb_shell_persistent(&app, &device, shell_args(&["killall", "-2", "screenrecord"])).await;
     }
 
-    // 2. Wait a bit for file to finalize
-    sleep(Duration::from_secs(2)).await;
+    // 2. Wait for screenrecord to finish writing: the file is final once its size stops changing
+    let deadline = Instant::now() + RECORDING_SETTLE_TIMEOUT;
+    let mut last_size: Option<u64> = None;
+    loop {
+        sleep(RECORDING_SETTLE_POLL).await;
+        let size = run_adb_shell_persistent(&app, &device, shell_args(&["stat", "-c", "%s", RECORDING_REMOTE_PATH]))
+            .await
+            .ok()
+            .and_then(|out| out.trim().parse::<u64>().ok());
+        if matches!((last_size, size), (Some(prev), Some(cur)) if prev == cur && cur > 0) {
+            break;
+        }
+        if Instant::now() >= deadline {
+            break;
+        }
+        last_size = size;
+    }
 
-    // 3. Pull the file
-    let mut cmd_pull = new_tokio_command(&program);
-    cmd_pull.args(&[
+    // 3. Stream the file out and delete it in one on-device shell, writing straight to disk
+    let file = File::create(&local_path).map_err(|e| format!("Failed to create file: {}", e))?;
+    let mut cmd_fetch = new_tokio_command(&program);
+    cmd_fetch.args(&[
         "-s",
         &device,
-        "pull",
-        "/sdcard/robot_runner_rec.mp4",
-        &local_path,
+        "exec-out",
+        &format!("cat {0} && rm -f {0}", RECORDING_REMOTE_PATH),
     ]);
+    cmd_fetch.stdout(Stdio::from(file));
 
-    let pull_output = cmd_pull
+    let fetched = cmd_fetch
         .output()
         .await
-        .map_err(|e| format!("Failed to pull video: {}", e))?;
+        .map(|out| out.status.success())
+        .unwrap_or(false)
+        && std::fs::metadata(&local_path).map(|m| m.len() > 0).unwrap_or(false);
 
-    if !pull_output.status.success() {
-        return Err(format!(
-            "Failed to pull video: {}",
-            String::from_utf8_lossy(&pull_output.stderr)
-        ));
-    }
+    if !fetched {
+        // Older adb without exec-out: pull, then delete separately
+        let mut cmd_pull = new_tokio_command(&program);
+        cmd_pull.args(&[
+            "-s",
+            &device,
+            "pull",
+            RECORDING_REMOTE_PATH,
+            &local_path,
+        ]);
+
+        let pull_error = match cmd_pull.output().await {
+            Ok(out) if out.status.success() => None,
+            Ok(out) => Some(format!("Failed to pull video: {}", String::from_utf8_lossy(&out.stderr))),
+            Err(e) => Some(format!("Failed to pull video: {}", e)),
+        };
+
+        if let Some(err) = pull_error {
+            // The target was created for exec-out; don't leave an empty or truncated video behind
+            let _ = std::fs::remove_file(&local_path);
+            return Err(err);
+        }
 
-    // 4. Delete temp file
-    let mut cmd_rm = new_tokio_command(&program);
-    cmd_rm.args(&["-s", &device, "shell", "rm", "/sdcard/robot_runner_rec.mp4"]);
-    let _ = cmd_rm.output().await;
+        let _ = run_adb_shell_persistent(&app, &device, shell_args(&["rm", RECORDING_REMOTE_PATH])).await;
+    }
 
     Ok(local_path)
 }
@@ -1,4 +1,5 @@
 use std::sync::Mutex;
+use std::time::Instant;
 
 pub mod device;
 pub mod logcat;
@@ -14,12 +15,16 @@ pub mod dmesg;
 
 pub struct AdbState {
     pub custom_path: Mutex<Option<String>>,
+    /// Last resolution of `custom_path` as (raw path, resolved program, resolved at), so the
+    /// env expansion and directory stat are not repeated for every adb invocation.
+    pub resolved_program: Mutex<Option<(String, String, Instant)>>,
 }
 
 impl Default for AdbState {
     fn default() -> Self {
         Self {
             custom_path: Mutex::new(None),
+            resolved_program: Mutex::new(None),
         }
     }
 }
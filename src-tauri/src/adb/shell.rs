@@ -1,11 +1,13 @@
 use crate::cmd_utils::{new_tokio_command, get_adb_program, format_adb_error};
 use crate::errors::{AppError, AppResult};
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::process::Stdio;
 use std::sync::{Arc, Mutex};
+use std::time::Duration;
+use once_cell::sync::Lazy;
 use tauri::{command, AppHandle, Emitter, State, Manager};
-use tokio::io::{AsyncBufReadExt, BufReader as TokioBufReader};
-use tokio::process::Child;
+use tokio::io::{AsyncBufReadExt, AsyncReadExt, AsyncWriteExt, BufReader as TokioBufReader};
+use tokio::process::{Child, ChildStdin, ChildStdout};
 use crate::adb::AdbState;
 
 pub struct ShellState {
@@ -84,6 +86,12 @@ pub async fn execute_adb_with_recovery(
 
 #[command]
 pub async fn run_adb_command(app: AppHandle, device: String, args: Vec<String>) -> AppResult<String> {
+    // Inspector taps, swipes and key presses arrive here as `shell input ...`; they are short
+    // enough that spawning a fresh adb client would dominate their latency
+    if args.len() > 2 && args[0] == "shell" && args[1] == "input" && args[2..].iter().all(|a| is_plain_shell_arg(a)) {
+        return run_adb_shell_persistent(&app, &device, args[1..].to_vec()).await;
+    }
+
     let output = execute_adb_with_recovery(&app, Some(&device), args).await?;
 
     if output.status.success() {
@@ -93,6 +101,17 @@ pub async fn run_adb_command(app: AppHandle, device: String, args: Vec<String>)
     }
 }
 
+/// Read buffer for streamed command output.
+const COMMAND_READ_BUFFER: usize = 64 * 1024;
+
+/// Splits a block of complete output lines, dropping the line terminators (`\n` or `\r\n`).
+fn split_output_lines(block: &[u8]) -> Vec<String> {
+    String::from_utf8_lossy(block)
+        .split('\n')
+        .map(|line| line.trim_end_matches('\r').to_string())
+        .collect()
+}
+
 #[command]
 pub async fn start_adb_command(
     app: AppHandle,
@@ -120,9 +139,25 @@ pub async fn start_adb_command(
     let app_clone = app.clone();
 
     tokio::spawn(async move {
-        let mut reader = TokioBufReader::new(stdout).lines();
-        while let Ok(Some(line)) = reader.next_line().await {
-            let _ = app_clone.emit(&format!("cmd-output-{}", id_clone), line);
+        // Output is pulled in large blocks and every complete line in a block goes out in one
+        // event, instead of one read loop iteration and one event per line
+        let mut stdout = stdout;
+        let output_event = format!("cmd-output-{}", id_clone);
+        let mut block = vec![0u8; COMMAND_READ_BUFFER];
+        let mut pending: Vec<u8> = Vec::new();
+        loop {
+            let n = match stdout.read(&mut block).await {
+                Ok(0) | Err(_) => break,
+                Ok(n) => n,
+            };
+            pending.extend_from_slice(&block[..n]);
+            if let Some(end) = pending.iter().rposition(|&b| b == b'\n') {
+                let _ = app_clone.emit(&output_event, split_output_lines(&pending[..end]));
+                pending.drain(..=end);
+            }
+        }
+        if !pending.is_empty() {
+            let _ = app_clone.emit(&output_event, split_output_lines(&pending));
         }
         let _ = app_clone.emit(&format!("cmd-close-{}", id_clone), "Process finished");
     });
@@ -246,7 +281,7 @@ pub async fn start_adb_server(app: AppHandle) -> AppResult<String> {
 // SECURE ADB COMMANDS
 #[command]
 pub async fn adb_input_tap(app: AppHandle, device: String, x: i32, y: i32) -> AppResult<()> {
-    run_adb_shell_args_internal(
+    run_adb_shell_persistent(
         &app,
         &device,
         vec!["input".to_string(), "tap".to_string(), x.to_string(), y.to_string()],
@@ -257,7 +292,7 @@ pub async fn adb_input_tap(app: AppHandle, device: String, x: i32, y: i32) -> Ap
 
 #[command]
 pub async fn adb_input_swipe(app: AppHandle, device: String, x1: i32, y1: i32, x2: i32, y2: i32, ms: i32) -> AppResult<()> {
-    run_adb_shell_args_internal(
+    run_adb_shell_persistent(
         &app,
         &device,
         vec![
@@ -276,12 +311,12 @@ pub async fn adb_input_swipe(app: AppHandle, device: String, x1: i32, y1: i32, x
 
 #[command]
 pub async fn adb_input_keyevent(app: AppHandle, device: String, keycode: String) -> AppResult<()> {
-    run_adb_shell_args_internal(
-        &app,
-        &device,
-        vec!["input".to_string(), "keyevent".to_string(), keycode],
-    )
-    .await?;
+    let args = vec!["input".to_string(), "keyevent".to_string(), keycode];
+    if args.iter().all(|a| is_plain_shell_arg(a)) {
+        run_adb_shell_persistent(&app, &device, args).await?;
+    } else {
+        run_adb_shell_args_internal(&app, &device, args).await?;
+    }
     Ok(())
 }
 
@@ -353,3 +388,167 @@ async fn run_adb_shell_args_internal(
         Err(AppError::AdbError(format_adb_error(&output)))
     }
 }
+
+/// Marker echoed after every command on a persistent shell; the exit status follows it directly.
+const PERSISTENT_SHELL_SENTINEL: &str = "__RR_DONE__";
+/// Upper bound for a single command on a persistent shell before the session is discarded.
+const PERSISTENT_SHELL_TIMEOUT: Duration = Duration::from_secs(15);
+
+/// A long-lived `adb -s <device> shell` whose stdin receives one command line per request.
+struct PersistentShell {
+    _child: Child,
+    stdin: ChildStdin,
+    stdout: TokioBufReader<ChildStdout>,
+}
+
+/// Persistent shells by device. A device is marked in use while a command runs on its shell, so
+/// concurrent callers never interleave on one pipe; they run a one-shot `adb shell` instead of
+/// starting a second session.
+#[derive(Default)]
+struct PersistentShells {
+    idle: HashMap<String, PersistentShell>,
+    in_use: HashSet<String>,
+}
+
+static PERSISTENT_SHELLS: Lazy<Mutex<PersistentShells>> =
+    Lazy::new(|| Mutex::new(PersistentShells::default()));
+
+/// Clears a device's in-use mark however the command ends (error, timeout or a dropped future).
+struct ShellCheckout<'a> {
+    device: &'a str,
+}
+
+impl Drop for ShellCheckout<'_> {
+    fn drop(&mut self) {
+        if let Ok(mut shells) = PERSISTENT_SHELLS.lock() {
+            shells.in_use.remove(self.device);
+        }
+    }
+}
+
+impl PersistentShell {
+    async fn spawn(app: &AppHandle, device: &str) -> AppResult<Self> {
+        let program = get_adb_program(app);
+        let mut cmd = new_tokio_command(&program);
+        cmd.arg("-s")
+            .arg(device)
+            .arg("shell")
+            .stdin(Stdio::piped())
+            .stdout(Stdio::piped())
+            .stderr(Stdio::null())
+            .kill_on_drop(true);
+
+        let mut child = cmd.spawn().map_err(|e| AppError::AdbError(e.to_string()))?;
+        let stdin = child
+            .stdin
+            .take()
+            .ok_or_else(|| AppError::AdbError("Failed to open stdin".to_string()))?;
+        let stdout = child
+            .stdout
+            .take()
+            .ok_or_else(|| AppError::AdbError("Failed to open stdout".to_string()))?;
+
+        Ok(Self {
+            _child: child,
+            stdin,
+            stdout: TokioBufReader::new(stdout),
+        })
+    }
+
+    /// Writes a command line followed by the sentinel echo. Nothing has run on the device if this fails.
+    async fn send(&mut self, command_line: &str) -> std::io::Result<()> {
+        let line = format!("{{ {}; }} </dev/null 2>&1; echo {}$?\n", command_line, PERSISTENT_SHELL_SENTINEL);
+        self.stdin.write_all(line.as_bytes()).await?;
+        self.stdin.flush().await
+    }
+
+    /// Reads output lines up to the sentinel and returns the command's exit code with its output.
+    async fn read_result(&mut self) -> AppResult<(i32, String)> {
+        let mut output = String::new();
+        let mut line = String::new();
+        loop {
+            line.clear();
+            let read = self
+                .stdout
+                .read_line(&mut line)
+                .await
+                .map_err(|e| AppError::AdbError(e.to_string()))?;
+            if read == 0 {
+                return Err(AppError::AdbError("adb shell session closed".to_string()));
+            }
+            if let Some(pos) = line.find(PERSISTENT_SHELL_SENTINEL) {
+                output.push_str(&line[..pos]);
+                let code = line[pos + PERSISTENT_SHELL_SENTINEL.len()..].trim().parse().unwrap_or(-1);
+                return Ok((code, output));
+            }
+            output.push_str(&line);
+        }
+    }
+}
+
+/// Whether an argument can be passed to the device shell verbatim without changing how it is split.
+fn is_plain_shell_arg(arg: &str) -> bool {
+    !arg.is_empty()
+        && arg
+            .bytes()
+            .all(|b| b.is_ascii_alphanumeric() || matches!(b, b'_' | b'-' | b'.'))
+}
+
+/// Runs a short shell command on the device's persistent `adb shell`, spawning it on first use.
+/// Falls back to a one-shot `adb shell` when the session cannot be started, is busy, or its pipe is broken.
+///
+/// On the persistent session the command's stderr is redirected into stdout (`2>&1`), so the
+/// returned text can include error output; the one-shot path returns stdout only on success.
+pub async fn run_adb_shell_persistent(
+    app: &AppHandle,
+    device: &str,
+    command_args: Vec<String>,
+) -> AppResult<String> {
+    let checked_out = {
+        let mut shells = PERSISTENT_SHELLS
+            .lock()
+            .map_err(|e| AppError::StringError(e.to_string()))?;
+        if shells.in_use.insert(device.to_string()) {
+            Some(shells.idle.remove(device))
+        } else {
+            None
+        }
+    };
+    let idle = match checked_out {
+        Some(idle) => idle,
+        // Another command is running on this device's session
+        None => return run_adb_shell_args_internal(app, device, command_args).await,
+    };
+    let _checkout = ShellCheckout { device };
+
+    let mut shell = match idle {
+        Some(shell) => shell,
+        None => match PersistentShell::spawn(app, device).await {
+            Ok(shell) => shell,
+            Err(_) => return run_adb_shell_args_internal(app, device, command_args).await,
+        },
+    };
+
+    if shell.send(&command_args.join(" ")).await.is_err() {
+        // The session died since its last use (device unplugged, adb server restarted)
+        return run_adb_shell_args_internal(app, device, command_args).await;
+    }
+
+    // A failed read may come after the command already ran, so it is reported instead of retried
+    let (code, output) = tokio::time::timeout(PERSISTENT_SHELL_TIMEOUT, shell.read_result())
+        .await
+        .map_err(|_| AppError::AdbError("adb shell command timed out".to_string()))??;
+
+    if let Ok(mut shells) = PERSISTENT_SHELLS.lock() {
+        shells.idle.insert(device.to_string(), shell);
+    }
+
+    let output = output.trim().to_string();
+    if code == 0 {
+        Ok(output)
+    } else if output.is_empty() {
+        Err(AppError::AdbError(format!("Process exited with status code: {}", code)))
+    } else {
+        Err(AppError::AdbError(output))
+    }
+}
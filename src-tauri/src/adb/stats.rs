@@ -59,10 +59,14 @@ pub async fn start_performance_stream(
 
     let app_clone = app.clone();
     let device_clone = device.clone();
+    // The shell script only depends on the package, so build it once per stream
+    // instead of re-formatting it on every tick.
+    let package = package.filter(|pkg| !pkg.is_empty());
+    let script = build_stats_script(package.as_deref());
 
     tokio::spawn(async move {
         while !cancel_flag.load(Ordering::Relaxed) {
-            match get_device_stats_internal(&app_clone, &device_clone, package.clone()).await {
+            match get_device_stats_internal(&app_clone, &device_clone, package.as_deref(), &script).await {
                 Ok(stats) => {
                     let payload = DeviceStatsPayload {
                         device: device_clone.clone(),
@@ -99,23 +103,28 @@ pub async fn get_device_stats(
     device: String,
     package: Option<String>,
 ) -> Result<DeviceStats, String> {
-    get_device_stats_internal(&app, &device, package).await
+    let package = package.filter(|pkg| !pkg.is_empty());
+    let script = build_stats_script(package.as_deref());
+    get_device_stats_internal(&app, &device, package.as_deref(), &script).await
+}
+
+/// Builds the combined stats script. `package` must already be filtered for emptiness.
+fn build_stats_script(package: Option<&str>) -> String {
+    let mut script = String::from("dumpsys battery; echo ___S\"EP\"___; cat /proc/meminfo || dumpsys meminfo; echo ___S\"EP\"___; top -b -n 2 -d 0.5; echo ___S\"EP\"___; dumpsys window displays; echo ___S\"EP\"___; dumpsys power");
+
+    if let Some(pkg) = package {
+        script.push_str(&format!("; echo ___S\"EP\"___; dumpsys meminfo {}; echo ___S\"EP\"___; dumpsys gfxinfo {}; echo ___S\"EP\"___; pidof {}", pkg, pkg, pkg));
+    }
+    script
 }
 
 async fn get_device_stats_internal(
     app: &AppHandle,
     device: &str,
-    package: Option<String>,
+    package: Option<&str>,
+    script: &str,
 ) -> Result<DeviceStats, String> {
-    let mut script = String::from("dumpsys battery; echo ___S\"EP\"___; cat /proc/meminfo || dumpsys meminfo; echo ___S\"EP\"___; top -b -n 2 -d 0.5; echo ___S\"EP\"___; dumpsys window displays; echo ___S\"EP\"___; dumpsys power");
-    
-    if let Some(pkg) = &package {
-        if !pkg.is_empty() {
-            script.push_str(&format!("; echo ___S\"EP\"___; dumpsys meminfo {}; echo ___S\"EP\"___; dumpsys gfxinfo {}; echo ___S\"EP\"___; pidof {}", pkg, pkg, pkg));
-        }
-    }
-
-    let combined_output = run_adb_shell(app, device, &script).await;
+    let combined_output = run_adb_shell(app, device, script).await;
     let parts: Vec<&str> = combined_output.split("___SEP___").collect();
 
     let bat_output = parts.get(0).unwrap_or(&"");
@@ -131,36 +140,34 @@ async fn get_device_stats_internal(
     let screen_state = parse_screen_state(pwr_output);
 
     let mut app_stats = None;
-    if let Some(pkg) = &package {
-        if !pkg.is_empty() {
-            let app_ram_output = parts.get(5).unwrap_or(&"");
-            let app_fps_output = parts.get(6).unwrap_or(&"");
-            let app_pidof_output = parts.get(7).unwrap_or(&"");
-            
-            // Reusing the same string-based parsing functions without async ADB calls
-            let mut app_ram_res = None;
-            for line in app_ram_output.lines() {
-                let trimmed = line.trim();
-                if trimmed.starts_with("TOTAL") || trimmed.starts_with("Total PSS:") {
-                    if let Some(val_str) = trimmed.split_whitespace().nth(1) {
-                        if let Ok(val) = val_str.parse::<u64>() {
-                            app_ram_res = Some(val);
-                            break;
-                        }
+    if let Some(pkg) = package {
+        let app_ram_output = parts.get(5).unwrap_or(&"");
+        let app_fps_output = parts.get(6).unwrap_or(&"");
+        let app_pidof_output = parts.get(7).unwrap_or(&"");
+        
+        // Reusing the same string-based parsing functions without async ADB calls
+        let mut app_ram_res = None;
+        for line in app_ram_output.lines() {
+            let trimmed = line.trim();
+            if trimmed.starts_with("TOTAL") || trimmed.starts_with("Total PSS:") {
+                if let Some(val_str) = trimmed.split_whitespace().nth(1) {
+                    if let Ok(val) = val_str.parse::<u64>() {
+                        app_ram_res = Some(val);
+                        break;
                     }
                 }
             }
+        }
 
-            // Quick extraction of fps
-            let app_fps_res = parse_app_fps_from_string(device, pkg, app_fps_output);
-            let app_cpu_res = parse_app_cpu_from_string(pkg, top_output, app_pidof_output);
+        // Quick extraction of fps
+        let app_fps_res = parse_app_fps_from_string(device, pkg, app_fps_output);
+        let app_cpu_res = parse_app_cpu_from_string(pkg, top_output, app_pidof_output);
 
-            app_stats = Some(AppStats {
-                cpu_usage: app_cpu_res.unwrap_or(0.0),
-                ram_used: app_ram_res.unwrap_or(0),
-                fps: app_fps_res.unwrap_or(0),
-            });
-        }
+        app_stats = Some(AppStats {
+            cpu_usage: app_cpu_res.unwrap_or(0.0),
+            ram_used: app_ram_res.unwrap_or(0),
+            fps: app_fps_res.unwrap_or(0),
+        });
     }
 
     Ok(DeviceStats {
@@ -210,6 +210,9 @@ pub async fn start_appium_server(
                             let _ = f.write_all(format!("{}\n", line).as_bytes()).await;
                         }
                     }
+                    // stdout only closes when the server goes away, so listeners can refresh
+                    // their status now instead of waiting for the next poll
+                    let _ = handle.emit("appium-exited", ());
                 });
             }
             if let Some(err) = stderr {
@@ -70,6 +70,7 @@ macro_rules! generate_robot_runner_handler {
             crate::files::save_image,
             crate::files::resolve_test_path,
             crate::files::fs_exists,
+            crate::files::fs_exists_bounded,
             crate::files::fs_mkdir,
             crate::files::fs_write_text_file,
             crate::files::fs_read_text_file,
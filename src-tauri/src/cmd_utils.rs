@@ -1,23 +1,26 @@
 use tauri::{AppHandle, Manager};
 use crate::adb::AdbState;
+use once_cell::sync::Lazy;
 use regex::Regex;
+use std::time::{Duration, Instant};
 
 #[cfg(target_os = "windows")]
 use std::os::windows::process::CommandExt;
 
+static RE_WIN_VAR: Lazy<Regex> = Lazy::new(|| Regex::new(r"%([^%]+)%").unwrap());
+static RE_UNIX_VAR: Lazy<Regex> = Lazy::new(|| Regex::new(r"\$\{?([a-zA-Z_][a-zA-Z0-9_]*)\}?").unwrap());
+
 /// Expands environment variables in a path string (e.g., %VAR% or $VAR).
 pub fn expand_env_vars(path: &str) -> String {
     let mut expanded = String::from(path);
 
     // Expand Windows-style %VAR%
-    let re_win = Regex::new(r"%([^%]+)%").unwrap();
-    expanded = re_win.replace_all(&expanded, |caps: &regex::Captures| {
+    expanded = RE_WIN_VAR.replace_all(&expanded, |caps: &regex::Captures| {
         std::env::var(&caps[1]).unwrap_or_else(|_| caps[0].to_string())
     }).into_owned();
 
     // Expand Unix-style $VAR or ${VAR}
-    let re_unix = Regex::new(r"\$\{?([a-zA-Z_][a-zA-Z0-9_]*)\}?").unwrap();
-    expanded = re_unix.replace_all(&expanded, |caps: &regex::Captures| {
+    expanded = RE_UNIX_VAR.replace_all(&expanded, |caps: &regex::Captures| {
         std::env::var(&caps[1]).unwrap_or_else(|_| caps[0].to_string())
     }).into_owned();
 
@@ -30,28 +33,44 @@ pub fn expand_env_vars(path: &str) -> String {
     expanded
 }
 
+/// How long a resolved custom ADB path is trusted before the directory check is repeated.
+const ADB_PROGRAM_CACHE_TTL: Duration = Duration::from_secs(5);
+
 /// Gets the current ADB program name or path from state.
 pub fn get_adb_program(app: &AppHandle) -> String {
     let state = app.state::<AdbState>();
     let custom_path = state.custom_path.lock().unwrap();
     if let Some(path) = &*custom_path {
-        let expanded_path = expand_env_vars(path);
-        let path_path = std::path::Path::new(&expanded_path);
-        if path_path.is_dir() {
-            #[cfg(target_os = "windows")]
-            {
-                return path_path.join("adb.exe").to_string_lossy().to_string();
-            }
-            #[cfg(not(target_os = "windows"))]
-            {
-                return path_path.join("adb").to_string_lossy().to_string();
+        let mut resolved = state.resolved_program.lock().unwrap();
+        if let Some((raw, program, at)) = &*resolved {
+            if raw == path && at.elapsed() < ADB_PROGRAM_CACHE_TTL {
+                return program.clone();
             }
         }
-        return expanded_path;
+        let program = resolve_adb_program(path);
+        *resolved = Some((path.clone(), program.clone(), Instant::now()));
+        return program;
     }
     "adb".to_string()
 }
 
+/// Expands a user-configured ADB path, accepting either the binary itself or its directory.
+fn resolve_adb_program(path: &str) -> String {
+    let expanded_path = expand_env_vars(path);
+    let path_path = std::path::Path::new(&expanded_path);
+    if path_path.is_dir() {
+        #[cfg(target_os = "windows")]
+        {
+            return path_path.join("adb.exe").to_string_lossy().to_string();
+        }
+        #[cfg(not(target_os = "windows"))]
+        {
+            return path_path.join("adb").to_string_lossy().to_string();
+        }
+    }
+    expanded_path
+}
+
 /// Creates a new synchronous std::process::Command with suppression of console windows on Windows.
 pub fn new_std_command(program: &str) -> std::process::Command {
     let mut cmd = std::process::Command::new(program);
@@ -72,6 +91,23 @@ pub fn new_tokio_command(program: &str) -> tokio::process::Command {
     cmd
 }
 
+/// Pipe capacity requested for high-volume child output (logcat, test runs).
+#[cfg(any(target_os = "linux", target_os = "android"))]
+const CHILD_PIPE_CAPACITY: libc::c_int = 1 << 20;
+
+/// Enlarges a child's output pipe so bursts of output do not block the producer while the reader
+/// catches up. Only Linux lets the pipe be resized; elsewhere the OS default is kept.
+#[cfg(any(target_os = "linux", target_os = "android"))]
+pub fn grow_pipe_buffer(pipe: &impl std::os::unix::io::AsRawFd) {
+    // Best effort: unprivileged processes are capped at /proc/sys/fs/pipe-max-size
+    unsafe {
+        libc::fcntl(pipe.as_raw_fd(), libc::F_SETPIPE_SZ, CHILD_PIPE_CAPACITY);
+    }
+}
+
+#[cfg(not(any(target_os = "linux", target_os = "android")))]
+pub fn grow_pipe_buffer<T>(_pipe: &T) {}
+
 /// Formats an adb process failure output, falling back to stdout and then exit code if stderr is empty.
 pub fn format_adb_error(output: &std::process::Output) -> String {
     let stderr = String::from_utf8_lossy(&output.stderr).trim().to_string();
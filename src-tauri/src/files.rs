@@ -277,6 +277,18 @@ pub fn fs_exists(path: String) -> bool {
     std::path::Path::new(&expand_env_vars(&path)).exists()
 }
 
+/// How long `fs_exists_bounded` waits before treating a path as missing.
+const FS_EXISTS_TIMEOUT: std::time::Duration = std::time::Duration::from_millis(500);
+
+/// Existence check that cannot stall the app: the stat runs on the blocking pool and a path that
+/// does not answer in time (e.g. a disconnected network share) is reported as missing.
+#[command]
+pub async fn fs_exists_bounded(path: String) -> bool {
+    let expanded = expand_env_vars(&path);
+    let check = tokio::task::spawn_blocking(move || std::path::Path::new(&expanded).exists());
+    matches!(tokio::time::timeout(FS_EXISTS_TIMEOUT, check).await, Ok(Ok(true)))
+}
+
 #[command]
 pub fn fs_mkdir(path: String) -> AppResult<()> {
     std::fs::create_dir_all(&expand_env_vars(&path)).map_err(|e| AppError::FileSystemError(e.to_string()))
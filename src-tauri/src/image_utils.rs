@@ -3,6 +3,9 @@ use std::io::Cursor;
 use base64::{engine::general_purpose, Engine as _};
 use crate::errors::{AppError, AppResult};
 
+/// Downscale factor from which `thumbnail` is used instead of a filtered resize.
+const THUMBNAIL_MIN_FACTOR: u32 = 2;
+
 pub fn compress_and_resize_image(
     image_bytes: Vec<u8>,
     max_width: u32,
@@ -26,8 +29,17 @@ pub fn compress_and_resize_image(
         (width, height)
     };
 
-    // Resize image
-    let resized = img.resize(new_width, new_height, image::imageops::FilterType::Lanczos3);
+    // Resize image. Bilinear is several times cheaper than Lanczos on a full-resolution
+    // screenshot and the difference is not visible once it is JPEG-encoded at this size.
+    // For a reduction of 2x or more (a phone screenshot into the inspector viewport), the
+    // box-averaging thumbnail path is cheaper still and just as smooth.
+    let resized = if (new_width, new_height) == (width, height) {
+        img
+    } else if width >= new_width * THUMBNAIL_MIN_FACTOR && height >= new_height * THUMBNAIL_MIN_FACTOR {
+        img.thumbnail(new_width, new_height)
+    } else {
+        img.resize(new_width, new_height, image::imageops::FilterType::Triangle)
+    };
 
     // Encode to JPEG with specified quality
     let mut cursor = Cursor::new(Vec::new());
@@ -1,6 +1,7 @@
 use crate::cmd_utils::{new_tokio_command, get_adb_program};
 use base64::{engine::general_purpose, Engine as _};
 use tauri::{command, Manager, AppHandle};
+use std::collections::HashMap;
 use std::sync::Mutex;
 use once_cell::sync::Lazy;
 
@@ -48,7 +49,20 @@ fn normalize_url(url: &str) -> String {
     u
 }
 
+/// Resolved script locations by name. Web captures run on every inspector refresh, and the
+/// bundled scripts never move while the app runs, so the candidate joins and stats happen once.
+static SCRIPT_PATHS: Lazy<Mutex<HashMap<String, std::path::PathBuf>>> = Lazy::new(|| Mutex::new(HashMap::new()));
+
 fn find_script(name: &str, app_handle: Option<&tauri::AppHandle>) -> Result<std::path::PathBuf, String> {
+    if let Some(path) = SCRIPT_PATHS.lock().unwrap().get(name) {
+        return Ok(path.clone());
+    }
+    let path = locate_script(name, app_handle)?;
+    SCRIPT_PATHS.lock().unwrap().insert(name.to_string(), path.clone());
+    Ok(path)
+}
+
+fn locate_script(name: &str, app_handle: Option<&tauri::AppHandle>) -> Result<std::path::PathBuf, String> {
     if let Some(handle) = app_handle {
         if let Ok(resource_dir) = handle.path().resource_dir() {
             let resource_candidate = resource_dir.join("scripts").join(name);
@@ -146,11 +160,28 @@ async fn perform_web_capture(url: &str, browser: &str, app_handle: Option<&tauri
     Ok((screenshot, xml))
 }
 
+/// Leading bytes of every PNG file, used to tell a streamed screenshot from an error message.
+const PNG_SIGNATURE: &[u8] = b"\x89PNG\r\n\x1a\n";
 
 async fn fallback_screencap(app_handle: &AppHandle, device_id: &str) -> Result<Vec<u8>, String> {
     let adb_program = get_adb_program(app_handle);
     let remote_path = "/data/local/tmp/screencap_fallback.png";
-    
+
+    // Some builds cannot stream screencap to stdout but can still stream a file, so write it on the
+    // device and cat it back over exec-out in one round trip before resorting to pull
+    let mut cmd_cat = new_tokio_command(&adb_program);
+    cmd_cat.args(&[
+        "-s",
+        device_id,
+        "exec-out",
+        &format!("screencap -p {0} && cat {0}; rm -f {0}", remote_path),
+    ]);
+    if let Ok(output) = cmd_cat.output().await {
+        if output.status.success() && output.stdout.starts_with(PNG_SIGNATURE) {
+            return Ok(output.stdout);
+        }
+    }
+
     let mut cmd_cap = new_tokio_command(&adb_program);
     cmd_cap.args(&["-s", device_id, "shell", "screencap", "-p", remote_path]);
     let output_cap = cmd_cap.output().await
@@ -288,15 +319,13 @@ pub async fn get_xml_dump(app_handle: AppHandle, device_id: String, web_url: Opt
         match cmd.output().await {
             Ok(output) => {
                 if output.status.success() {
-                    let raw_output = String::from_utf8_lossy(&output.stdout).to_string();
-                    let xml_content = if let Some(start) = raw_output.find('<') {
-                        raw_output[start..].to_string()
-                    } else {
-                        raw_output
-                    };
+                    // Trim any shell noise before the document and validate on the raw bytes, so
+                    // the (often multi-MB) dump is decoded into a String exactly once
+                    let start = output.stdout.iter().position(|&b| b == b'<').unwrap_or(0);
+                    let xml_bytes = &output.stdout[start..];
                     // Basic validation that it's XML and contains hierarchy
-                    if xml_content.contains("hierarchy") {
-                        return Ok(xml_content);
+                    if xml_bytes.windows(b"hierarchy".len()).any(|w| w == b"hierarchy") {
+                        return Ok(String::from_utf8_lossy(xml_bytes).into_owned());
                     }
                 }
                 
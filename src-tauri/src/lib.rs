@@ -8,7 +8,6 @@ mod db;
 pub mod errors;
 mod inspector;
 mod logs;
-mod monitor;
 mod ngrok;
 mod runner;
 mod system;
@@ -77,10 +76,6 @@ pub fn run() {
         .manage(adb::dmesg::DmesgState(Mutex::new(HashMap::new())))
         .manage(adb::stats::PerformanceState(Mutex::new(HashMap::new())))
         .manage(system::WakelockState(std::sync::Mutex::new(None)))
-        .setup(|app| {
-            monitor::start_heartbeat_monitor(app.handle().clone());
-            Ok(())
-        })
         .invoke_handler(generate_robot_runner_handler![])
         .build(tauri::generate_context!())
         .expect("error while building tauri application")
@@ -144,8 +144,10 @@ fn get_test_history_blocking(
 
     use rayon::prelude::*;
 
-    // Parallel processing with Rayon (uses lazy regexes — no redundant compilation)
-    let processed_logs: Vec<TestLog> = xml_files
+    // Parallel processing with Rayon (uses lazy regexes — no redundant compilation).
+    // Each entry records whether it was served from the cache, so the cache-staleness check
+    // below falls out of the parallel pass instead of needing a second serial walk.
+    let processed_logs: Vec<(TestLog, bool)> = xml_files
         .into_par_iter()
         .filter_map(|xml_path| {
             let xml_path_str = xml_path.to_string_lossy().to_string();
@@ -165,34 +167,19 @@ fn get_test_history_blocking(
                 let normalized_path = normalize_path_str(&xml_path_str);
                 if let Some(cached_log) = cache_map.get(&normalized_path) {
                     if cached_log.mtime == current_mtime {
-                        return Some(cached_log.clone());
+                        return Some((cached_log.clone(), true));
                     }
                 }
             }
 
-            parse_log_entry(parent, &xml_path, current_mtime)
+            parse_log_entry(parent, &xml_path, current_mtime).map(|log| (log, false))
         })
         .collect();
 
-    let mut logs: Vec<TestLog> = processed_logs;
-
-    // Check if cache needs updating
-    let mut changed = false;
-    if logs.len() != cache_map.len() {
-        changed = true;
-    } else {
-        for log in &logs {
-            if let Some(cached) = cache_map.get(&normalize_path_str(&log.xml_path)) {
-                if cached.mtime != log.mtime {
-                    changed = true;
-                    break;
-                }
-            } else {
-                changed = true;
-                break;
-            }
-        }
-    }
+    // The cache is stale if any entry had to be parsed or if entries disappeared
+    let changed = processed_logs.len() != cache_map.len()
+        || processed_logs.iter().any(|(_, from_cache)| !from_cache);
+    let mut logs: Vec<TestLog> = processed_logs.into_iter().map(|(log, _)| log).collect();
 
     // Sort by timestamp desc
     logs.sort_by(|a, b| b.timestamp.cmp(&a.timestamp));
@@ -353,10 +340,14 @@ fn parse_log_entry(folder_path: &Path, xml_path: &Path, mtime: u64) -> Option<Te
             }
         }
 
-        let log_html_path = abs_folder_path
-            .join("log.html")
-            .to_string_lossy()
-            .to_string();
+        // Runs with `--log NONE`, or whose log was deleted, have no log.html; an empty path keeps
+        // the history view from offering to open a file that isn't there
+        let log_html = abs_folder_path.join("log.html");
+        let log_html_path = if log_html.is_file() {
+            log_html.to_string_lossy().to_string()
+        } else {
+            String::new()
+        };
 
         let mut failed_tests = Vec::new();
         if fail > 0 {
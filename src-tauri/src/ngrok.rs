@@ -7,6 +7,14 @@ use tokio::io::{AsyncBufReadExt, BufReader as TokioBufReader};
 // Wrapper for Tauri State management
 pub struct NgrokState(pub Mutex<Option<u32>>);
 
+/// Sends SIGTERM to the tracked ngrok process directly rather than spawning `kill` for it.
+#[cfg(not(target_os = "windows"))]
+fn terminate_pid(pid: u32) {
+    unsafe {
+        libc::kill(pid as i32, libc::SIGTERM);
+    }
+}
+
 #[command]
 pub async fn start_ngrok(
     state: State<'_, NgrokState>,
@@ -40,10 +48,7 @@ pub async fn start_ngrok(
         }
         #[cfg(not(target_os = "windows"))]
         {
-            let _ = new_tokio_command("kill")
-                .arg(pid.to_string())
-                .output()
-                .await;
+            terminate_pid(pid);
         }
     }
 
@@ -136,7 +141,7 @@ pub async fn stop_ngrok(state: State<'_, NgrokState>) -> Result<(), String> {
         }
         #[cfg(not(target_os = "windows"))]
         {
-            let _ = new_tokio_command("kill").arg(p.to_string()).output().await;
+            terminate_pid(p);
         }
     }
 
@@ -167,7 +172,7 @@ pub fn shutdown_ngrok(state: &State<'_, NgrokState>) {
             }
             #[cfg(not(target_os = "windows"))]
             {
-                let _ = new_std_command("kill").arg(pid.to_string()).output();
+                terminate_pid(pid);
             }
         }
     }
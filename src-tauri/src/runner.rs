@@ -3,6 +3,7 @@ use serde::Serialize;
 use std::collections::HashMap;
 use std::process::Stdio;
 use std::sync::{Arc, Mutex};
+use std::time::Duration;
 use tauri::{AppHandle, Emitter, State};
 use tokio::io::AsyncBufReadExt;
 use tokio::process::{Child, Command};
@@ -18,7 +19,7 @@ pub struct ProcessInfo {
 
 pub struct TestState(pub Arc<Mutex<HashMap<String, ProcessInfo>>>);
 
-use crate::cmd_utils::{new_std_command, new_tokio_command, get_adb_program};
+use crate::cmd_utils::{grow_pipe_buffer, new_std_command, new_tokio_command, get_adb_program};
 use crate::errors::{AppError, AppResult};
 
 /// Sends a graceful stop signal to a process.
@@ -115,7 +116,60 @@ pub fn shutdown_all_tests(state: &State<'_, TestState>) {
 #[derive(serde::Serialize, Clone)]
 struct TestOutput {
     run_id: String,
-    message: String,
+    lines: Vec<String>,
+}
+
+/// Maximum number of output lines sent in a single `test-output` event.
+const OUTPUT_BATCH_LINES: usize = 50;
+/// How long a partial batch may wait before it is flushed to the frontend.
+const OUTPUT_BATCH_INTERVAL: Duration = Duration::from_millis(100);
+/// Read buffer for a test's stdout/stderr pipe; verbose suites write long bursts of output.
+const OUTPUT_READ_BUFFER: usize = 64 * 1024;
+/// Upper bound on waiting for the output readers after the process exits, in case a
+/// detached grandchild (e.g. an adb server) keeps the pipe open.
+const OUTPUT_DRAIN_TIMEOUT: Duration = Duration::from_secs(2);
+
+/// Streams a child's output to the frontend as `test-output` events, batching lines so a
+/// chatty test doesn't cost one IPC message per line.
+async fn forward_output<R>(app: AppHandle, run_id: String, stream: R)
+where
+    R: tokio::io::AsyncRead + Unpin,
+{
+    let mut reader = tokio::io::BufReader::with_capacity(OUTPUT_READ_BUFFER, stream);
+    // Kept across select! iterations: a read interrupted by the flush tick resumes into it
+    let mut raw_line = Vec::new();
+    let mut batch: Vec<String> = Vec::new();
+    let mut flush = tokio::time::interval(OUTPUT_BATCH_INTERVAL);
+    flush.set_missed_tick_behavior(tokio::time::MissedTickBehavior::Delay);
+
+    loop {
+        tokio::select! {
+            read = reader.read_until(b'\n', &mut raw_line) => match read {
+                Ok(n) if n > 0 => {
+                    // Robot and library output is not always UTF-8 (e.g. cp1252 consoles on Windows);
+                    // decode lossily so one stray byte does not end the stream
+                    let line = String::from_utf8_lossy(&raw_line)
+                        .trim_end_matches(['\r', '\n'])
+                        .to_string();
+                    raw_line.clear();
+                    batch.push(line);
+                    if batch.len() >= OUTPUT_BATCH_LINES {
+                        let lines = std::mem::take(&mut batch);
+                        let _ = app.emit("test-output", TestOutput { run_id: run_id.clone(), lines });
+                    }
+                }
+                _ => break,
+            },
+            _ = flush.tick(), if !batch.is_empty() => {
+                let lines = std::mem::take(&mut batch);
+                let _ = app.emit("test-output", TestOutput { run_id: run_id.clone(), lines });
+            }
+        }
+    }
+
+    if !batch.is_empty() {
+        let _ = app.emit("test-output", TestOutput { run_id, lines: batch });
+    }
 }
 
 #[derive(serde::Serialize, Clone)]
@@ -124,50 +178,9 @@ struct TestFinished {
     exit_code: i32,
 }
 
-#[tauri::command]
-pub async fn run_robot_test(
-    app: AppHandle,
-    state: State<'_, TestState>,
-    run_id: String,
-    test_path: Option<String>,
-    output_dir: String,
-    logs_path: Option<String>,
-    device: Option<String>,
-    device_model: Option<String>,
-    android_version: Option<String>,
-    working_dir: Option<String>,
-    selected_tests: Option<Vec<String>>,
-    arguments_file: Option<String>,
-    timestamp_outputs: Option<bool>,
-    rerun_failed_from: Option<String>,
-) -> AppResult<String> {
-    let output_dir = crate::cmd_utils::expand_env_vars(&output_dir);
-    let test_path = test_path.map(|p| crate::cmd_utils::expand_env_vars(&p));
-    let logs_path = logs_path.map(|p| crate::cmd_utils::expand_env_vars(&p));
-    let working_dir = working_dir.map(|p| crate::cmd_utils::expand_env_vars(&p));
-    let arguments_file = arguments_file.map(|p| crate::cmd_utils::expand_env_vars(&p));
-    let rerun_failed_from = rerun_failed_from.map(|p| crate::cmd_utils::expand_env_vars(&p));
-
-    let abs_output_dir = std::fs::canonicalize(&output_dir)
-        .map(|p| {
-            let s = p.to_string_lossy().to_string();
-            if s.starts_with(r"\\?\") {
-                s[4..].to_string()
-            } else {
-                s
-            }
-        })
-        .unwrap_or_else(|_| output_dir.clone());
-
-    let stop_file_init = std::path::Path::new(&abs_output_dir).join("stop.flag");
-    if stop_file_init.exists() {
-        let _ = std::fs::remove_file(stop_file_init);
-    }
-
-    let mut args: Vec<String> = vec!["-d".to_string(), abs_output_dir.clone(), "--console".to_string(), "verbose".to_string()];
-
-    let listener_path = std::path::Path::new(&abs_output_dir).join("LiveConsoleListener.py");
-    let listener_code = r#"
+/// Robot listener written next to each run's output; it streams suite/test markers to stdout
+/// and interrupts the run when `stop.flag` appears.
+const LIVE_CONSOLE_LISTENER: &str = r#"
 import sys
 import os
 import threading
@@ -220,8 +233,55 @@ def _monitor_stop():
 t = threading.Thread(target=_monitor_stop, daemon=True)
 t.start()
 "#;
+
+#[tauri::command]
+pub async fn run_robot_test(
+    app: AppHandle,
+    state: State<'_, TestState>,
+    run_id: String,
+    test_path: Option<String>,
+    output_dir: String,
+    logs_path: Option<String>,
+    device: Option<String>,
+    device_model: Option<String>,
+    android_version: Option<String>,
+    working_dir: Option<String>,
+    selected_tests: Option<Vec<String>>,
+    arguments_file: Option<String>,
+    timestamp_outputs: Option<bool>,
+    rerun_failed_from: Option<String>,
+) -> AppResult<String> {
+    let output_dir = crate::cmd_utils::expand_env_vars(&output_dir);
+    let test_path = test_path.map(|p| crate::cmd_utils::expand_env_vars(&p));
+    let logs_path = logs_path.map(|p| crate::cmd_utils::expand_env_vars(&p));
+    let working_dir = working_dir.map(|p| crate::cmd_utils::expand_env_vars(&p));
+    let arguments_file = arguments_file.map(|p| crate::cmd_utils::expand_env_vars(&p));
+    let rerun_failed_from = rerun_failed_from.map(|p| crate::cmd_utils::expand_env_vars(&p));
+
+    let abs_output_dir = std::fs::canonicalize(&output_dir)
+        .map(|p| {
+            let s = p.to_string_lossy().to_string();
+            if s.starts_with(r"\\?\") {
+                s[4..].to_string()
+            } else {
+                s
+            }
+        })
+        .unwrap_or_else(|_| output_dir.clone());
+
+    let stop_file_init = std::path::Path::new(&abs_output_dir).join("stop.flag");
+    if stop_file_init.exists() {
+        let _ = std::fs::remove_file(stop_file_init);
+    }
+
+    let mut args: Vec<String> = vec!["-d".to_string(), abs_output_dir.clone(), "--console".to_string(), "verbose".to_string()];
+
+    let listener_path = std::path::Path::new(&abs_output_dir).join("LiveConsoleListener.py");
     std::fs::create_dir_all(&abs_output_dir).map_err(|e| AppError::IoError(format!("Failed to create output directory: {}", e)))?;
-    std::fs::write(&listener_path, listener_code).map_err(|e| AppError::IoError(format!("Failed to write listener file: {}", e)))?;
+    // Repeat runs share an output folder, so the listener is only rewritten when it differs
+    if std::fs::read_to_string(&listener_path).map_or(true, |existing| existing != LIVE_CONSOLE_LISTENER) {
+        std::fs::write(&listener_path, LIVE_CONSOLE_LISTENER).map_err(|e| AppError::IoError(format!("Failed to write listener file: {}", e)))?;
+    }
 
     args.push("--listener".to_string());
     args.push(listener_path.to_string_lossy().to_string());
@@ -558,24 +618,11 @@ async fn spawn_and_monitor(
 
     let stdout = child.stdout.take().unwrap();
     let stderr = child.stderr.take().unwrap();
+    grow_pipe_buffer(&stdout);
+    grow_pipe_buffer(&stderr);
 
-    let app_handle = app.clone();
-    let rid = run_id.clone();
-    tokio::spawn(async move {
-        let mut reader = tokio::io::BufReader::new(stdout).lines();
-        while let Ok(Some(line)) = reader.next_line().await {
-            let _ = app_handle.emit("test-output", TestOutput { run_id: rid.clone(), message: line });
-        }
-    });
-
-    let app_handle_err = app.clone();
-    let rid_err = run_id.clone();
-    tokio::spawn(async move {
-        let mut reader = tokio::io::BufReader::new(stderr).lines();
-        while let Ok(Some(line)) = reader.next_line().await {
-            let _ = app_handle_err.emit("test-output", TestOutput { run_id: rid_err.clone(), message: line });
-        }
-    });
+    let stdout_task = tokio::spawn(forward_output(app.clone(), run_id.clone(), stdout));
+    let stderr_task = tokio::spawn(forward_output(app.clone(), run_id.clone(), stderr));
 
     let (control_tx, mut control_rx) = tokio::sync::mpsc::channel::<ProcessCommand>(10);
     {
@@ -618,6 +665,12 @@ async fn spawn_and_monitor(
         if let Ok(mut procs) = state_mon.lock() {
             procs.remove(&rid_mon);
         }
+        // Let the readers flush their last batch so the finish event arrives after all output
+        let _ = tokio::time::timeout(OUTPUT_DRAIN_TIMEOUT, async {
+            let _ = stdout_task.await;
+            let _ = stderr_task.await;
+        })
+        .await;
         let exit_code = final_status.and_then(|s| s.code()).unwrap_or(-1);
         let _ = app_handle_mon.emit("test-finished", TestFinished { run_id: rid_mon, exit_code });
     });
@@ -717,6 +770,29 @@ pub async fn run_cypress_test(
     spawn_and_monitor(app, state, run_id, cmd, working_dir, abs_output_dir).await
 }
 
+/// Command for a script interpreter found on PATH. On Windows it is spawned directly only when it
+/// resolves to an `.exe`; interpreters installed as `.bat`/`.cmd` shims (pyenv-win, nvm-windows,
+/// nodist) or not resolvable here are left to cmd.exe, which applies PATHEXT.
+fn interpreter_command(name: &str) -> Command {
+    #[cfg(target_os = "windows")]
+    {
+        match which::which(name) {
+            Ok(path) if path.extension().map_or(false, |ext| ext.eq_ignore_ascii_case("exe")) => {
+                new_tokio_command(&path.to_string_lossy())
+            }
+            _ => {
+                let mut cmd = new_tokio_command("cmd");
+                cmd.arg("/C").arg(name);
+                cmd
+            }
+        }
+    }
+    #[cfg(not(target_os = "windows"))]
+    {
+        new_tokio_command(name)
+    }
+}
+
 #[tauri::command]
 pub async fn run_selenium_test(
     app: AppHandle,
@@ -767,16 +843,14 @@ pub async fn run_selenium_test(
     let is_python = test_path.ends_with(".py");
     let is_js = test_path.ends_with(".js") || test_path.ends_with(".ts");
 
+    // python and node are started directly when they resolve to real executables; shims and
+    // scripts that Windows cannot execute on its own still go through cmd.exe
     if is_python {
-        #[cfg(target_os = "windows")]
-        { cmd = new_tokio_command("cmd"); cmd.arg("/C").arg("python").arg(&test_path); }
-        #[cfg(not(target_os = "windows"))]
-        { cmd = new_tokio_command("python"); cmd.arg(&test_path); }
+        cmd = interpreter_command("python");
+        cmd.arg(&test_path);
     } else if is_js {
-        #[cfg(target_os = "windows")]
-        { cmd = new_tokio_command("cmd"); cmd.arg("/C").arg("node").arg(&test_path); }
-        #[cfg(not(target_os = "windows"))]
-        { cmd = new_tokio_command("node"); cmd.arg(&test_path); }
+        cmd = interpreter_command("node");
+        cmd.arg(&test_path);
     } else {
         #[cfg(target_os = "windows")]
         { cmd = new_tokio_command("cmd"); cmd.arg("/C").arg(&test_path); }
@@ -2,8 +2,11 @@ use crate::cmd_utils::{new_tokio_command, get_adb_program};
 use crate::errors::{AppError, AppResult};
 use nosleep::{NoSleep, NoSleepType};
 use regex::Regex;
+use once_cell::sync::Lazy;
 use serde::Serialize;
+use std::collections::HashMap;
 use std::sync::Mutex;
+use std::time::{Duration, Instant};
 use tauri::{command, State, AppHandle};
 use walkdir::WalkDir;
 
@@ -155,14 +158,45 @@ pub async fn get_system_versions(
     versions
 }
 
+/// Successful version probes, keyed by command line. Tool versions rarely change within a
+/// session, but the system check runs on startup, on framework switches and from several
+/// refresh buttons, each spawning up to 14 processes (some of them slow JVM/Node starts).
+static VERSION_CACHE: Lazy<Mutex<HashMap<String, (String, Instant)>>> = Lazy::new(|| Mutex::new(HashMap::new()));
+const VERSION_CACHE_TTL: Duration = Duration::from_secs(600);
+
 async fn get_version(cmd_name: &str, args: &[&str]) -> String {
+    let key = format!("{} {}", cmd_name, args.join(" "));
+    if let Ok(cache) = VERSION_CACHE.lock() {
+        if let Some((output, at)) = cache.get(&key) {
+            if at.elapsed() < VERSION_CACHE_TTL {
+                return output.clone();
+            }
+        }
+    }
+
+    let (output, cacheable) = probe_version(cmd_name, args).await;
+    // Only remember tools that were actually found, so installing a missing one is picked up
+    // by the next check
+    if cacheable && !output.trim().is_empty() {
+        if let Ok(mut cache) = VERSION_CACHE.lock() {
+            cache.insert(key, (output.clone(), Instant::now()));
+        }
+    }
+    output
+}
+
+/// Runs the version command. The flag tells whether the command exited successfully, i.e.
+/// whether the output is worth caching. That covers the binary spawned directly and, on
+/// Windows, the `cmd /C` fallback used for script shims (e.g. `npm.cmd`) that cannot be
+/// spawned on their own.
+async fn probe_version(cmd_name: &str, args: &[&str]) -> (String, bool) {
     let mut cmd = new_tokio_command(cmd_name);
     cmd.args(args);
     match cmd.output().await {
         Ok(o) => {
             let stdout = String::from_utf8_lossy(&o.stdout).to_string();
             let stderr = String::from_utf8_lossy(&o.stderr).to_string();
-            if stdout.is_empty() { stderr } else { stdout }
+            (if stdout.is_empty() { stderr } else { stdout }, o.status.success())
         }
         Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
             #[cfg(target_os = "windows")]
@@ -175,17 +209,17 @@ async fn get_version(cmd_name: &str, args: &[&str]) -> String {
                 if let Ok(o) = cmd_fallback.output().await {
                     let stdout = String::from_utf8_lossy(&o.stdout).to_string();
                     let stderr = String::from_utf8_lossy(&o.stderr).to_string();
-                    if stdout.is_empty() { stderr } else { stdout }
+                    (if stdout.is_empty() { stderr } else { stdout }, o.status.success())
                 } else {
-                    String::new()
+                    (String::new(), false)
                 }
             }
             #[cfg(not(target_os = "windows"))]
             {
-                String::new()
+                (String::new(), false)
             }
         }
-        Err(_) => String::new(),
+        Err(_) => (String::new(), false),
     }
 }
 
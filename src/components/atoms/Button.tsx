@@ -16,6 +16,36 @@ export interface ButtonProps extends HTMLMotionProps<"button"> {
     tooltipPosition?: 'top' | 'bottom' | 'left' | 'right';
 }
 
+// Style tables are shared by every Button instance instead of being rebuilt on each render
+const VARIANTS: Record<NonNullable<ButtonProps['variant']>, string> = {
+    primary: 'bg-primary text-on-primary shadow-sm border border-transparent',
+    secondary: 'bg-surface text-on-surface/80 border border-outline-variant/30 hover:bg-surface-variant/50 shadow-sm',
+    outline: 'bg-transparent border border-outline-variant/30 text-on-surface/80 hover:bg-surface-variant/30',
+    ghost: 'bg-transparent text-on-surface-variant/80 hover:bg-surface-variant/30 hover:text-on-surface/80',
+    danger: 'bg-error text-on-error shadow-sm border border-transparent',
+    warning: 'bg-warning text-on-warning shadow-sm border border-transparent',
+    success: 'bg-success text-on-success shadow-sm border border-transparent',
+    link: 'bg-transparent text-primary hover:underline shadow-none',
+    unstyled: 'bg-transparent shadow-none p-0 h-auto',
+};
+
+const SIZES: Record<NonNullable<ButtonProps['size']>, string> = {
+    sm: 'h-8 px-3 text-xs',
+    md: 'h-9 px-4 text-sm',
+    lg: 'h-11 px-8 text-base',
+    icon: 'h-9 w-9 p-0',
+};
+
+const NO_HOVER_EFFECT_VARIANTS = ['link', 'unstyled'];
+const SOLID_VARIANTS = ['primary', 'danger', 'warning', 'success'];
+
+const TRANSITION = { type: "spring", stiffness: 400, damping: 17 } as const;
+// Gesture targets are shared too, so a re-render (e.g. a loading or disabled toggle on a
+// toolbar) hands framer-motion the same objects instead of fresh ones to diff
+const HOVER_SOLID = { scale: 1.02, filter: "brightness(1.1)" };
+const HOVER_PLAIN = { scale: 1.02, filter: "brightness(1)" };
+const TAP = { scale: 0.95 };
+
 export const Button = forwardRef<HTMLButtonElement, ButtonProps>(({
     className,
     variant = 'primary',
@@ -29,46 +59,22 @@ export const Button = forwardRef<HTMLButtonElement, ButtonProps>(({
     tooltipPosition = 'top',
     ...props
 }, ref) => {
-    const variants = {
-        primary: 'bg-primary text-on-primary shadow-sm border border-transparent',
-        secondary: 'bg-surface text-on-surface/80 border border-outline-variant/30 hover:bg-surface-variant/50 shadow-sm',
-        outline: 'bg-transparent border border-outline-variant/30 text-on-surface/80 hover:bg-surface-variant/30',
-        ghost: 'bg-transparent text-on-surface-variant/80 hover:bg-surface-variant/30 hover:text-on-surface/80',
-        danger: 'bg-error text-on-error shadow-sm border border-transparent',
-        warning: 'bg-warning text-on-warning shadow-sm border border-transparent',
-        success: 'bg-success text-on-success shadow-sm border border-transparent',
-        link: 'bg-transparent text-primary hover:underline shadow-none',
-        unstyled: 'bg-transparent shadow-none p-0 h-auto',
-    };
-
-    const sizes = {
-        sm: 'h-8 px-3 text-xs',
-        md: 'h-9 px-4 text-sm',
-        lg: 'h-11 px-8 text-base',
-        icon: 'h-9 w-9 p-0',
-    };
-
-    const noHoverEffectVariants = ['link', 'unstyled'];
-    const solidVariants = ['primary', 'danger', 'warning', 'success'];
-
-    const hoverProps = (!disabled && !isLoading && !noHoverEffectVariants.includes(variant))
-        ? { scale: 1.02, filter: solidVariants.includes(variant) ? "brightness(1.1)" : "brightness(1)" }
-        : undefined;
-
-    const tapProps = (!disabled && !isLoading && !noHoverEffectVariants.includes(variant))
-        ? { scale: 0.95 }
+    const interactive = !disabled && !isLoading && !NO_HOVER_EFFECT_VARIANTS.includes(variant);
+    const hoverProps = interactive
+        ? (SOLID_VARIANTS.includes(variant) ? HOVER_SOLID : HOVER_PLAIN)
         : undefined;
+    const tapProps = interactive ? TAP : undefined;
 
     return (
         <motion.button
             ref={ref}
             whileHover={hoverProps}
             whileTap={tapProps}
-            transition={{ type: "spring", stiffness: 400, damping: 17 }}
+            transition={TRANSITION}
             className={twMerge(
                 'inline-flex items-center justify-center rounded-2xl font-medium transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-primary disabled:pointer-events-none disabled:opacity-50 select-none cursor-pointer',
-                variants[variant],
-                sizes[size],
+                VARIANTS[variant],
+                SIZES[size],
                 className
             )}
             disabled={disabled || isLoading}
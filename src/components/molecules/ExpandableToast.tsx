@@ -27,9 +27,11 @@ export function ExpandableToast({ type, title, details, onClose }: ExpandableToa
                 // regras globais do sonner atropelem a nossa altura dinâmica no hover.
                 li.style.setProperty('height', 'auto', 'important');
                 
-                // Em algumas versões do sonner, redefinir a variável ajuda na transição de empilhamento
-                li.style.setProperty('--initial-height', `${containerRef.current.offsetHeight}px`);
-                li.style.setProperty('--toast-height', `${containerRef.current.offsetHeight}px`);
+                // Em algumas versões do sonner, redefinir a variável ajuda na transição de empilhamento.
+                // Lê a altura uma única vez: cada leitura após um setProperty força um novo layout.
+                const height = `${containerRef.current.offsetHeight}px`;
+                li.style.setProperty('--initial-height', height);
+                li.style.setProperty('--toast-height', height);
             }
         }
     }, [expanded, details]);
@@ -1,4 +1,4 @@
-import React, { useState, useMemo, useEffect, useRef } from 'react';
+import React, { useState, useMemo, useEffect, useRef, useCallback } from 'react';
 import {
     ChevronRight, ChevronDown, CheckCircle2, AlertCircle,
     Brain, MousePointerClick, SearchCode, Bug, RefreshCw, Info, Sparkles,
@@ -21,10 +21,29 @@ interface ExplorationLogTreeProps {
     logs: LogEntry[];
 }
 
+/**
+ * Fixed captions used by every step and entry; resolved once per language instead of per row.
+ */
+interface LogTreeLabels {
+    running: string;
+    pass: string;
+    fail: string;
+    ai: string;
+    rationale: string;
+    action: string;
+    error: string;
+    finished: string;
+    stopped: string;
+    warning: string;
+}
+
 export const ExplorationLogTree: React.FC<ExplorationLogTreeProps> = ({ logs }) => {
     const { t } = useTranslation();
     const [expandedSteps, setExpandedSteps] = useState<Record<number, boolean>>({});
     const prevStepsRef = useRef<ExplorationStep[]>([]);
+    // Steps from the previous parse by number. Logs only ever grow at the tail, so every step
+    // but the last usually comes out identical and can keep its object (and skip re-rendering)
+    const stepCacheRef = useRef<Map<number, ExplorationStep>>(new Map());
 
     const steps = useMemo(() => {
         const parsedSteps: ExplorationStep[] = [];
@@ -55,9 +74,6 @@ export const ExplorationLogTree: React.FC<ExplorationLogTreeProps> = ({ logs })
                 };
             }
 
-            // Entry Categorization and cleaning (if needed)
-            const processedEntry = { ...entry };
-
             if (entry.type === 'error') {
                 currentStep.status = 'fail';
             } else if (entry.type === 'finished') {
@@ -66,14 +82,26 @@ export const ExplorationLogTree: React.FC<ExplorationLogTreeProps> = ({ logs })
                 currentStep.status = 'fail';
             }
 
-            currentStep.entries.push(processedEntry);
+            currentStep.entries.push(entry);
         });
 
         if (currentStep) {
             parsedSteps.push(currentStep);
         }
 
-        return parsedSteps;
+        const previous = stepCacheRef.current;
+        const shared = parsedSteps.map(step => {
+            const cached = previous.get(step.number);
+            const unchanged = cached &&
+                cached.status === step.status &&
+                cached.title === step.title &&
+                cached.entries.length === step.entries.length &&
+                cached.entries.every((e, i) => e === step.entries[i]);
+            return unchanged ? cached : step;
+        });
+        stepCacheRef.current = new Map(shared.map(step => [step.number, step]));
+
+        return shared;
     }, [logs, t]);
 
     // Auto-management of expanded steps
@@ -108,9 +136,22 @@ export const ExplorationLogTree: React.FC<ExplorationLogTreeProps> = ({ logs })
         prevStepsRef.current = steps;
     }, [steps]);
 
-    const toggleStep = (stepNumber: number) => {
+    const labels = useMemo<LogTreeLabels>(() => ({
+        running: t('common.running'),
+        pass: t('common.pass'),
+        fail: t('common.fail'),
+        ai: t('mapper.exploration.ai_title'),
+        rationale: t('mapper.exploration.rationale_title'),
+        action: t('mapper.exploration.action_title'),
+        error: t('mapper.exploration.error_title'),
+        finished: t('mapper.exploration.finished_title'),
+        stopped: t('mapper.exploration.stopped_title'),
+        warning: t('mapper.exploration.warning_title', 'Warning')
+    }), [t]);
+
+    const toggleStep = useCallback((stepNumber: number) => {
         setExpandedSteps(prev => ({ ...prev, [stepNumber]: !prev[stepNumber] }));
-    };
+    }, []);
 
     return (
         <div className="flex flex-col gap-2 w-full">
@@ -119,18 +160,20 @@ export const ExplorationLogTree: React.FC<ExplorationLogTreeProps> = ({ logs })
                     key={step.number}
                     step={step}
                     isExpanded={!!expandedSteps[step.number]}
-                    onToggle={() => toggleStep(step.number)}
+                    onToggle={toggleStep}
+                    labels={labels}
                 />
             ))}
         </div>
     );
 };
 
-const StepNode: React.FC<{
+const StepNode = React.memo(function StepNode({ step, isExpanded, onToggle, labels }: {
     step: ExplorationStep;
     isExpanded: boolean;
-    onToggle: () => void;
-}> = ({ step, isExpanded, onToggle }) => {
+    onToggle: (stepNumber: number) => void;
+    labels: LogTreeLabels;
+}) {
     const { t } = useTranslation();
 
     const statusConfig = {
@@ -139,21 +182,21 @@ const StepNode: React.FC<{
             bgColor: 'bg-primary/5',
             summaryColor: 'text-primary',
             icon: <RefreshCw size={14} className="animate-spin" />,
-            label: t('common.running')
+            label: labels.running
         },
         pass: {
             borderColor: 'border-success/30',
             bgColor: 'bg-success/5',
             summaryColor: 'text-success',
             icon: <CheckCircle2 size={14} />,
-            label: t('common.pass')
+            label: labels.pass
         },
         fail: {
             borderColor: 'border-error/30',
             bgColor: 'bg-error/5',
             summaryColor: 'text-error',
             icon: <AlertCircle size={14} />,
-            label: t('common.fail')
+            label: labels.fail
         }
     };
 
@@ -168,7 +211,7 @@ const StepNode: React.FC<{
             {/* Header */}
             <div
                 className="flex items-center gap-3 p-3 cursor-pointer hover:bg-on-surface/5 transition-colors"
-                onClick={onToggle}
+                onClick={() => onToggle(step.number)}
             >
                 {isExpanded ? <ChevronDown size={14} className="opacity-50" /> : <ChevronRight size={14} className="opacity-50" />}
 
@@ -206,7 +249,7 @@ const StepNode: React.FC<{
                     >
                         <div className="flex flex-col gap-1 p-3 pt-0 ml-4 border-l border-on-surface/5">
                             {step.entries.map((entry, idx) => (
-                                <LogEntryItem key={idx} entry={entry} />
+                                <LogEntryItem key={idx} entry={entry} labels={labels} />
                             ))}
                         </div>
                     </motion.div>
@@ -214,17 +257,15 @@ const StepNode: React.FC<{
             </AnimatePresence>
         </div>
     );
-};
-
-const LogEntryItem: React.FC<{ entry: LogEntry }> = ({ entry }) => {
-    const { t } = useTranslation();
+});
 
+const LogEntryItem = React.memo(function LogEntryItem({ entry, labels }: { entry: LogEntry, labels: LogTreeLabels }) {
     if (entry.type === 'ai') {
         return (
             <div className="my-1 p-2 bg-on-surface/5 rounded-lg border border-on-surface/5 flex flex-col gap-1.5">
                 <div className="flex items-center gap-2 text-[10px] font-bold uppercase tracking-wider text-primary/80">
                     <Sparkles size={12} />
-                    {t('mapper.exploration.ai_title')}
+                    {labels.ai}
                 </div>
                 <div className="text-[11px] leading-relaxed text-on-surface/80 italic">
                     {entry.text}
@@ -236,7 +277,7 @@ const LogEntryItem: React.FC<{ entry: LogEntry }> = ({ entry }) => {
             <div className="my-1 p-2 bg-on-surface/5 rounded-lg border border-on-surface/5 flex flex-col gap-1.5">
                 <div className="flex items-center gap-2 text-[10px] font-bold uppercase tracking-wider text-orange-400/80">
                     <SearchCode size={12} />
-                    {t('mapper.exploration.rationale_title')}
+                    {labels.rationale}
                 </div>
                 <div className="text-[11px] leading-relaxed text-on-surface/80 italic">
                     "{entry.text}"
@@ -248,7 +289,7 @@ const LogEntryItem: React.FC<{ entry: LogEntry }> = ({ entry }) => {
             <div className="my-1 p-2 bg-on-surface/5 rounded-lg border border-on-surface/5 flex flex-col gap-1.5">
                 <div className="flex items-center gap-2 text-[10px] font-bold uppercase tracking-wider text-primary/80">
                     <MousePointerClick size={12} />
-                    {t('mapper.exploration.action_title')}
+                    {labels.action}
                 </div>
                 <div className="text-[11px] leading-relaxed text-on-surface/80 italic">
                     {entry.text}
@@ -260,7 +301,7 @@ const LogEntryItem: React.FC<{ entry: LogEntry }> = ({ entry }) => {
             <div className="my-1 p-2 bg-on-surface/5 rounded-lg border border-on-surface/5 flex flex-col gap-1.5">
                 <div className="flex items-center gap-2 text-[10px] font-bold uppercase tracking-wider text-error/80">
                     <Bug size={12} />
-                    {t('mapper.exploration.error_title')}
+                    {labels.error}
                 </div>
                 <div className="text-[11px] leading-relaxed text-on-surface/80 italic">
                     {entry.text}
@@ -272,7 +313,7 @@ const LogEntryItem: React.FC<{ entry: LogEntry }> = ({ entry }) => {
             <div className="my-1 p-2 bg-on-surface/5 rounded-lg border border-on-surface/5 flex flex-col gap-1.5">
                 <div className="flex items-center gap-2 text-[10px] font-bold uppercase tracking-wider text-success/80">
                     <CheckCircle2 size={12} />
-                    {t('mapper.exploration.finished_title')}
+                    {labels.finished}
                 </div>
                 <div className="text-[11px] leading-relaxed text-on-surface/80 italic">
                     {entry.text}
@@ -284,7 +325,7 @@ const LogEntryItem: React.FC<{ entry: LogEntry }> = ({ entry }) => {
             <div className="my-1 p-2 bg-on-surface/5 rounded-lg border border-on-surface/5 flex flex-col gap-1.5">
                 <div className="flex items-center gap-2 text-[10px] font-bold uppercase tracking-wider text-error/80">
                     <XCircle size={12} />
-                    {t('mapper.exploration.stopped_title')}
+                    {labels.stopped}
                 </div>
                 <div className="text-[11px] leading-relaxed text-on-surface/80 italic">
                     {entry.text}
@@ -296,7 +337,7 @@ const LogEntryItem: React.FC<{ entry: LogEntry }> = ({ entry }) => {
             <div className="my-1 p-2 bg-warning/5 rounded-lg border border-warning/10 flex flex-col gap-1.5">
                 <div className="flex items-center gap-2 text-[10px] font-bold uppercase tracking-wider text-warning/80">
                     <AlertCircle size={12} />
-                    {t('mapper.exploration.warning_title', 'Warning')}
+                    {labels.warning}
                 </div>
                 <div className="text-[11px] leading-relaxed text-on-surface/80 italic">
                     {entry.text}
@@ -313,5 +354,4 @@ const LogEntryItem: React.FC<{ entry: LogEntry }> = ({ entry }) => {
             </div>
         );
     }
-};
-
+});
@@ -3,6 +3,7 @@ import { Input, InputProps } from '../atoms/Input';
 import { Button } from '../atoms/Button';
 import { FolderOpen } from 'lucide-react';
 import { open } from '@tauri-apps/plugin-dialog';
+import { invoke } from '@tauri-apps/api/core';
 import { feedback } from '@/lib/feedback';
 import { useTranslation } from 'react-i18next';
 
@@ -27,11 +28,15 @@ export function PathInput({
 
     const handleBrowse = async () => {
         try {
+            // A stale or unreachable start location (e.g. a disconnected network share) can stall
+            // the native dialog while the OS tries to resolve it, so only pass one that exists.
+            // The check itself is time-boxed off the main thread, as it would hang on the same share
+            const startExists = !!value && await invoke<boolean>('fs_exists_bounded', { path: value }).catch(() => false);
             const selected = await open({
                 title: dialogTitle,
                 directory,
                 multiple: false,
-                defaultPath: value || undefined,
+                defaultPath: startExists ? value : undefined,
                 filters: extensions ? [{ name: 'Filter', extensions }] : undefined
             });
 
@@ -44,16 +49,16 @@ export function PathInput({
     };
 
     return (
+        // Input already renders its own full-width wrapper, so it sits directly in the row;
+        // the settings page stacks many of these and each extra box is another layout node
         <div className="flex gap-2 items-end">
-            <div className="flex-1">
-                <Input
-                    {...props}
-                    value={value}
-                    readOnly
-                    disabled={disabled}
-                    className="font-mono text-xs sm:text-sm"
-                />
-            </div>
+            <Input
+                {...props}
+                value={value}
+                readOnly
+                disabled={disabled}
+                className="font-mono text-xs sm:text-sm"
+            />
             <Button
                 type="button"
                 onClick={handleBrowse}
@@ -61,7 +66,7 @@ export function PathInput({
                 title={t('settings.folder_select')}
                 variant="secondary"
                 size="icon"
-                className="mb-[1px]" // Align visually with input
+                className="mb-[1px] shrink-0" // Align visually with input
             >
                 <FolderOpen size={16} />
             </Button>
@@ -3,7 +3,7 @@ import { useTranslation } from 'react-i18next';
 import { X, Sparkles, Send, Loader2, Bot, Play, AlertTriangle, Mic, MicOff, Volume2, VolumeX } from 'lucide-react';
 import { useSettings } from "@/lib/settings";
 import { logEvent } from '@/lib/analytics';
-import { askAgent } from '@/lib/ai/agentService';
+import { askAgent, AGENT_READY_EVENT } from '@/lib/ai/agentService';
 import { AgentAction } from '@/lib/ai/agentProtocol';
 import ReactMarkdown from 'react-markdown';
 import { feedback } from '@/lib/feedback';
@@ -364,6 +364,7 @@ export function AiAgentPanel({ onNavigate }: AiAgentPanelProps) {
         };
 
         window.addEventListener('ai_agent_prompt', handleAiAgentPrompt as EventListener);
+        window.dispatchEvent(new Event(AGENT_READY_EVENT));
         return () => window.removeEventListener('ai_agent_prompt', handleAiAgentPrompt as EventListener);
     }, [isLoading, input, messages, settings]);
 
@@ -3,7 +3,7 @@ import { motion, AnimatePresence } from 'framer-motion';
 import { RefreshCw, Maximize, Scan, Globe } from 'lucide-react';
 import clsx from 'clsx';
 import { useTranslation } from 'react-i18next';
-import { InspectorNode, getHighlighterStyle } from '@/lib/inspectorUtils';
+import { InspectorNode, getHighlighterStyle, getHighlighterRect } from '@/lib/inspectorUtils';
 import { Button } from '@/components/atoms/Button';
 import { ExpressiveLoading } from '@/components/atoms/ExpressiveLoading';
 import { GestureOverlay } from '@/components/molecules/GestureOverlay';
@@ -89,6 +89,41 @@ export const DeviceViewport: React.FC<DeviceViewportProps> = ({
         }
     }, [initialImgLayout, screenshot, rootNode]);
 
+    // Search matches can run into the hundreds, so their outlines are drawn as a single SVG layer
+    // rather than one animated element each, and only re-measured when the matches or layout change
+    const searchRects = React.useMemo(() => searchResults.flatMap(node => {
+        const rect = getHighlighterRect(node, imgLayout);
+        return rect ? [{ id: node.id, rect }] : [];
+    }), [searchResults, imgLayout]);
+
+    const searchHighlights = (
+        <AnimatePresence>
+            {searchRects.length > 0 && (
+                <motion.svg
+                    key="search-highlights"
+                    initial={{ opacity: 0 }}
+                    animate={{ opacity: 1 }}
+                    exit={{ opacity: 0 }}
+                    className="absolute top-0 left-0 w-full h-full pointer-events-none z-30"
+                >
+                    {searchRects.map(({ id, rect }) => (
+                        // Inset by half the stroke so the outline sits inside the bounds like a border-2 box
+                        <rect
+                            key={id}
+                            x={rect.x + 1}
+                            y={rect.y + 1}
+                            width={Math.max(0, rect.w - 2)}
+                            height={Math.max(0, rect.h - 2)}
+                            fill={`${searchColor}15`}
+                            stroke={searchColor}
+                            strokeWidth={2}
+                        />
+                    ))}
+                </motion.svg>
+            )}
+        </AnimatePresence>
+    );
+
     // Gather all highlightable nodes when screenshot is null
     const highlightableNodes = React.useMemo(() => {
         if (screenshot || !rootNode) return [];
@@ -345,18 +380,7 @@ export const DeviceViewport: React.FC<DeviceViewportProps> = ({
                         ))}
 
                         {/* Highlighters */}
-                        <AnimatePresence>
-                            {searchResults.map(node => (
-                                <motion.div
-                                    key={node.id}
-                                    initial={{ opacity: 0, scale: 0.95 }}
-                                    animate={{ opacity: 1, scale: 1 }}
-                                    exit={{ opacity: 0, scale: 0.95 }}
-                                    className="absolute border-2 pointer-events-none z-30"
-                                    style={getHighlighterStyle(node, searchColor, imgLayout)}
-                                />
-                            ))}
-                        </AnimatePresence>
+                        {searchHighlights}
 
                         <motion.div
                             initial={false}
@@ -576,18 +600,7 @@ export const DeviceViewport: React.FC<DeviceViewportProps> = ({
                 ))}
 
                 {/* Highlighters */}
-                <AnimatePresence>
-                    {searchResults.map(node => (
-                        <motion.div
-                            key={node.id}
-                            initial={{ opacity: 0, scale: 0.95 }}
-                            animate={{ opacity: 1, scale: 1 }}
-                            exit={{ opacity: 0, scale: 0.95 }}
-                            className="absolute border-2 pointer-events-none z-30"
-                            style={getHighlighterStyle(node, searchColor, imgLayout)}
-                        />
-                    ))}
-                </AnimatePresence>
+                {searchHighlights}
 
                 <motion.div
                     initial={false}
@@ -1,6 +1,6 @@
-import { useEffect, useState, useRef, useCallback } from 'react';
+import { useEffect, useState, useRef, useCallback, useMemo } from 'react';
 import { useTranslation } from "react-i18next";
-import { XCircle, CheckCircle2, Calendar, Clock, Smartphone, FolderOpen, Cloud } from 'lucide-react';
+import { XCircle, CheckCircle2, Calendar, Clock, Smartphone, FolderOpen, Cloud, FileText } from 'lucide-react';
 import { invoke } from '@tauri-apps/api/core';
 import { listen, UnlistenFn } from '@tauri-apps/api/event';
 import { getCachedResult, parseXmlBackground, onParseComplete } from '@/lib/xmlParseCache';
@@ -287,6 +287,9 @@ export function HistoryDetailModal({ isOpen, onClose, log, onUpdateLog }: Histor
         }
     };
 
+    // Cloud-only runs have no local artifacts; derived once per selected log rather than per button prop
+    const isRemoteOnly = useMemo(() => !!log?.is_remote && !log.xml_path, [log]);
+
     const formatDate = (dateStr: string) => {
         try {
             const date = new Date(dateStr);
@@ -353,16 +356,28 @@ export function HistoryDetailModal({ isOpen, onClose, log, onUpdateLog }: Histor
                             <Button
                                 variant="ghost" size="icon"
                                 onClick={() => openLog(log.path)}
-                                disabled={log.is_remote && !log.xml_path}
+                                disabled={isRemoteOnly}
                                 className={clsx(
                                     "w-6 h-6 rounded",
-                                    log.is_remote && !log.xml_path ? "opacity-20 cursor-not-allowed" : "hover:text-primary"
+                                    isRemoteOnly ? "opacity-20 cursor-not-allowed" : "hover:text-primary"
                                 )}
-                                data-tooltip={log.is_remote && !log.xml_path ? t('tests_page.local_only_action', "Ação disponível apenas localmente") : t('run_tab.console.open_output_dir')}
+                                data-tooltip={isRemoteOnly ? t('tests_page.local_only_action', "Ação disponível apenas localmente") : t('run_tab.console.open_output_dir')}
                                 data-position='bottom'
                             >
                                 <FolderOpen size={14} />
                             </Button>
+                            {/* Robot writes a static log.html next to output.xml; hand it straight to the OS default handler */}
+                            {log.log_html_path?.toLowerCase().endsWith('.html') && (
+                                <Button
+                                    variant="ghost" size="icon"
+                                    onClick={() => openLog(log.log_html_path)}
+                                    className="w-6 h-6 rounded hover:text-primary"
+                                    data-tooltip={t('run_tab.console.open_log')}
+                                    data-position='bottom'
+                                >
+                                    <FileText size={14} />
+                                </Button>
+                            )}
                         </div>
 
                         <div className="flex-1" />
@@ -439,7 +454,7 @@ export function HistoryDetailModal({ isOpen, onClose, log, onUpdateLog }: Histor
                                     />
                                 ))}
                             </div>
-                        ) : log.is_remote && !log.xml_path ? (
+                        ) : isRemoteOnly ? (
                             <div className="h-full flex flex-col items-center justify-center gap-6 text-center px-8">
                                 <div className="p-8 bg-primary/5 rounded-full text-primary/30 relative">
                                     <Cloud size={64} strokeWidth={1} />
@@ -1,4 +1,4 @@
-import { useEffect, useRef, useState } from "react";
+import { useCallback, useEffect, useRef, useState } from "react";
 import { Virtuoso, VirtuosoHandle } from "react-virtuoso";
 import clsx from "clsx";
 import { useTranslation } from "react-i18next";
@@ -19,8 +19,8 @@ import * as openai from "@/lib/dashboard/openai";
 import * as claude from "@/lib/dashboard/claude";
 import * as claudeCli from "@/lib/dashboard/claudeCode";
 import * as antigravityCode from "@/lib/dashboard/antigravityCode";
-import { useCallback } from "react";
 import { Button } from "@/components/atoms/Button";
+import { sendAgentPrompt } from "@/lib/ai/agentService";
 
 interface RunConsoleProps {
     runId: string;
@@ -84,6 +84,9 @@ export function RunConsole({ runId, logs, isSessionRunning: isRunning, testPath,
     const { t, i18n } = useTranslation();
     const { sessions, setSessionTree, addSessionLog, markSessionFinished } = useTestSessions();
     const session = sessions.find(s => s.runId === runId);
+    // `logs` is capped at the front, so progress is tracked against the absolute line count
+    const droppedLogCount = session?.droppedLogCount ?? 0;
+    const totalLogLines = droppedLogCount + logs.length;
 
     const [isRawMode, setIsRawMode] = useState(false);
     const [isKeepAwake, setIsKeepAwake] = useState(false);
@@ -132,13 +135,6 @@ export function RunConsole({ runId, logs, isSessionRunning: isRunning, testPath,
         }
     }, [tree]);
 
-    // Sync state with session store when background updates happen (e.g. artifacts detected)
-    useEffect(() => {
-        if (session?.repopulatedTree && tree.length === 0) {
-            setTree([session.repopulatedTree]);
-        }
-    }, [session?.repopulatedTree]);
-
     // Handle auto-scroll logic
     useEffect(() => {
         if (!stickToBottom || showDebugConsole) return;
@@ -153,7 +149,7 @@ export function RunConsole({ runId, logs, isSessionRunning: isRunning, testPath,
                 fancyContainerRef.current.scrollTop = fancyContainerRef.current.scrollHeight;
             }
         }
-    }, [logs.length, tree.length, isRawMode, stickToBottom, showDebugConsole]);
+    }, [totalLogLines, tree.length, isRawMode, stickToBottom, showDebugConsole]);
 
     // Keep Screen Awake Lifecycle
     useEffect(() => {
@@ -476,11 +472,11 @@ export function RunConsole({ runId, logs, isSessionRunning: isRunning, testPath,
     useEffect(() => {
         // Skip log parsing if we already have a repopped tree and the test is finished
         if (!isRunning && tree.length > 0 && (session?.repopulatedTree || session?.outputDir)) {
-            processedCountRef.current = logs.length; // Mark all as processed
+            processedCountRef.current = totalLogLines; // Mark all as processed
             return;
         }
 
-        const currentCount = logs.length;
+        const currentCount = totalLogLines;
         const processedCount = processedCountRef.current;
 
         // Only clear if it's a fresh run or a reset
@@ -495,10 +491,11 @@ export function RunConsole({ runId, logs, isSessionRunning: isRunning, testPath,
         if (currentCount === processedCount) return;
 
         // Use the modular heuristic parser
-        const result = parseHeuristicLogs(logs, parsedNodesRef.current, processedCount);
+        // Lines trimmed before they were parsed are skipped rather than re-read from the new front
+        const result = parseHeuristicLogs(logs, parsedNodesRef.current, Math.max(0, processedCount - droppedLogCount), droppedLogCount);
 
         parsedNodesRef.current = result.parsedNodes;
-        processedCountRef.current = result.processedCount;
+        processedCountRef.current = result.processedCount + droppedLogCount;
 
         // Update tree only if we haven't officially repopulated yet
         if (!session?.repopulatedTree) {
@@ -512,7 +509,8 @@ export function RunConsole({ runId, logs, isSessionRunning: isRunning, testPath,
 
     }, [logs, isRunning, runId, session?.repopulatedTree]);
 
-    // Definitively update tree when session.repopulatedTree arrives
+    // Sync state with session store when background updates happen (e.g. artifacts detected):
+    // definitively update tree when session.repopulatedTree arrives
     useEffect(() => {
         if (session?.repopulatedTree) {
             setTree([session.repopulatedTree]);
@@ -654,12 +652,10 @@ export function RunConsole({ runId, logs, isSessionRunning: isRunning, testPath,
                                         onClick={() => {
                                             const historyStr = aiHistory.map((h, i) => `[Step ${i + 1}] ${h}`).join('\n');
                                             const prompt = `Gere os testes automatizados em Robot Framework (arquivos .robot e .resource) para este fluxo que acabou de ser mapeado com sucesso pela engine de exploração autônoma:\n\n${historyStr}`;
+                                            sendAgentPrompt(prompt, settings.aiChatEnabled);
                                             if (!settings.aiChatEnabled) {
                                                 updateSetting('aiChatEnabled', true);
                                             }
-                                            setTimeout(() => {
-                                                window.dispatchEvent(new CustomEvent('ai_agent_prompt', { detail: { prompt, hidden: true } }));
-                                            }, 200);
                                         }}
                                         label={t('run_tab.console.generate_ai_test')}
                                         variant="primary"
@@ -683,6 +679,8 @@ export function RunConsole({ runId, logs, isSessionRunning: isRunning, testPath,
                         ref={rawContainerRef}
                         data={logs}
                         followOutput="auto"
+                        // One 13px relaxed line plus padding; lets Virtuoso size the list without a probe render
+                        defaultItemHeight={25}
                         onScroll={onScroll}
                         className="custom-scrollbar"
                         itemContent={(i, line) => {
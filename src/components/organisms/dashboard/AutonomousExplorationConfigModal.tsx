@@ -10,7 +10,7 @@ import { Switch } from '@/components/atoms/Switch';
 import { Textarea } from '@/components/atoms/Textarea';
 import { Select } from '@/components/atoms/Select';
 import { ExplorationConfig, getDestructiveTerms, getEscapeTerms } from '@/lib/dashboard/explorationEngine';
-import { useSettings } from '@/lib/settings';
+import { useSettings, getAppPackages } from '@/lib/settings';
 
 interface AutonomousExplorationConfigModalProps {
     onClose: () => void;
@@ -49,9 +49,7 @@ export function AutonomousExplorationConfigModal({ onClose, onStart }: Autonomou
     });
 
     const { settings } = useSettings();
-    const availablePackages = settings.tools.appPackage
-        ? settings.tools.appPackage.split(',').map(p => p.trim()).filter(Boolean)
-        : [];
+    const availablePackages = getAppPackages(settings.tools.appPackage);
 
     const [targetPackage, setTargetPackage] = useState<string>(() => {
         return localStorage.getItem('exploration_config_targetPackage') || availablePackages[0] || '';
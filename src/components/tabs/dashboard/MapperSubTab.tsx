@@ -4,12 +4,11 @@ import {
     Check, Scan, Home, ArrowLeft, Rows, X, GitGraph, Trash2, Plus, FileClock, SearchCode, ChevronDown, ChevronUp, ChevronRight,
     FileCode, FileStack, Upload, Download, Eye, EyeClosed, Settings2, Sparkles, Save
 } from 'lucide-react';
-import { XMLParser } from 'fast-xml-parser';
 import clsx from 'clsx';
 import { useTranslation } from 'react-i18next';
 import { useOutsideClick } from '@/hooks/useOutsideClick';
 import { getRemoteString } from '@/lib/remoteConfig';
-import { InspectorNode, transformXmlToTree, generateXPath, findNodesByLocator, findNodesByText, sanitizeId } from '@/lib/inspectorUtils';
+import { InspectorNode, transformXmlToTree, generateXPath, findNodesByLocator, findNodesByText, sanitizeId, uiDumpParser } from '@/lib/inspectorUtils';
 import { feedback } from "@/lib/feedback";
 import { Section } from "@/components/organisms/Section";
 import { ExpressiveLoading } from "@/components/atoms/ExpressiveLoading";
@@ -806,8 +805,7 @@ export function MapperSubTab({ isActive, selectedDeviceId }: MapperSubTabProps)
             const shortIdMap = contextResponse.metadata.short_id_map as Record<string, string>;
 
             // Parse for local UI update (Simplified version for visibility)
-            const parser = new XMLParser({ ignoreAttributes: false, attributeNamePrefix: "", textNodeName: "_text" });
-            const jsonObj = parser.parse(xml);
+            const jsonObj = uiDumpParser.parse(xml);
             const root = jsonObj.hierarchy ? transformXmlToTree(jsonObj.hierarchy, undefined, 'hierarchy') : transformXmlToTree(jsonObj);
             setRootNode(root);
 
@@ -22,6 +22,11 @@ import semver from 'semver';
 import pkg from '../../../../package.json';
 import { Alert } from '@/components/atoms/Alert';
 
+// Server status polling starts at this interval and backs off to the max while nothing changes
+const STATUS_POLL_MIN_MS = 3000;
+const STATUS_POLL_MAX_MS = 8000;
+const DEVICES_REFRESH_MS = 5000;
+
 interface HomeSubTabProps {
     onNavigate: (page: string) => void;
 }
@@ -45,9 +50,17 @@ export function HomeSubTab({ onNavigate }: HomeSubTabProps) {
         settingPathKey: 'screenshots'
     });
 
-    // Monitor Server Status
+    // Monitor server status and refresh devices from a single timer. Devices are reloaded once at
+    // least DEVICES_REFRESH_MS has passed, and the interval backs off while the servers' state is
+    // steady so an idle Home screen isn't waking adb/Appium every few seconds.
     useEffect(() => {
-        const checkStatus = async () => {
+        let cancelled = false;
+        let timeoutId: ReturnType<typeof setTimeout>;
+        let lastDevicesAt = 0;
+        let delay = STATUS_POLL_MIN_MS;
+        let lastStatus: string | null = null;
+
+        const checkStatus = async (): Promise<boolean> => {
             try {
                 const [adbResult, appiumResult] = await Promise.allSettled([
                     invoke<boolean>('is_adb_server_running'),
@@ -64,24 +77,37 @@ export function HomeSubTab({ onNavigate }: HomeSubTabProps) {
                 if (appiumResult.status === 'fulfilled') {
                     setAppiumRunning(appiumResult.value.running);
                 }
+
+                const status = `${adbResult.status === 'fulfilled' && adbResult.value}|${appiumResult.status === 'fulfilled' && appiumResult.value.running}`;
+                const changed = status !== lastStatus;
+                lastStatus = status;
+                return changed;
             } catch (e) {
                 console.error('Failed to check server status', e);
+                return true;
             }
         };
 
-        checkStatus();
-        const interval = setInterval(checkStatus, 3000);
-        return () => clearInterval(interval);
-    }, [settings.appiumHost, settings.appiumPort, settings.appiumBasePath]);
+        const poll = async () => {
+            const tasks: Promise<unknown>[] = [checkStatus()];
+            if (Date.now() - lastDevicesAt >= DEVICES_REFRESH_MS) {
+                lastDevicesAt = Date.now();
+                tasks.push(loadDevices());
+            }
 
-    // Auto-refresh devices every 5 seconds when this screen is active
-    useEffect(() => {
-        loadDevices();
-        const interval = setInterval(() => {
-            loadDevices();
-        }, 5000);
-        return () => clearInterval(interval);
-    }, []);
+            const [changed] = await Promise.all(tasks);
+            if (cancelled) return;
+
+            delay = changed ? STATUS_POLL_MIN_MS : Math.min(STATUS_POLL_MAX_MS, delay + STATUS_POLL_MIN_MS);
+            timeoutId = setTimeout(poll, delay);
+        };
+
+        poll();
+        return () => {
+            cancelled = true;
+            clearTimeout(timeoutId);
+        };
+    }, [settings.appiumHost, settings.appiumPort, settings.appiumBasePath]);
 
     // Load history once
     useEffect(() => {
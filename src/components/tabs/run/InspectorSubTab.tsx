@@ -1,11 +1,12 @@
 
-import { useState, useEffect, useRef } from 'react';
+import { useState, useEffect, useRef, useMemo } from 'react';
 import { Check, Scan, Home, ArrowLeft, Rows, X, Search, Pencil, Copy, ChevronDown, ChevronUp, Videotape, Download, RefreshCw } from 'lucide-react';
 import clsx from 'clsx';
 import { invoke } from '@tauri-apps/api/core';
 import { useTranslation } from 'react-i18next';
 import { InspectorNode, generateXPath, findNodesByLocator, generateUiSelector } from '@/lib/inspectorUtils';
 import { feedback } from "@/lib/feedback";
+import { sendAgentPrompt } from "@/lib/ai/agentService";
 import { Section } from "@/components/organisms/Section";
 import { Button } from "@/components/atoms/Button";
 import { Input } from "@/components/atoms/Input";
@@ -32,6 +33,32 @@ interface InspectorSubTabProps {
 import { RecordingPane, RecorderOptions, RecordingStep } from '@/components/organisms/RecordingPane';
 
 
+// Live UI sync polling: starts at the base interval and doubles after this many unchanged polls
+const UI_SYNC_BASE_INTERVAL_MS = 2000;
+const UI_SYNC_MAX_INTERVAL_MS = 16000;
+const UI_SYNC_IDLE_POLLS = 5;
+
+// Display order for the attribute table; anything not listed follows alphabetically
+const ATTRIBUTE_ORDER = [
+    'resource-id',
+    'text',
+    'class',
+    'package',
+    'bounds',
+    'index',
+    'instance',
+    'checkable',
+    'checked',
+    'clickable',
+    'enabled',
+    'focusable',
+    'focused',
+    'long-clickable',
+    'password',
+    'scrollable',
+    'selected'
+];
+
 export function InspectorSubTab({ selectedDevice, isActive, isTestRunning = false }: InspectorSubTabProps) {
     const { t, i18n } = useTranslation();
     const {
@@ -62,6 +89,26 @@ export function InspectorSubTab({ selectedDevice, isActive, isTestRunning = fals
 
     const [copied, setCopied] = useState<string | null>(null);
 
+    // Hovering the viewport re-renders this tab on every pointer move, so the selected
+    // node's default locators and sorted attribute rows are derived once per selection
+    const selectedNodeDetails = useMemo(() => {
+        if (!selectedNode) return null;
+        return {
+            xpath: generateXPath(selectedNode),
+            uiSelector: generateUiSelector(selectedNode, { type: 'equals', useUiSelectorWrapper: true, attr: 'auto' }),
+            attributeEntries: Object.entries(selectedNode.attributes)
+                .filter(([key, value]) => key !== undefined && value !== undefined && value !== null && value !== '')
+                .sort(([a], [b]) => {
+                    const idxA = ATTRIBUTE_ORDER.indexOf(a);
+                    const idxB = ATTRIBUTE_ORDER.indexOf(b);
+                    if (idxA !== -1 && idxB !== -1) return idxA - idxB;
+                    if (idxA !== -1) return -1;
+                    if (idxB !== -1) return 1;
+                    return a.localeCompare(b);
+                })
+        };
+    }, [selectedNode]);
+
     const handleExportXml = async () => {
         if (!xmlDump) {
             feedback.toast.error(t('inspector.export_xml_no_data'));
@@ -144,6 +191,9 @@ export function InspectorSubTab({ selectedDevice, isActive, isTestRunning = fals
 
         let isMounted = true;
         let timeoutId: any;
+        // Back off while the screen sits still; each poll costs a device round trip
+        let interval = UI_SYNC_BASE_INTERVAL_MS;
+        let unchangedPolls = 0;
 
         const checkChanges = async () => {
             try {
@@ -158,18 +208,23 @@ export function InspectorSubTab({ selectedDevice, isActive, isTestRunning = fals
                 lastFocusRef.current = currentFocus;
 
                 if (hasChanged) {
+                    interval = UI_SYNC_BASE_INTERVAL_MS;
+                    unchangedPolls = 0;
                     await refreshAll(true, false);
+                } else if (++unchangedPolls >= UI_SYNC_IDLE_POLLS) {
+                    interval = Math.min(interval * 2, UI_SYNC_MAX_INTERVAL_MS);
+                    unchangedPolls = 0;
                 }
             } catch (err) {
                 console.warn("[Inspector Sync] Error checking UI changes:", err);
             }
 
             if (isMounted && autoRefreshEnabled) {
-                timeoutId = setTimeout(checkChanges, 2000);
+                timeoutId = setTimeout(checkChanges, interval);
             }
         };
 
-        timeoutId = setTimeout(checkChanges, 2000);
+        timeoutId = setTimeout(checkChanges, interval);
 
         return () => {
             isMounted = false;
@@ -193,12 +248,16 @@ export function InspectorSubTab({ selectedDevice, isActive, isTestRunning = fals
 
     const handleSearch = (query: string) => {
         setSearchQuery(query);
+        // Keep the current array when a keystroke leaves the match set unchanged, so the
+        // viewport doesn't re-measure and redraw an identical set of highlights
         if (!rootNode || !query) {
-            setSearchResults([]);
+            setSearchResults(prev => prev.length === 0 ? prev : []);
             return;
         }
         const results = findNodesByLocator(rootNode, query);
-        setSearchResults(results);
+        setSearchResults(prev => (
+            prev.length === results.length && prev.every((node, i) => node === results[i])
+        ) ? prev : results);
     };
 
     const copyToClipboard = (text: string, label: string) => {
@@ -741,7 +800,7 @@ Parent Tag: ${selectedNode.parent?.tagName || 'N/A'}
 
                                         const defaultLocator = selectedNode.attributes['resource-id']
                                             ? `id=${selectedNode.attributes['resource-id']}`
-                                            : generateXPath(selectedNode);
+                                            : selectedNodeDetails?.xpath ?? generateXPath(selectedNode);
 
                                         setRecordedSteps(prev => [...prev, { id: Date.now(), action, params, node: selectedNode, locator: defaultLocator }]);
                                     }
@@ -763,12 +822,10 @@ Responda usando o idioma ${settings.language === 'pt_BR' ? 'Português (BR)' : s
 
 Fluxo Gravado:
 ${historyStr}`;
+                                    sendAgentPrompt(prompt, settings.aiChatEnabled);
                                     if (!settings.aiChatEnabled) {
                                         updateSetting('aiChatEnabled', true);
                                     }
-                                    setTimeout(() => {
-                                        window.dispatchEvent(new CustomEvent('ai_agent_prompt', { detail: { prompt, hidden: true } }));
-                                    }, 200);
                                 }}
                                 availableNodes={availableNodes}
                                 onSelectNode={setSelectedNode}
@@ -830,7 +887,7 @@ ${historyStr}`;
                                         {!selectedNode.attributes['content-desc'] && !selectedNode.attributes['resource-id'] && (
                                             <CopyButton
                                                 label={t('inspector.attributes.uiselector', 'UIAutomator')}
-                                                value={generateUiSelector(selectedNode, { type: 'equals', useUiSelectorWrapper: true, attr: 'auto' })}
+                                                value={selectedNodeDetails?.uiSelector}
                                                 onCopy={(v) => copyToClipboard(v, 'uis')}
                                                 onEdit={() => handleOpenEditModal('uiselector')}
                                                 active={copied === 'uis'}
@@ -838,7 +895,7 @@ ${historyStr}`;
                                         )}
                                         <CopyButton
                                             label={t('inspector.attributes.xpath')}
-                                            value={generateXPath(selectedNode)}
+                                            value={selectedNodeDetails?.xpath}
                                             onCopy={(v) => copyToClipboard(v, 'xp')}
                                             onEdit={() => handleOpenEditModal('xpath')}
                                             active={copied === 'xp'}
@@ -851,35 +908,7 @@ ${historyStr}`;
                                 <div>
                                     <h3 className="text-xs font-semibold text-on-surface-variant/80 uppercase tracking-wider mb-2">{t('inspector.attributes.all')}</h3>
                                     <div className="border border-outline-variant/30 rounded-2xl overflow-hidden text-sm">
-                                        {Object.entries(selectedNode.attributes)
-                                            .filter(([key, value]) => key !== undefined && value !== undefined && value !== null && value !== '')
-                                            .sort(([a], [b]) => {
-                                                const order = [
-                                                    'resource-id',
-                                                    'text',
-                                                    'class',
-                                                    'package',
-                                                    'bounds',
-                                                    'index',
-                                                    'instance',
-                                                    'checkable',
-                                                    'checked',
-                                                    'clickable',
-                                                    'enabled',
-                                                    'focusable',
-                                                    'focused',
-                                                    'long-clickable',
-                                                    'password',
-                                                    'scrollable',
-                                                    'selected'
-                                                ];
-                                                const idxA = order.indexOf(a);
-                                                const idxB = order.indexOf(b);
-                                                if (idxA !== -1 && idxB !== -1) return idxA - idxB;
-                                                if (idxA !== -1) return -1;
-                                                if (idxB !== -1) return 1;
-                                                return a.localeCompare(b);
-                                            })
+                                        {selectedNodeDetails?.attributeEntries
                                             .map(([key, value]) => (
                                                 <div key={key} className="flex flex-col border-b border-outline-variant/30 last:border-0">
                                                     <div className="bg-surface-variant/80 px-3 py-1.5 text-xs text-on-surface-variant/80 font-medium break-all">{key}</div>
@@ -1,4 +1,4 @@
-import { useState, useEffect, useRef, useMemo } from 'react';
+import { useState, useEffect, useRef, useMemo, useDeferredValue } from 'react';
 import { AnimatePresence } from 'framer-motion';
 import { useVirtualizer } from '@tanstack/react-virtual';
 import { useSettings } from "@/lib/settings";
@@ -63,7 +63,9 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
 
     const [showCharts, setShowCharts] = useState(false);
     const [loadingHistory, setLoadingHistory] = useState(false);
-    const [collapsedGroups, setCollapsedGroups] = useState<Record<string, boolean>>({});
+    // Groups start collapsed so only their headers are materialized; a group's rows are
+    // added to the virtual list the first time it is expanded
+    const [expandedGroups, setExpandedGroups] = useState<Record<string, boolean>>({});
     const [selectedLog, setSelectedLog] = useState<TestLog | null>(null);
     const [isModalOpen, setIsModalOpen] = useState(false);
 
@@ -71,6 +73,13 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
     const [isAIModalOpen, setIsAIModalOpen] = useState(false);
     const [isAnalyzingHistory] = useState(false);
 
+    // Strings repeated on every virtual row, resolved once per language instead of per row render
+    const rowLabels = useMemo(() => ({
+        localStorage: t('common.local_storage', "Armazenamento Local"),
+        cloudSync: t('common.cloud_sync', "Sincronizado na Nuvem"),
+        unknownModel: t('tests_page.unknown_model')
+    }), [t]);
+
     const parentRef = useRef<HTMLDivElement>(null);
     const historyContainerRef = useRef<HTMLDivElement>(null);
     const [isHistoryNarrow, setIsHistoryNarrow] = useState(false);
@@ -204,11 +213,13 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
                             const successfulUploads = results.filter((r): r is { xml_path: string; docId: string } => r !== null);
                             if (successfulUploads.length > 0) {
                                 console.log(`[Sync] Successfully synced ${successfulUploads.length} logs to Firebase.`);
+                                // Apply all uploads in a single pass over the list instead of a lookup scan per row
+                                const docIdsByPath = new Map(successfulUploads.map(u => [u.xml_path, u.docId]));
                                 setHistory(prev => {
                                     const updated = prev.map(log => {
-                                        const match = successfulUploads.find(u => u.xml_path === log.xml_path);
-                                        if (match) {
-                                            return { ...log, has_remote_sync: true, id: match.docId };
+                                        const docId = docIdsByPath.get(log.xml_path);
+                                        if (docId) {
+                                            return { ...log, has_remote_sync: true, id: docId };
                                         }
                                         return log;
                                     });
@@ -274,11 +285,56 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
         };
     }, [history]);
 
+    // Filter option lists only change with the language or the set of values in history,
+    // not on every keystroke/row update that re-renders this tab
+    const periodOptions = useMemo(() => [
+        { value: "all_time", label: t('tests_page.filter.all_time') },
+        { value: "today", label: t('tests_page.filter.today') },
+        { value: "last_7_days", label: t('tests_page.filter.last_7_days') },
+        { value: "last_30_days", label: t('tests_page.filter.last_30_days') }
+    ], [t]);
+    const groupByOptions = useMemo(() => [
+        { value: "none", label: `${t('tests_page.filter.group_by')}: ${t('tests_page.filter.none')}` },
+        { value: "status", label: t('tests_page.filter.status') },
+        { value: "device", label: t('tests_page.filter.device') },
+        { value: "suite", label: t('tests_page.filter.suite') },
+        { value: "os_version", label: t('tests_page.filter.os_version') }
+    ], [t]);
+    const statusOptions = useMemo(() => [
+        { value: "all", label: t('tests_page.filter.all_status') },
+        ...statuses.map(s => ({ value: s, label: s }))
+    ], [t, statuses]);
+    const deviceOptions = useMemo(() => [
+        { value: "all", label: t('tests_page.filter.all_devices') },
+        ...devices.map(d => ({ value: d, label: d }))
+    ], [t, devices]);
+    const osOptions = useMemo(() => [
+        { value: "all", label: t('tests_page.filter.all_os') },
+        ...osVersions.map(o => ({ value: o, label: `Android ${o}` }))
+    ], [t, osVersions]);
+
+    // Filtering/grouping walks the whole history, so let rapid typing or select changes
+    // coalesce into the latest value instead of recomputing on every intermediate one
+    const deferredFilterText = useDeferredValue(filterText);
+    const deferredFilterPeriod = useDeferredValue(filterPeriod);
+    const deferredGroupBy = useDeferredValue(groupBy);
+
+    // decodeHtml goes through DOMParser, so decode each suite name once per history load and
+    // let filtering, grouping and row rendering read the prepared values
+    const suiteNames = useMemo(() => {
+        const names = new Map<TestLog, { display: string; search: string }>();
+        history.forEach(log => {
+            const display = decodeHtml(log.suite_name);
+            names.set(log, { display, search: display.toLowerCase() });
+        });
+        return names;
+    }, [history]);
+
     const filteredHistory = useMemo(() => {
+        const needle = deferredFilterText.toLowerCase();
         return history.filter(log => {
-            const decodedName = decodeHtml(log.suite_name);
-            const matchesText = decodedName.toLowerCase().includes(filterText.toLowerCase());
-            const matchesPeriod = isDateInPeriod(log.timestamp, filterPeriod);
+            const matchesText = suiteNames.get(log)!.search.includes(needle);
+            const matchesPeriod = isDateInPeriod(log.timestamp, deferredFilterPeriod);
 
             const matchesDevice = filterDevice === "all" || log.device_model === filterDevice;
             const matchesOS = filterOS === "all" || log.android_version === filterOS;
@@ -286,29 +342,32 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
 
             return matchesText && matchesPeriod && matchesDevice && matchesOS && matchesStatus;
         });
-    }, [history, filterText, filterPeriod, filterDevice, filterOS, filterStatus]);
+    }, [history, suiteNames, deferredFilterText, deferredFilterPeriod, filterDevice, filterOS, filterStatus]);
 
     const groupedHistory = useMemo(() => {
-        if (groupBy === 'none') return { 'All': filteredHistory };
+        if (deferredGroupBy === 'none') return { 'All': filteredHistory };
 
         const groups: Record<string, TestLog[]> = {};
 
-        if (groupBy === 'status') {
-            groups['PASS'] = filteredHistory.filter(l => l.status === 'PASS');
-            groups['FAIL'] = filteredHistory.filter(l => l.status === 'FAIL');
-        } else if (groupBy === 'device') {
+        if (deferredGroupBy === 'status') {
+            groups['PASS'] = [];
+            groups['FAIL'] = [];
+            filteredHistory.forEach(log => {
+                groups[log.status]?.push(log);
+            });
+        } else if (deferredGroupBy === 'device') {
             filteredHistory.forEach(log => {
                 const devName = log.device_model ? `${log.device_model} (${log.device_udid})` : (log.device_udid || 'Unknown Device');
                 if (!groups[devName]) groups[devName] = [];
                 groups[devName].push(log);
             });
-        } else if (groupBy === 'suite') {
+        } else if (deferredGroupBy === 'suite') {
             filteredHistory.forEach(log => {
-                const suite = decodeHtml(log.suite_name || 'Unknown');
+                const suite = suiteNames.get(log)!.display || 'Unknown';
                 if (!groups[suite]) groups[suite] = [];
                 groups[suite].push(log);
             });
-        } else if (groupBy === 'os_version') {
+        } else if (deferredGroupBy === 'os_version') {
             filteredHistory.forEach(log => {
                 const ver = log.android_version ? `Android ${log.android_version}` : t('tests_page.unknown_os');
                 if (!groups[ver]) groups[ver] = [];
@@ -316,16 +375,21 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
             });
         }
         return groups;
-    }, [filteredHistory, groupBy, t]);
+    }, [filteredHistory, suiteNames, deferredGroupBy, t]);
 
 
     const toggleGroup = (group: string) => {
-        setCollapsedGroups(prev => ({
+        setExpandedGroups(prev => ({
             ...prev,
             [group]: !prev[group]
         }));
     };
 
+    // Group names are only meaningful for the grouping that produced them
+    useEffect(() => {
+        setExpandedGroups({});
+    }, [groupBy]);
+
     const handleLogClick = (log: TestLog) => {
         setSelectedLog(log);
         setIsModalOpen(true);
@@ -343,31 +407,35 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
     // Flatten the grouped history for virtualization
     type VirtualItem =
         | { type: 'header'; id: string; groupName: string; count: number }
-        | { type: 'log'; id: string; log: TestLog; groupName: string };
+        | { type: 'log'; id: string; log: TestLog; suiteName: string; groupName: string };
 
     const flatItems = useMemo(() => {
         const items: VirtualItem[] = [];
         Object.entries(groupedHistory).forEach(([groupName, logs]) => {
             if (logs.length === 0) return;
 
-            if (groupBy !== 'none') {
+            if (deferredGroupBy !== 'none') {
                 items.push({ type: 'header', id: `header-${groupName}`, groupName, count: logs.length });
             }
 
-            if (groupBy === 'none' || !collapsedGroups[groupName]) {
+            if (deferredGroupBy === 'none' || expandedGroups[groupName]) {
                 logs.forEach(log => {
-                    items.push({ type: 'log', id: log.xml_path, log, groupName });
+                    // Cloud-only records have no xml_path, so fall back to their document/run id
+                    items.push({ type: 'log', id: log.xml_path || log.id || log.run_id || `${groupName}-${log.timestamp}`, log, suiteName: suiteNames.get(log)!.display, groupName });
                 });
             }
         });
         return items;
-    }, [groupedHistory, groupBy, collapsedGroups]);
+    }, [groupedHistory, suiteNames, deferredGroupBy, expandedGroups]);
 
     // Setup React Virtualizer
     const rowVirtualizer = useVirtualizer({
         count: flatItems.length,
         getScrollElement: () => parentRef.current,
         estimateSize: (index) => flatItems[index].type === 'header' ? 44 : 96,
+        // Key measurements by row identity so filtering/collapsing doesn't reuse stale
+        // heights from whatever row previously sat at the same index
+        getItemKey: (index) => flatItems[index].id,
         overscan: 10,
     });
 
@@ -439,55 +507,35 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
                         <Select
                             value={filterPeriod}
                             onChange={(e) => setFilterPeriod(e.target.value)}
-                            options={[
-                                { value: "all_time", label: t('tests_page.filter.all_time') },
-                                { value: "today", label: t('tests_page.filter.today') },
-                                { value: "last_7_days", label: t('tests_page.filter.last_7_days') },
-                                { value: "last_30_days", label: t('tests_page.filter.last_30_days') }
-                            ]}
+                            options={periodOptions}
                             className="bg-surface/50 py-1.5 text-sm"
                             containerClassName="w-auto min-w-[130px]"
                         />
                         <Select
                             value={groupBy}
                             onChange={(e) => setGroupBy(e.target.value)}
-                            options={[
-                                { value: "none", label: `${t('tests_page.filter.group_by')}: ${t('tests_page.filter.none')}` },
-                                { value: "status", label: t('tests_page.filter.status') },
-                                { value: "device", label: t('tests_page.filter.device') },
-                                { value: "suite", label: t('tests_page.filter.suite') },
-                                { value: "os_version", label: t('tests_page.filter.os_version') }
-                            ]}
+                            options={groupByOptions}
                             className="bg-surface/50 py-1.5 text-sm"
                             containerClassName="w-auto min-w-[150px]"
                         />
                         <Select
                             value={filterStatus}
                             onChange={(e) => setFilterStatus(e.target.value)}
-                            options={[
-                                { value: "all", label: t('tests_page.filter.all_status') },
-                                ...statuses.map(s => ({ value: s, label: s }))
-                            ]}
+                            options={statusOptions}
                             className="bg-surface/50 py-1.5 text-sm"
                             containerClassName="w-auto min-w-[120px]"
                         />
                         <Select
                             value={filterDevice}
                             onChange={(e) => setFilterDevice(e.target.value)}
-                            options={[
-                                { value: "all", label: t('tests_page.filter.all_devices') },
-                                ...devices.map(d => ({ value: d, label: d }))
-                            ]}
+                            options={deviceOptions}
                             className="bg-surface/50 py-1.5 text-sm"
                             containerClassName="w-auto min-w-[150px]"
                         />
                         <Select
                             value={filterOS}
                             onChange={(e) => setFilterOS(e.target.value)}
-                            options={[
-                                { value: "all", label: t('tests_page.filter.all_os') },
-                                ...osVersions.map(o => ({ value: o, label: `Android ${o}` }))
-                            ]}
+                            options={osOptions}
                             className="bg-surface/50 py-1.5 text-sm"
                             containerClassName="w-auto min-w-[120px]"
                         />
@@ -517,7 +565,7 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
             <div ref={parentRef} className="flex-1 overflow-y-auto pr-2 relative">
                 <AnimatePresence>
                     {showCharts && (
-                        <HistoryCharts logs={filteredHistory} groupBy={groupBy} countMethod={countMethod} />
+                        <HistoryCharts logs={filteredHistory} groupBy={deferredGroupBy} countMethod={countMethod} />
                     )}
                 </AnimatePresence>
 
@@ -607,10 +655,7 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
 
                             return (
                                 <div
-                                    key={item.type === 'header'
-                                        ? `header-${item.groupName}`
-                                        : `${(item as any).run_id || (item as any).id || (item as any).path || virtualRow.index}`
-                                    }
+                                    key={virtualRow.key}
                                     data-index={virtualRow.index}
                                     ref={rowVirtualizer.measureElement}
                                     className="absolute top-0 left-0 w-full"
@@ -626,7 +671,7 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
                                             variant="ghost"
                                             className="flex items-center gap-2 w-full justify-start bg-surface-variant/30 px-3 py-2 rounded-2xl hover:bg-outline-variant transition-colors backdrop-blur-sm z-10 h-auto"
                                         >
-                                            {!collapsedGroups[item.groupName] ? <ChevronDown size={14} /> : <ChevronRight size={14} />}
+                                            {expandedGroups[item.groupName] ? <ChevronDown size={14} /> : <ChevronRight size={14} />}
                                             <span className="font-semibold text-sm text-on-surface-variant/80 flex-1 text-left">
                                                 {item.groupName === 'PASS' ? <span className="text-on-success-container/10">{item.groupName}</span> :
                                                     item.groupName === 'FAIL' ? <span className="text-error-container/80">{item.groupName}</span> : item.groupName}
@@ -659,8 +704,8 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
                                                 </div>
                                                 <div className="min-w-0 flex-1">
                                                     <div className="flex items-center gap-2 mb-1">
-                                                        <span className="font-semibold text-on-surface/80 truncate group-hover:text-primary transition-colors" title={decodeHtml(item.log.suite_name)}>
-                                                            {decodeHtml(item.log.suite_name)}
+                                                        <span className="font-semibold text-on-surface/80 truncate group-hover:text-primary transition-colors" title={item.suiteName}>
+                                                            {item.suiteName}
                                                         </span>
                                                     </div>
 
@@ -669,12 +714,12 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
                                                             <Calendar size={12} /> {formatDate(item.log.timestamp)}
                                                             <div className="flex items-center gap-1.5 ml-2">
                                                                 {item.log.xml_path && (
-                                                                    <div className="text-on-surface-variant/40" title={t('common.local_storage', "Armazenamento Local")}>
+                                                                    <div className="text-on-surface-variant/40" title={rowLabels.localStorage}>
                                                                         <HardDrive size={12} />
                                                                     </div>
                                                                 )}
                                                                 {(item.log.is_remote || item.log.has_remote_sync) && (
-                                                                    <div className="text-primary/60" title={t('common.cloud_sync', "Sincronizado na Nuvem")}>
+                                                                    <div className="text-primary/60" title={rowLabels.cloudSync}>
                                                                         <Cloud size={12} />
                                                                     </div>
                                                                 )}
@@ -691,7 +736,7 @@ export function HistorySubTab({ onNavigate }: HistorySubTabProps) {
                                                         {(item.log.device_model || item.log.device_udid) && (
                                                             <div className="flex items-center gap-1 text-on-surface/80">
                                                                 {item.log.android_version && <AndroidVersionPill version={item.log.android_version} className="bg-surface-variant/50" />}
-                                                                {item.log.device_model || t('tests_page.unknown_model')}
+                                                                {item.log.device_model || rowLabels.unknownModel}
                                                                 {item.log.device_udid ? ` (${item.log.device_udid})` : ''}
                                                             </div>
                                                         )}
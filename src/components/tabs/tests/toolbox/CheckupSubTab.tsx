@@ -56,6 +56,8 @@ export const CheckupSubTab = ({ selectedDevice, isTestRunning, allowActionsDurin
     const { t } = useTranslation();
     const { settings } = useSettings();
     const [isLoading, setIsLoading] = useState(false);
+    // File-name-safe form of the UDID used by every export, derived once per device
+    const deviceFileTag = useMemo(() => (selectedDevice || '').replace(/[^a-zA-Z0-9]/g, '_'), [selectedDevice]);
     const [comparisons, setComparisons] = useState<PropComparison[]>([]);
     const [devicePropsCache, setDevicePropsCache] = useState<Record<string, string>>({});
     const [filterDivergent, setFilterDivergent] = useState(false);
@@ -1083,7 +1085,7 @@ export const CheckupSubTab = ({ selectedDevice, isTestRunning, allowActionsDurin
 
             const filePath = await save({
                 filters: [{ name: 'JSON Golden File', extensions: ['json'] }],
-                defaultPath: `golden_${selectedDevice.replace(/[^a-zA-Z0-9]/g, '_')}.json`
+                defaultPath: `golden_${deviceFileTag}.json`
             });
 
             if (filePath) {
@@ -1109,7 +1111,7 @@ export const CheckupSubTab = ({ selectedDevice, isTestRunning, allowActionsDurin
 
             const filePath = await save({
                 filters: [{ name: 'HTML Report', extensions: ['html'] }],
-                defaultPath: `report_${selectedDevice.replace(/[^a-zA-Z0-9]/g, '_')}_${new Date().toISOString().split('T')[0]}.html`
+                defaultPath: `report_${deviceFileTag}_${new Date().toISOString().split('T')[0]}.html`
             });
 
             if (filePath) {
@@ -1211,7 +1213,7 @@ ${html}`;
 
             const filePath = await save({
                 filters: [{ name: 'HTML Report', extensions: ['html'] }],
-                defaultPath: `report_${selectedDevice.replace(/[^a-zA-Z0-9]/g, '_')}_verified_${new Date().toISOString().split('T')[0]}.html`
+                defaultPath: `report_${deviceFileTag}_verified_${new Date().toISOString().split('T')[0]}.html`
             });
 
             if (filePath) {
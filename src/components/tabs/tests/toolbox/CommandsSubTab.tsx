@@ -10,6 +10,11 @@ import { Button } from "@/components/atoms/Button";
 import { Input } from "@/components/atoms/Input";
 import { DropdownMenu } from "@/components/molecules/DropdownMenu";
 
+// How long command output is allowed to accumulate before it is appended to the history
+const COMMAND_OUTPUT_FLUSH_MS = 50;
+// Lines kept in the console; older output is dropped once a long-running command passes this
+const MAX_HISTORY_LINES = 5000;
+
 interface CommandsSubTabProps {
     selectedDevice: string;
     isTestRunning?: boolean;
@@ -25,11 +30,21 @@ interface SavedCommand {
 export function CommandsSubTab({ selectedDevice, isTestRunning = false, allowActionsDuringTest = false }: CommandsSubTabProps) {
     const { t } = useTranslation();
     const [command, setCommand] = useState("");
-    const [history, setHistory] = useState<string[]>([]);
+    // Only the newest lines are kept on screen; `dropped` counts the ones trimmed from the front so
+    // row keys stay stable and the surviving rows are not re-rendered when the window slides
+    const [history, setHistory] = useState<{ lines: string[], dropped: number }>({ lines: [], dropped: 0 });
+    const appendHistory = (added: string[]) => setHistory(prev => {
+        const lines = prev.lines.concat(added);
+        const overflow = lines.length - MAX_HISTORY_LINES;
+        return overflow > 0
+            ? { lines: lines.slice(overflow), dropped: prev.dropped + overflow }
+            : { lines, dropped: prev.dropped };
+    });
     const [isExecuting, setIsExecuting] = useState(false);
     const [savedCommands, setSavedCommands] = useState<SavedCommand[]>([]);
     const [currentCmdId, setCurrentCmdId] = useState<string | null>(null);
     const historyRef = useRef<HTMLDivElement>(null);
+    const scrollOnNextRenderRef = useRef(false);
 
     // Save Command Modal State
     const [isSaveModalOpen, setIsSaveModalOpen] = useState(false);
@@ -97,15 +112,36 @@ export function CommandsSubTab({ selectedDevice, isTestRunning = false, allowAct
         const cmdId = `cmd_${Date.now()}_${Math.random().toString(36).substr(2, 5)}`;
         setCurrentCmdId(cmdId);
         setIsExecuting(true);
-        setHistory(prev => [...prev, `> ${label || cmdStr}`]);
+        // Auto-scroll on start: the auto-scroll effect jumps to the bottom once the prompt line renders
+        scrollOnNextRenderRef.current = true;
+        appendHistory([`> ${label || cmdStr}`]);
 
         try {
+            // Output lines are queued and appended in one state update per flush, so a chatty
+            // command does not copy the whole history once per line
+            const pendingLines: string[] = [];
+            let flushTimer: ReturnType<typeof setTimeout> | null = null;
+            const flushOutput = () => {
+                if (flushTimer !== null) {
+                    clearTimeout(flushTimer);
+                    flushTimer = null;
+                }
+                if (pendingLines.length === 0) return;
+                const batch = pendingLines.splice(0);
+                appendHistory(batch);
+            };
+
             // Setup listeners
-            const unlistenOutput = await listen<string>(`cmd-output-${cmdId}`, (event) => {
-                setHistory(prev => [...prev, event.payload]);
+            const unlistenOutput = await listen<string[]>(`cmd-output-${cmdId}`, (event) => {
+                for (const line of event.payload) pendingLines.push(line);
+                if (flushTimer === null) {
+                    flushTimer = setTimeout(flushOutput, COMMAND_OUTPUT_FLUSH_MS);
+                }
             });
             const unlistenClose = await listen<string>(`cmd-close-${cmdId}`, (event) => {
-                setHistory(prev => [...prev, `[Process exited: ${event.payload}]`]);
+                // Land any queued output before the exit marker so order is preserved
+                flushOutput();
+                appendHistory([`[Process exited: ${event.payload}]`]);
                 setIsExecuting(false);
                 setCurrentCmdId(null);
                 // remove listeners
@@ -116,11 +152,6 @@ export function CommandsSubTab({ selectedDevice, isTestRunning = false, allowAct
 
             listenersRef.current.push(unlistenOutput, unlistenClose);
 
-            // Auto-scroll on start
-            setTimeout(() => {
-                if (historyRef.current) historyRef.current.scrollTop = historyRef.current.scrollHeight;
-            }, 100);
-
             await invoke("start_adb_command", {
                 id: cmdId,
                 device: selectedDevice,
@@ -128,7 +159,7 @@ export function CommandsSubTab({ selectedDevice, isTestRunning = false, allowAct
             });
 
         } catch (e) {
-            setHistory(prev => [...prev, `Error: ${e}`]);
+            appendHistory([`Error: ${e}`]);
             setIsExecuting(false);
             setCurrentCmdId(null);
         }
@@ -139,8 +170,10 @@ export function CommandsSubTab({ selectedDevice, isTestRunning = false, allowAct
         const el = historyRef.current;
         if (!el) return;
 
+        const forceScroll = scrollOnNextRenderRef.current;
+        scrollOnNextRenderRef.current = false;
         const isAtBottom = el.scrollHeight - el.scrollTop - el.clientHeight < 100;
-        if (isAtBottom) {
+        if (forceScroll || isAtBottom) {
             el.scrollTop = el.scrollHeight;
         }
     }, [history]);
@@ -149,7 +182,7 @@ export function CommandsSubTab({ selectedDevice, isTestRunning = false, allowAct
         if (currentCmdId) {
             try {
                 await invoke('stop_adb_command', { id: currentCmdId });
-                setHistory(prev => [...prev, "^ Cancelled by user"]);
+                appendHistory(["^ Cancelled by user"]);
             } catch (e) {
                 feedback.toast.error("commands.cancel_error", e);
             }
@@ -170,7 +203,7 @@ export function CommandsSubTab({ selectedDevice, isTestRunning = false, allowAct
 
     const handleConnectWifi = async () => {
         setIsExecuting(true);
-        setHistory(prev => [...prev, `> Connecting over Wi-Fi...`]);
+        appendHistory([`> Connecting over Wi-Fi...`]);
         try {
             // 1. Fetch IP Address
             const output = await invoke<string>('run_adb_command', { 
@@ -181,10 +214,10 @@ export function CommandsSubTab({ selectedDevice, isTestRunning = false, allowAct
             
             if (ipMatch && ipMatch[1]) {
                 const ip = ipMatch[1];
-                setHistory(prev => [...prev, `> Device IP found: ${ip}`]);
+                appendHistory([`> Device IP found: ${ip}`]);
                 
                 // 2. Restart ADB in tcpip mode
-                setHistory(prev => [...prev, `> tcpip 5555`]);
+                appendHistory([`> tcpip 5555`]);
                 await invoke("start_adb_command", {
                     id: `cmd_tcpip_${Date.now()}`,
                     device: selectedDevice,
@@ -195,16 +228,16 @@ export function CommandsSubTab({ selectedDevice, isTestRunning = false, allowAct
                 await new Promise(r => setTimeout(r, 3000));
 
                 // 4. Connect
-                setHistory(prev => [...prev, `> adb connect ${ip}:5555`]);
+                appendHistory([`> adb connect ${ip}:5555`]);
                 const result = await invoke<string>('adb_connect', { target: `${ip}:5555` });
-                setHistory(prev => [...prev, result]);
+                appendHistory([result]);
                 feedback.toast.success(t('common.connect_wifi_success', 'Wi-Fi connection established'));
             } else {
-                setHistory(prev => [...prev, `> Failed to find device IP address on wlan0`]);
+                appendHistory([`> Failed to find device IP address on wlan0`]);
                 feedback.toast.error("Could not find Wi-Fi IP address");
             }
         } catch (e) {
-            setHistory(prev => [...prev, `> Error: ${String(e)}`]);
+            appendHistory([`> Error: ${String(e)}`]);
             feedback.toast.error("Wi-Fi connection error", e);
         } finally {
             setIsExecuting(false);
@@ -283,7 +316,7 @@ export function CommandsSubTab({ selectedDevice, isTestRunning = false, allowAct
                             <Wifi size={16} />
                         </Button>
                         <Button
-                            onClick={() => setHistory([])}
+                            onClick={() => setHistory({ lines: [], dropped: 0 })}
                             variant="ghost"
                             size="icon"
                             className="p-1 hover:text-error text-on-surface-variant/80"
@@ -301,14 +334,14 @@ export function CommandsSubTab({ selectedDevice, isTestRunning = false, allowAct
                 ref={historyRef}
                 className="relative flex-1 min-h-0 bg-surface text-on-surface/50 font-mono text-xs rounded-2xl border border-outline-variant/30 p-4 overflow-y-auto on-primaryspace-pre-wrap custom-scrollbar"
             >
-                {history.length === 0 && (
+                {history.lines.length === 0 && (
                     <div className="absolute inset-0 flex flex-col items-center justify-center text-on-surface-variant/80 font-sans text-sm">
                         <Terminal size={32} className="opacity-20 mb-2" />
                         <p>{isTestRunning ? t('commands.status.test_running', "Test execution in progress") : t('commands.waiting')}</p>
                     </div>
                 )}
-                {history.map((line, i) => (
-                    <div key={i} className="text-on-surface/80 on-primaryspace-pre-wrap break-all">
+                {history.lines.map((line, i) => (
+                    <div key={history.dropped + i} className="text-on-surface/80 on-primaryspace-pre-wrap break-all">
                         {line.startsWith('>') ? <span className="text-primary dark:text-primary/80 font-bold">{line}</span> : line}
                     </div>
                 ))}
@@ -359,6 +359,7 @@ export function DmesgSubTab({ selectedDevice, isTestRunning = false, allowAction
                         className="custom-scrollbar"
                         followOutput="auto"
                         atBottomThreshold={50}
+                        defaultItemHeight={20}
                         itemContent={(_, log) => (
                             <div className="on-primaryspace-pre-wrap hover:bg-surface-variant/30 px-2 py-0.5 break-all transition-colors">
                                 {log.startsWith(t('feedback.saved_to_prefix')) ? (
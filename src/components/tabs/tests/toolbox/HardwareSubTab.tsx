@@ -8,7 +8,7 @@ import { Switch } from '@/components/atoms/Switch';
 import { Select } from '@/components/atoms/Select';
 import { Battery, BatteryWarning, Wifi, Send, Plane, Signal, Moon, BellOff, VolumeX, Smartphone, Monitor, Keyboard, Link2, Shield, Globe2, Home, ArrowLeft, Square, Power, Volume2, Volume1, Camera, Locate, Bell, HardDrive } from 'lucide-react';
 import { Section } from '@/components/organisms/Section';
-import { useSettings } from '@/lib/settings';
+import { useSettings, getAppPackages } from '@/lib/settings';
 interface HardwareSubTabProps {
     selectedDevice: string | null;
     isTestRunning: boolean;
@@ -20,7 +20,7 @@ export function HardwareSubTab({ selectedDevice, isTestRunning, allowActionsDuri
     const { settings } = useSettings();
     const disabled = !selectedDevice || (isTestRunning && !allowActionsDuringTest);
 
-    const appPackages = settings.tools.appPackage.split(',').map(s => s.trim()).filter(Boolean);
+    const appPackages = getAppPackages(settings.tools.appPackage);
     const [targetPackage, setTargetPackage] = useState(appPackages[0] || '');
 
     const [textInput, setTextInput] = useState('');
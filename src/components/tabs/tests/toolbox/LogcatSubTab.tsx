@@ -6,7 +6,7 @@ import { useTranslation } from "react-i18next";
 import { invoke } from "@tauri-apps/api/core";
 import { listen, type UnlistenFn } from "@tauri-apps/api/event";
 
-import { useSettings } from "@/lib/settings";
+import { useSettings, getAppPackages } from "@/lib/settings";
 import { feedback } from "@/lib/feedback";
 import { FileSavedFeedback } from "@/components/molecules/FileSavedFeedback";
 import { Section } from "@/components/organisms/Section";
@@ -162,7 +162,7 @@ export function LogcatSubTab({ selectedDevice, isTestRunning = false, allowActio
 
     const [selectedPackage, setSelectedPackage] = useState(() => {
         if (settings.logcatSelectedPackage !== undefined) return settings.logcatSelectedPackage;
-        const pkgs = settings.tools.appPackage ? settings.tools.appPackage.split(',').map(p => p.trim()).filter(p => p.length > 0) : [];
+        const pkgs = getAppPackages(settings.tools.appPackage);
         return pkgs.length > 0 ? pkgs[0] : "";
     });
     const [logLevel, setLogLevel] = useState(settings.logcatLevel || "E");
@@ -458,6 +458,7 @@ export function LogcatSubTab({ selectedDevice, isTestRunning = false, allowActio
                         className="custom-scrollbar"
                         followOutput="auto"
                         atBottomThreshold={50} // If user scrolls up, stop auto-scrolling
+                        defaultItemHeight={20} // Single text-xs line; skips the probe render used to guess row size
                         itemContent={(_, log) => (
                             <div className="on-primaryspace-pre-wrap hover:bg-surface-variant/30 px-2 py-0.5 break-all transition-colors flex gap-2">
                                 <div className="select-none text-on-surface-variant/40 text-[10px] min-w-[36px] text-right pt-[1px] font-mono shrink-0">
@@ -513,7 +514,7 @@ export function LogcatSubTab({ selectedDevice, isTestRunning = false, allowActio
                         <Select
                             options={[
                                 { label: t('logcat.entire_system'), value: "" },
-                                ...(settings.tools?.appPackage ? settings.tools.appPackage.split(',') : []).map(p => ({ label: p.trim(), value: p.trim() })).filter(o => o.value)
+                                ...getAppPackages(settings.tools?.appPackage).map(p => ({ label: p, value: p }))
                             ]}
                             value={selectedPackage}
                             onChange={(e) => {
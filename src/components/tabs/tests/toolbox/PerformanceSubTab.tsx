@@ -5,7 +5,7 @@ import { open } from "@tauri-apps/plugin-dialog";
 import { AlertTriangle, Activity, Cpu, Battery, CircuitBoard, Play, Square, Package as PackageIcon, Eye, EyeOff, RefreshCw, Zap, FolderSearch, Settings, ListTree, ChevronUp, ChevronDown, ChevronRight, Columns2 } from "lucide-react";
 import clsx from "clsx";
 import { AreaChart, Area, XAxis, YAxis, CartesianGrid, Tooltip as RechartsTooltip, ResponsiveContainer } from "recharts";
-import { useSettings } from "@/lib/settings";
+import { useSettings, getAppPackages } from "@/lib/settings";
 import { feedback } from "@/lib/feedback";
 import { WarningModal } from "@/components/organisms/WarningModal";
 
@@ -262,9 +262,7 @@ export const PerformanceSubTab = React.memo(function PerformanceSubTab({
     };
 
     // Parse configured packages
-    const appPackages = settings.tools.appPackage
-        ? settings.tools.appPackage.split(',').map((p: string) => p.trim()).filter(Boolean)
-        : [];
+    const appPackages = getAppPackages(settings.tools.appPackage);
 
     const handleToggleRecording = () => {
         // If trying to start recording during a test without allowance
@@ -7,7 +7,7 @@ import { Button } from "@/components/atoms/Button";
 import { Select } from "@/components/atoms/Select";
 import { TagInput } from "@/components/atoms/TagInput";
 import { Section } from "@/components/organisms/Section";
-import { useSettings } from "@/lib/settings";
+import { useSettings, getAppPackages } from "@/lib/settings";
 
 function formatDelta(deltaMs: number, unit: 'ms' | 's' | 'min' | 'h'): string {
     switch (unit) {
@@ -332,7 +332,7 @@ export function StopwatchSubTab({ selectedDevice, isTestRunning = false, allowAc
                         <Select
                             options={[
                                 { label: t('logcat.entire_system', 'Entire System'), value: "" },
-                                ...(settings.tools?.appPackage ? settings.tools.appPackage.split(',') : []).map(p => ({ label: p.trim(), value: p.trim() })).filter(o => o.value)
+                                ...getAppPackages(settings.tools?.appPackage).map(p => ({ label: p, value: p }))
                             ]}
                             value={selectedPackage}
                             onChange={(e) => {
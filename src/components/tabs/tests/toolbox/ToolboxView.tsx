@@ -1,4 +1,4 @@
-import { useState, useEffect, useRef } from "react";
+import { useState, useEffect, useRef, useMemo } from "react";
 import { AlignLeft, Terminal, Cpu, Cast, FileText, StopCircle, RefreshCcw, Camera, Video, Square, LayoutGrid, Minimize2, Maximize2, Package, Globe, Activity, Timer, ShieldCheck } from "lucide-react";
 import clsx from "clsx";
 import { invoke } from "@tauri-apps/api/core";
@@ -41,6 +41,20 @@ export function ToolboxView({ session, isCompact = false, onNavigate }: ToolboxV
     const isMirrorDisabled = systemCheckStatus?.missingMirroring?.length > 0;
     const isWebMode = session.androidVersion === 'web';
 
+    // The view re-renders on every batch of session output; resolve tool names once per language
+    const toolLabels = useMemo<Record<ToolTab | 'dmesg', string>>(() => ({
+        console: t('toolbox.tabs.console'),
+        logcat: t('toolbox.tabs.logcat'),
+        dmesg: "Kernel Logs",
+        commands: t('toolbox.tabs.commands'),
+        performance: t('toolbox.tabs.performance'),
+        stopwatch: t('toolbox.tabs.stopwatch', 'Stopwatch'),
+        apps: t('toolbox.tabs.apps'),
+        hardware: "Hardware",
+        webview: t('toolbox.tabs.webview', 'Webview'),
+        checkup: t('toolbox.tabs.checkup', 'Checkup')
+    }), [t]);
+
     const [activeTool, setActiveTool] = useState<ToolTab>(
         (session.lastActiveTool as ToolTab) || (session.type === 'test' ? 'console' : (isWebMode ? 'webview' : 'logcat'))
     );
@@ -49,25 +63,41 @@ export function ToolboxView({ session, isCompact = false, onNavigate }: ToolboxV
         isWebMode ? new Set(['console', 'webview']) : new Set(['console', 'logcat', 'performance', 'hardware', 'checkup'])
     );
 
+    // Tools mount the first time they are shown and then stay mounted (hidden) to keep their state;
+    // a session that never opens e.g. Hardware or Checkup doesn't pay for building them
+    const [visitedTools, setVisitedTools] = useState<Set<ToolTab>>(() => new Set([activeTool]));
+    useEffect(() => {
+        const shown = isGridView ? Array.from(visibleToolsInGrid) : [activeTool];
+        setVisitedTools(prev => shown.every(tool => prev.has(tool)) ? prev : new Set([...prev, ...shown]));
+    }, [activeTool, isGridView, visibleToolsInGrid]);
+
     // Responsive State
+    // Calculate isNarrow based on container width AND session type
+    // If running a test, we have big "Stop" / "Rerun" buttons, so we need more space (higher threshold)
+    const narrowThreshold = session.type === 'test' ? 1000 : 700;
+    const narrowThresholdRef = useRef(narrowThreshold);
+    narrowThresholdRef.current = narrowThreshold;
     const containerRef = useRef<HTMLDivElement>(null);
-    const [containerWidth, setContainerWidth] = useState(1000);
+    // The observer fires on every frame of a drag-resize; only the narrow/wide flag is kept in
+    // state, so the whole toolbox re-renders when the threshold is crossed rather than per pixel
+    const containerWidthRef = useRef(1000);
+    const [isNarrow, setIsNarrow] = useState(() => containerWidthRef.current < narrowThreshold);
 
     useEffect(() => {
         if (!containerRef.current) return;
         const observer = new ResizeObserver((entries) => {
             for (const entry of entries) {
-                setContainerWidth(entry.contentRect.width);
+                containerWidthRef.current = entry.contentRect.width;
+                setIsNarrow(entry.contentRect.width < narrowThresholdRef.current);
             }
         });
         observer.observe(containerRef.current);
         return () => observer.disconnect();
     }, []);
 
-    // Calculate isNarrow based on container width AND session type
-    // If running a test, we have big "Stop" / "Rerun" buttons, so we need more space (higher threshold)
-    const narrowThreshold = session.type === 'test' ? 1000 : 700;
-    const isNarrow = containerWidth < narrowThreshold;
+    useEffect(() => {
+        setIsNarrow(containerWidthRef.current < narrowThreshold);
+    }, [narrowThreshold]);
 
     // If session type/run changes (recycling), switch to console
     // If session run changes (new test via recycling), switch to console
@@ -303,74 +333,74 @@ setVisibleToolsInGrid(isWebMode ? new Set(['console', 'webview']) : new Set(['co
                 tabs={isWebMode ? [
                     ...(session.type === 'test' ? [{
                         id: 'console',
-                        label: (!isCompact && !isNarrow) ? t('toolbox.tabs.console') : "",
+                        label: (!isCompact && !isNarrow) ? toolLabels.console : "",
                         icon: FileText,
                         selected: isGridView ? visibleToolsInGrid.has('console') : activeTool === 'console',
-                        tooltip: (isCompact || isNarrow) ? t('toolbox.tabs.console') : undefined
+                        tooltip: (isCompact || isNarrow) ? toolLabels.console : undefined
                     }] : []),
                     {
                         id: 'webview',
-                        label: (!isCompact && !isNarrow) ? t('toolbox.tabs.webview', 'Webview') : "",
+                        label: (!isCompact && !isNarrow) ? toolLabels.webview : "",
                         icon: Globe,
                         selected: isGridView ? visibleToolsInGrid.has('webview') : activeTool === 'webview',
-                        tooltip: (isCompact || isNarrow) ? t('toolbox.tabs.webview', 'Webview') : undefined
+                        tooltip: (isCompact || isNarrow) ? toolLabels.webview : undefined
                     }
                 ] : [
                     ...(session.type === 'test' ? [{
                         id: 'console',
-                        label: (!isCompact && !isNarrow) ? t('toolbox.tabs.console') : "",
+                        label: (!isCompact && !isNarrow) ? toolLabels.console : "",
                         icon: FileText,
                         selected: isGridView ? visibleToolsInGrid.has('console') : activeTool === 'console',
-                        tooltip: (isCompact || isNarrow) ? t('toolbox.tabs.console') : undefined
+                        tooltip: (isCompact || isNarrow) ? toolLabels.console : undefined
                     }] : []),
                     {
                         id: 'logcat',
-                        label: (!isCompact && !isNarrow) ? t('toolbox.tabs.logcat') : "",
+                        label: (!isCompact && !isNarrow) ? toolLabels.logcat : "",
                         icon: AlignLeft,
                         selected: isGridView ? visibleToolsInGrid.has('logcat') : activeTool === 'logcat',
-                        tooltip: (isCompact || isNarrow) ? t('toolbox.tabs.logcat') : undefined
+                        tooltip: (isCompact || isNarrow) ? toolLabels.logcat : undefined
                     },
                     {
                         id: 'performance',
-                        label: (!isCompact && !isNarrow) ? t('toolbox.tabs.performance') : "",
+                        label: (!isCompact && !isNarrow) ? toolLabels.performance : "",
                         icon: Activity,
                         selected: isGridView ? visibleToolsInGrid.has('performance') : activeTool === 'performance',
-                        tooltip: (isCompact || isNarrow) ? t('toolbox.tabs.performance') : undefined
+                        tooltip: (isCompact || isNarrow) ? toolLabels.performance : undefined
                     },
                     {
                         id: 'stopwatch',
-                        label: (!isCompact && !isNarrow) ? t('toolbox.tabs.stopwatch', 'Stopwatch') : "",
+                        label: (!isCompact && !isNarrow) ? toolLabels.stopwatch : "",
                         icon: Timer,
                         selected: isGridView ? visibleToolsInGrid.has('stopwatch') : activeTool === 'stopwatch',
-                        tooltip: (isCompact || isNarrow) ? t('toolbox.tabs.stopwatch', 'Stopwatch') : undefined
+                        tooltip: (isCompact || isNarrow) ? toolLabels.stopwatch : undefined
                     },
                     {
                         id: 'commands',
-                        label: (!isCompact && !isNarrow) ? t('toolbox.tabs.commands') : "",
+                        label: (!isCompact && !isNarrow) ? toolLabels.commands : "",
                         icon: Terminal,
                         selected: isGridView ? visibleToolsInGrid.has('commands') : activeTool === 'commands',
-                        tooltip: (isCompact || isNarrow) ? t('toolbox.tabs.commands') : undefined
+                        tooltip: (isCompact || isNarrow) ? toolLabels.commands : undefined
                     },
                     {
                         id: 'apps',
-                        label: (!isCompact && !isNarrow) ? t('toolbox.tabs.apps') : "",
+                        label: (!isCompact && !isNarrow) ? toolLabels.apps : "",
                         icon: Package,
                         selected: isGridView ? visibleToolsInGrid.has('apps') : activeTool === 'apps',
-                        tooltip: (isCompact || isNarrow) ? t('toolbox.tabs.apps') : undefined
+                        tooltip: (isCompact || isNarrow) ? toolLabels.apps : undefined
                     },
                     {
                         id: 'hardware',
-                        label: (!isCompact && !isNarrow) ? "Hardware" : "",
+                        label: (!isCompact && !isNarrow) ? toolLabels.hardware : "",
                         icon: Cpu, // We'll change to something else if needed, like Battery or Server
                         selected: isGridView ? visibleToolsInGrid.has('hardware') : activeTool === 'hardware',
-                        tooltip: (isCompact || isNarrow) ? "Hardware" : undefined
+                        tooltip: (isCompact || isNarrow) ? toolLabels.hardware : undefined
                     },
                     {
                         id: 'checkup',
-                        label: (!isCompact && !isNarrow) ? t('toolbox.tabs.checkup', 'Checkup') : "",
+                        label: (!isCompact && !isNarrow) ? toolLabels.checkup : "",
                         icon: ShieldCheck,
                         selected: isGridView ? visibleToolsInGrid.has('checkup') : activeTool === 'checkup',
-                        tooltip: (isCompact || isNarrow) ? t('toolbox.tabs.checkup', 'Checkup') : undefined
+                        tooltip: (isCompact || isNarrow) ? toolLabels.checkup : undefined
                     }
                 ]}
                 activeId={activeTool}
@@ -562,23 +592,13 @@ setVisibleToolsInGrid(isWebMode ? new Set(['console', 'webview']) : new Set(['co
                         style={isGridView && !useAutoRows ? { gridAutoRows: '400px' } : undefined}
                     >
                         {(() => {
-                            const titleMap: Record<string, string> = {
-                        'console': t('toolbox.tabs.console'),
-                        'logcat': t('toolbox.tabs.logcat'),
-                        'dmesg': "Kernel Logs",
-                        'commands': t('toolbox.tabs.commands'),
-                        'performance': t('toolbox.tabs.performance'),
-                        'stopwatch': t('toolbox.tabs.stopwatch', 'Stopwatch'),
-                        'apps': t('toolbox.tabs.apps'),
-                        'hardware': "Hardware",
-                        'webview': t('toolbox.tabs.webview', 'Webview'),
-                        'checkup': t('toolbox.tabs.checkup', 'Checkup')
-                    };
+                            const titleMap: Record<string, string> = toolLabels;
 
                     return allTools.map((tool) => {
                         const isVisibleInGrid = isGridView && visibleToolsInGrid.has(tool) && (tool !== 'console' || session.type === 'test');
                         const isVisibleSingle = !isGridView && activeTool === tool;
                         const isVisible = isVisibleInGrid || isVisibleSingle;
+                        if (!isVisible && !visitedTools.has(tool)) return null;
 
                         const isOddIn2Col = isGridView && !isThreeCols && (visibleToolsInGridArray.length % 2 !== 0) && (visibleToolsInGridArray[visibleToolsInGridArray.length - 1] === tool);
 
@@ -1,11 +1,17 @@
 
-import { useState, useEffect, useRef, useCallback } from 'react';
+import { useState, useEffect, useRef, useCallback, useMemo } from 'react';
 import { invoke } from '@tauri-apps/api/core';
-import { XMLParser } from 'fast-xml-parser';
-import { InspectorNode, transformXmlToTree, findNodesAtCoords } from '@/lib/inspectorUtils';
+import { InspectorNode, transformXmlToTree, findNodesAtCoords, uiDumpParser } from '@/lib/inspectorUtils';
 import { feedback } from '@/lib/feedback';
 import { useSettings } from '@/lib/settings';
 
+// Quiet period after the last image resize before the overlay layout is re-measured
+const RESIZE_SETTLE_MS = 100;
+
+// Shared empty candidate list; re-clearing an already empty list then keeps the same reference
+// and React skips the render (auto-refresh clears it on every tick)
+const NO_NODES: InspectorNode[] = [];
+
 interface DeviceViewportOptions {
     deviceId: string | null;
     isActive: boolean;
@@ -38,7 +44,7 @@ export function useDeviceViewport({
     const [rootNode, setRootNode] = useState<InspectorNode | null>(null);
     const [xmlDump, setXmlDump] = useState<string | null>(null);
     const [loading, setLoading] = useState(false);
-    const [imgLayout, setImgLayout] = useState<{ width: number, height: number, naturalWidth: number, naturalHeight: number } | null>(null);
+    const [imgLayout, setImgLayoutState] = useState<{ width: number, height: number, naturalWidth: number, naturalHeight: number } | null>(null);
     const [selectedNode, setSelectedNode] = useState<InspectorNode | null>(null);
     const [hoveredNode, setHoveredNode] = useState<InspectorNode | null>(null);
 
@@ -49,10 +55,24 @@ export function useDeviceViewport({
     const [swipeStartTime, setSwipeStartTime] = useState<number | null>(null);
     const [isDragging, setIsDragging] = useState(false);
 
+    // Every new screenshot fires the image load handler again, usually with the same frame size;
+    // keeping the previous layout object spares the overlays and hit-testing callbacks a re-render
+    const setImgLayout = useCallback((next: { width: number, height: number, naturalWidth: number, naturalHeight: number } | null) => {
+        setImgLayoutState(prev => (
+            prev && next &&
+            prev.width === next.width &&
+            prev.height === next.height &&
+            prev.naturalWidth === next.naturalWidth &&
+            prev.naturalHeight === next.naturalHeight
+        ) ? prev : next);
+    }, []);
+
     const imgRef = useRef<HTMLImageElement>(null);
     const prevBusy = useRef(isBusy);
+    // Last dump and the tree built from it, so an unchanged screen is not parsed again
+    const lastDumpRef = useRef<{ xml: string, root: InspectorNode } | null>(null);
 
-    const [availableNodes, setAvailableNodes] = useState<InspectorNode[]>([]);
+    const [availableNodes, setAvailableNodes] = useState<InspectorNode[]>(NO_NODES);
 
     const refreshAll = useCallback(async (compressed: boolean = true, forceClearScreenshot: boolean = false, targetWebUrl?: string) => {
         if (!deviceId) return;
@@ -61,7 +81,7 @@ export function useDeviceViewport({
         // Immediately clear selection and hover elements to avoid showing stale highlighter boundaries
         setSelectedNode(null);
         setHoveredNode(null);
-        setAvailableNodes([]);
+        setAvailableNodes(NO_NODES);
         if (onNodeSelected) onNodeSelected(null);
         if (onNodeHovered) onNodeHovered(null);
 
@@ -98,13 +118,14 @@ export function useDeviceViewport({
 
             const xml = xmlResult.value;
             setXmlDump(xml);
-            const parser = new XMLParser({
-                ignoreAttributes: false,
-                attributeNamePrefix: "",
-                textNodeName: "_text"
-            });
-            const jsonObj = parser.parse(xml);
-            const root = jsonObj.hierarchy ? transformXmlToTree(jsonObj.hierarchy) : transformXmlToTree(jsonObj);
+            let root: InspectorNode;
+            if (lastDumpRef.current?.xml === xml) {
+                root = lastDumpRef.current.root;
+            } else {
+                const jsonObj = uiDumpParser.parse(xml);
+                root = jsonObj.hierarchy ? transformXmlToTree(jsonObj.hierarchy) : transformXmlToTree(jsonObj);
+                lastDumpRef.current = { xml, root };
+            }
             setRootNode(root);
 
             // If screenshot failed, we need to set a fallback layout so interactions work
@@ -152,17 +173,45 @@ export function useDeviceViewport({
 
     // Reset viewport state when device changes to prevent stale layout/screenshot leak between devices
     useEffect(() => {
+        lastDumpRef.current = null;
         setScreenshot(null);
         setRootNode(null);
         setXmlDump(null);
         setSelectedNode(null);
         setHoveredNode(null);
-        setAvailableNodes([]);
+        setAvailableNodes(NO_NODES);
         setImgLayout(null);
         if (onNodeSelected) onNodeSelected(null);
         if (onNodeHovered) onNodeHovered(null);
     }, [deviceId]);
 
+    // Keep the overlay layout in step with the rendered image when the pane is resized. Only the
+    // displayed size is re-read (after the drag settles); the dump and screenshot are left alone
+    useEffect(() => {
+        const img = imgRef.current;
+        if (!img || !screenshot) return;
+
+        let resizeTimer: ReturnType<typeof setTimeout> | undefined;
+        const observer = new ResizeObserver(() => {
+            clearTimeout(resizeTimer);
+            resizeTimer = setTimeout(() => {
+                if (!img.naturalWidth || !img.naturalHeight) return;
+                setImgLayout({
+                    width: img.clientWidth,
+                    height: img.clientHeight,
+                    naturalWidth: img.naturalWidth,
+                    naturalHeight: img.naturalHeight
+                });
+            }, RESIZE_SETTLE_MS);
+        });
+        observer.observe(img);
+
+        return () => {
+            clearTimeout(resizeTimer);
+            observer.disconnect();
+        };
+    }, [screenshot, setImgLayout]);
+
     // Handle auto-refresh on activation or busy state change
     useEffect(() => {
         if (!deviceId) {
@@ -170,7 +219,7 @@ export function useDeviceViewport({
             setRootNode(null);
             setXmlDump(null);
             setSelectedNode(null);
-            setAvailableNodes([]);
+            setAvailableNodes(NO_NODES);
             prevBusy.current = isBusy;
             return;
         }
@@ -232,36 +281,31 @@ export function useDeviceViewport({
         }
     }, [deviceId, isBusy, is_test_mode, refreshAll]);
 
+    // Natural image pixels -> device (XML) coordinates. Only changes with a new dump or image,
+    // so pointer moves reuse it instead of re-deriving it from the root bounds each time
+    const naturalToDeviceScale = useMemo(() => {
+        if (!imgLayout || !rootNode?.bounds || imgLayout.naturalWidth <= 0 || imgLayout.naturalHeight <= 0) {
+            return { x: 1, y: 1 };
+        }
+        return {
+            x: rootNode.bounds.w / imgLayout.naturalWidth,
+            y: rootNode.bounds.h / imgLayout.naturalHeight
+        };
+    }, [rootNode, imgLayout]);
+
     const getCoords = useCallback((e: React.MouseEvent<HTMLElement>) => {
         if (!imgRef.current || !imgLayout) return null;
         const rect = imgRef.current.getBoundingClientRect();
-        
-        // Coords in Natural space (the resized dimensions)
-        const scaleX = imgLayout.naturalWidth / rect.width;
-        const scaleY = imgLayout.naturalHeight / rect.height;
-        const naturalX = (e.clientX - rect.left) * scaleX;
-        const naturalY = (e.clientY - rect.top) * scaleY;
-
-        // If we have a rootNode, we should scale back to its coordinate system (original device size)
-        if (rootNode?.bounds) {
-            const xmlW = rootNode.bounds.w;
-            const xmlH = rootNode.bounds.h;
-            const imgW = imgLayout.naturalWidth;
-            const imgH = imgLayout.naturalHeight;
-
-            if (imgW > 0 && imgH > 0) {
-                return {
-                    x: Math.round((naturalX / imgW) * xmlW),
-                    y: Math.round((naturalY / imgH) * xmlH)
-                };
-            }
-        }
+
+        // Rendered pixels -> natural pixels -> device coordinates, folded into one factor per axis
+        const scaleX = (imgLayout.naturalWidth / rect.width) * naturalToDeviceScale.x;
+        const scaleY = (imgLayout.naturalHeight / rect.height) * naturalToDeviceScale.y;
 
         return {
-            x: Math.round(naturalX),
-            y: Math.round(naturalY)
+            x: Math.round((e.clientX - rect.left) * scaleX),
+            y: Math.round((e.clientY - rect.top) * scaleY)
         };
-    }, [rootNode, imgLayout]);
+    }, [imgLayout, naturalToDeviceScale]);
 
     const processInteractionAt = useCallback((coords: { x: number, y: number }, isHover: boolean) => {
         if (!rootNode) return;
@@ -335,7 +379,7 @@ export function useDeviceViewport({
                     // Immediately clear selection and hover elements to avoid showing stale highlighter boundaries
                     setSelectedNode(null);
                     setHoveredNode(null);
-                    setAvailableNodes([]);
+                    setAvailableNodes(NO_NODES);
                     if (onNodeSelected) onNodeSelected(null);
                     if (onNodeHovered) onNodeHovered(null);
 
@@ -375,7 +419,7 @@ export function useDeviceViewport({
                 // Immediately clear selection and hover elements to avoid showing stale highlighter boundaries
                 setSelectedNode(null);
                 setHoveredNode(null);
-                setAvailableNodes([]);
+                setAvailableNodes(NO_NODES);
                 if (onNodeSelected) onNodeSelected(null);
                 if (onNodeHovered) onNodeHovered(null);
 
@@ -27,6 +27,26 @@ export interface DeviceStats {
 }
 
 
+const pad2 = (n: number) => n.toString().padStart(2, '0');
+
+/**
+ * Formats one stream sample as a CSV row matching the header written at recording start.
+ */
+function formatRecordingLine(stats: DeviceStats, elapsedMs: number, hasAppColumns: boolean): string {
+    const hrs = Math.floor(elapsedMs / 3600000);
+    const mins = Math.floor((elapsedMs % 3600000) / 60000);
+    const secs = Math.floor((elapsedMs % 60000) / 1000);
+    const d = new Date();
+    const localTimestamp = `${d.getFullYear()}-${pad2(d.getMonth() + 1)}-${pad2(d.getDate())}T${pad2(d.getHours())}:${pad2(d.getMinutes())}:${pad2(d.getSeconds())}`;
+
+    // Add App stats if present, or empty placeholders to maintain column alignment
+    const appColumns = stats.app_stats
+        ? `,${stats.app_stats.cpu_usage.toFixed(2)},${stats.app_stats.ram_used},${stats.app_stats.fps}`
+        : hasAppColumns ? ",,," : "";
+
+    return `${localTimestamp},${pad2(hrs)}:${pad2(mins)}:${pad2(secs)},${stats.cpu_usage.toFixed(2)},${stats.ram_used},${stats.battery_level},${stats.temperature.toFixed(1)}` +
+        `${appColumns},${stats.foreground_activity || "N/A"}\n`;
+}
 
 export function usePerformanceRecorder(
     selectedDevice: string,
@@ -70,6 +90,8 @@ export function usePerformanceRecorder(
                 device: selectedDevice,
                 package: selectedPackage || null
             });
+            // Manual refreshes go through the same record path as streamed samples
+            if (isRecording) recordSample(data, recordingStartTime);
             setStats(data);
             setHistory(prev => {
                 const newHistory = [...prev, { ...data, timestamp: Date.now() }];
@@ -91,6 +113,31 @@ export function usePerformanceRecorder(
         fetchStatsRef.current = fetchStats;
     }, [fetchStats]);
 
+    const recordedLinesRef = useRef<string[]>([]);
+    // Stores the path of the file being recorded to so periodic flushes can append to it
+    const recordingFilePathRef = useRef<string | null>(null);
+    // Tracks whether app-stat columns were included in the header (set at recording start)
+    const recordingHasAppColumnsRef = useRef<boolean>(false);
+
+    // Recording Logic - Accumulate Data and flush periodically to keep memory bounded
+    const recordSample = (data: DeviceStats, startTime: number | null) => {
+        const pathToFlush = recordingFilePathRef.current;
+        if (!pathToFlush) return;
+
+        recordedLinesRef.current.push(formatRecordingLine(data, startTime ? Date.now() - startTime : 0, recordingHasAppColumnsRef.current));
+
+        // Flush to disk when threshold is reached to keep memory bounded
+        if (recordedLinesRef.current.length >= FLUSH_THRESHOLD) {
+            const linesToFlush = recordedLinesRef.current;
+            recordedLinesRef.current = [];
+            invoke('save_file', { path: pathToFlush, content: linesToFlush.join(""), append: true }).catch((e: unknown) => {
+                // Restore lines to the front of the buffer so they are not lost on flush failure
+                recordedLinesRef.current = [...linesToFlush, ...recordedLinesRef.current];
+                console.error("Failed to flush recording data to disk:", e);
+            });
+        }
+    };
+
     // Streaming Logic
     useEffect(() => {
         let unlisten: (() => void) | undefined;
@@ -104,10 +151,8 @@ export function usePerformanceRecorder(
         const pollInterval = (isTestRunning && forceEnable) ? 5000 : 2000;
 
         if (shouldUpdate) {
-            // First fetch immediately for responsive UI
-            if (fetchStatsRef.current) fetchStatsRef.current();
-
-            // Start the background stream in Rust
+            // Start the background stream in Rust. Its first sample is taken immediately,
+            // so a separate one-off fetch here would only duplicate the adb round-trip.
             invoke('start_performance_stream', {
                 device: selectedDevice,
                 package: selectedPackage || null,
@@ -121,6 +166,9 @@ export function usePerformanceRecorder(
                 listen<{ device: string, stats: DeviceStats }>('device-performance', (event) => {
                     if (event.payload.device === selectedDevice && isSubscribed) {
                         const data = event.payload.stats;
+                        // Each sample is formatted into the recording once, as it arrives,
+                        // rather than from an effect after the render it triggers
+                        if (isRecording) recordSample(data, recordingStartTime);
                         setStats(data);
                         setHistory(prev => {
                             const newHistory = [...prev, { ...data, timestamp: Date.now() }];
@@ -149,60 +197,6 @@ export function usePerformanceRecorder(
         };
     }, [selectedDevice, autoRefresh, selectedPackage, isActive, isRecording, recordingStartTime, isTestRunning, allowActionsDuringTest, forceEnable]);
 
-
-
-    const recordedLinesRef = useRef<string[]>([]);
-    // Stores the path of the file being recorded to so periodic flushes can append to it
-    const recordingFilePathRef = useRef<string | null>(null);
-    // Tracks whether app-stat columns were included in the header (set at recording start)
-    const recordingHasAppColumnsRef = useRef<boolean>(false);
-
-    // Recording Logic - Accumulate Data and flush periodically to keep memory bounded
-    useEffect(() => {
-        if (isRecording && stats && recordingFilePathRef.current) {
-            let elapsedStr = "00:00:00";
-            if (recordingStartTime) {
-                const diff = Date.now() - recordingStartTime;
-                const hrs = Math.floor(diff / 3600000);
-                const mins = Math.floor((diff % 3600000) / 60000);
-                const secs = Math.floor((diff % 60000) / 1000);
-                elapsedStr = `${hrs.toString().padStart(2, '0')}:${mins.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
-            }
-
-            const pad = (n: number) => n.toString().padStart(2, '0');
-            const d = new Date();
-            const localTimestamp = `${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())}T${pad(d.getHours())}:${pad(d.getMinutes())}:${pad(d.getSeconds())}`;
-
-            let line = `${localTimestamp},${elapsedStr},${stats.cpu_usage.toFixed(2)},${stats.ram_used},${stats.battery_level},${stats.temperature.toFixed(1)}`;
-
-            // Add App stats if present, or empty placeholders to maintain column alignment
-            if (stats.app_stats) {
-                line += `,${stats.app_stats.cpu_usage.toFixed(2)},${stats.app_stats.ram_used},${stats.app_stats.fps}`;
-            } else if (recordingHasAppColumnsRef.current) {
-                line += ",,,"; // Maintain column count when app stats are temporarily unavailable
-            }
-
-            // Add Foreground Activity
-            line += `,${stats.foreground_activity || "N/A"}`;
-
-            line += "\n";
-
-            recordedLinesRef.current.push(line);
-
-            // Flush to disk when threshold is reached to keep memory bounded
-            if (recordedLinesRef.current.length >= FLUSH_THRESHOLD) {
-                const pathToFlush = recordingFilePathRef.current;
-                const linesToFlush = recordedLinesRef.current;
-                recordedLinesRef.current = [];
-                invoke('save_file', { path: pathToFlush, content: linesToFlush.join(""), append: true }).catch((e: unknown) => {
-                    // Restore lines to the front of the buffer so they are not lost on flush failure
-                    recordedLinesRef.current = [...linesToFlush, ...recordedLinesRef.current];
-                    console.error("Failed to flush recording data to disk:", e);
-                });
-            }
-        }
-    }, [stats, isRecording]);
-
     const toggleRecording = async () => {
         if (isRecording) {
             // Stop Recording: Flush any remaining buffered lines then report success
@@ -227,3 +227,40 @@ export async function askAgent(
         throw error;
     }
 }
+
+/** Dispatched by the agent panel once its prompt listener is attached. */
+export const AGENT_READY_EVENT = 'ai_agent_ready';
+
+/** How long a prompt waits for the panel to mount before it is dropped. */
+const AGENT_READY_TIMEOUT_MS = 5000;
+
+/** The prompt waiting for the panel, if any; a newer prompt replaces it. */
+let pendingPrompt: { dispatch: () => void, timer: ReturnType<typeof setTimeout> } | null = null;
+
+const clearPendingPrompt = () => {
+    if (!pendingPrompt) return;
+    window.removeEventListener(AGENT_READY_EVENT, pendingPrompt.dispatch);
+    clearTimeout(pendingPrompt.timer);
+    pendingPrompt = null;
+};
+
+/**
+ * Hands a prompt to the agent panel. When the panel is closed it is only mounted after the
+ * caller enables it, so the prompt waits for the panel's ready event instead of a fixed delay.
+ * At most one prompt waits, and it is dropped if the panel does not mount in time (e.g. the
+ * agent is disabled), so it cannot fire on some much later mount.
+ */
+export function sendAgentPrompt(prompt: string, panelOpen: boolean, hidden: boolean = true) {
+    clearPendingPrompt();
+    const send = () => window.dispatchEvent(new CustomEvent('ai_agent_prompt', { detail: { prompt, hidden } }));
+    if (panelOpen) {
+        send();
+        return;
+    }
+    const dispatch = () => {
+        clearPendingPrompt();
+        send();
+    };
+    pendingPrompt = { dispatch, timer: setTimeout(clearPendingPrompt, AGENT_READY_TIMEOUT_MS) };
+    window.addEventListener(AGENT_READY_EVENT, dispatch);
+}
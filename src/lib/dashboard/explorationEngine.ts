@@ -1,5 +1,5 @@
 import { ScreenMap, UIElementMap } from '@/lib/types';
-import { InspectorNode, generateXPath, sanitizeId } from '@/lib/inspectorUtils';
+import { InspectorNode, generateXPath, sanitizeId, parseBounds } from '@/lib/inspectorUtils';
 import { getRemoteString } from '@/lib/remoteConfig';
 
 export const getDestructiveTerms = () => {
@@ -522,14 +522,10 @@ export class AutonomousExplorer {
                 const isScrollClass = n.attributes['class']?.includes('ScrollView') || n.attributes['class']?.includes('RecyclerView') || n.tagName?.includes('ScrollView') || n.tagName?.includes('RecyclerView');
                 
                 if (isScrollableAttr || isScrollClass) {
-                    const boundsMatch = n.attributes['bounds']?.match(/\[(\d+),(\d+)\]\[(\d+),(\d+)\]/);
-                    if (boundsMatch) {
-                        const x1 = parseInt(boundsMatch[1], 10);
-                        const y1 = parseInt(boundsMatch[2], 10);
-                        const x2 = parseInt(boundsMatch[3], 10);
-                        const y2 = parseInt(boundsMatch[4], 10);
-                        const width = x2 - x1;
-                        const height = y2 - y1;
+                    const bounds = n.attributes['bounds'] ? parseBounds(n.attributes['bounds']) : undefined;
+                    if (bounds) {
+                        const width = bounds.w;
+                        const height = bounds.h;
                         const area = width * height;
                         if (area > maxScrollArea) {
                             maxScrollArea = area;
@@ -1,6 +1,6 @@
 
-import * as XLSX from 'xlsx';
-import { Document, Packer, Paragraph, HeadingLevel, AlignmentType, TextRun } from 'docx';
+// xlsx and docx are only needed once the user actually exports, so they are loaded on demand
+import type { Paragraph as DocxParagraph } from 'docx';
 import { saveAs } from 'file-saver';
 
 // Helper to validate requirements (simple check)
@@ -88,7 +88,7 @@ function getStrings(language: string) {
 // ---------------------------------------------------------------------------
 // EXPORT TO XLSX
 // ---------------------------------------------------------------------------
-export function exportToXlsx(content: string, language: string = 'en') {
+export async function exportToXlsx(content: string, language: string = 'en') {
     if (!content.trim()) return;
 
     const strings = getStrings(language);
@@ -170,6 +170,7 @@ export function exportToXlsx(content: string, language: string = 'en') {
         ["", strings.evidence, "", "", "", ""]
     ];
 
+    const XLSX = await import('xlsx');
     const ws = XLSX.utils.aoa_to_sheet(data);
 
     // Merges
@@ -203,8 +204,9 @@ export function exportToXlsx(content: string, language: string = 'en') {
 // EXPORT TO DOCX
 // ---------------------------------------------------------------------------
 export async function exportToDocx(content: string, language: string = 'en') {
+    const { Document, Packer, Paragraph, HeadingLevel, AlignmentType, TextRun } = await import('docx');
     const strings = getStrings(language);
-    const children: Paragraph[] = [];
+    const children: DocxParagraph[] = [];
 
     // 1. Parsing - Reuse logic from XLSX
     const scenarioBlocks = content
@@ -331,7 +333,7 @@ export async function exportToDocx(content: string, language: string = 'en') {
             } else {
                 return new Paragraph({ text: trimmed });
             }
-        }).filter(p => p !== null) as Paragraph[];
+        }).filter(p => p !== null) as DocxParagraph[];
 
         children.push(...descParagraphs);
 
@@ -25,6 +25,9 @@ const showCustomToast = (type: ToastType, msg: string, args?: any) => {
 // Extend timeout to 10 seconds for error toasts that include details.
 // Sonner pauses the timer automatically while the mouse is over the toast.
     const duration = (type === 'error' && details) ? 10000 : undefined;
+    // Repeated identical errors (e.g. a failing poll or a button clicked again) re-use the toast
+    // already on screen instead of mounting and animating a new one each time
+    const id = type === 'error' ? `error:${msg}` : undefined;
 
     return toast.custom((t) => (
         <ExpandableToast 
@@ -33,7 +36,7 @@ const showCustomToast = (type: ToastType, msg: string, args?: any) => {
             details={details} 
             onClose={() => toast.dismiss(t)} 
         />
-    ), { duration });
+    ), { duration, id });
 };
 
 export const feedback = {
@@ -8,29 +8,43 @@ export interface HeuristicParserResult {
     outputDir?: string;
 }
 
-const IS_DOUBLE = (l: string) => /^={10,}$/.test(l.trim());
-const IS_SINGLE = (l: string) => /^-{10,}$/.test(l.trim());
-const cleanAnsi = (l: string) => l.replace(/\x1b\[[0-9;]*m/g, '').replace(/[\x00-\x1f\x7f-\x9f]/g, '');
+// Every classifier below runs on each streamed line, so the patterns are shared constants and
+// related checks are folded into a single alternation instead of several separate scans
+const ANSI_RE = /\x1b\[[0-9;]*m/g;
+const CONTROL_CHARS_RE = /[\x00-\x1f\x7f-\x9f]/g;
+const STATUS_RE = /\|\s+(PASS|FAIL|SKIP)\s+\|/;
+const MAESTRO_VERBOSE_RE = /disableAnsi=false|\(\[\s*(?:INFO|DEBUG|ERROR|WARN|TRACE)\s*\]\)/;
+const SYSTEM_PREFIX_RE = /^\s*(?:\[System\]|\[Error\]|(?:Output|Log|Report|STDERR|STDOUT):)/;
+// Also covers the "N/M Flow Passed in" form, which contains this phrase
+const MAESTRO_SUITE_END_RE = /Flow (Passed|Failed) in/;
+// Leading/trailing whitespace is matched by the patterns themselves so lines are not trimmed per check
+const DOUBLE_RULE_RE = /^\s*={10,}\s*$/;
+const SINGLE_RULE_RE = /^\s*-{10,}\s*$/;
+const SUMMARY_RE = /^\s*\d+ tests?, \d+ passed, \d+ failed/;
+const MAESTRO_TEST_END_RE = /^\s*\[(Passed|Failed)\]\s+.*\(\d+s\)/;
+const REDUNDANT_PREFIX_RE = /^\s*(?:\[System\]|(?:Output|Log|Report):)/;
+const STATUS_LINE_RE = /^(.*?)\s*\|\s+(PASS|FAIL|SKIP)\s+\|\s*$/;
 
-const IS_STATUS = (line: string) => {
-    const clean = cleanAnsi(line).trim();
-    return /\|\s+(PASS|FAIL|SKIP)\s+\|/.test(clean);
-};
+const IS_DOUBLE = (l: string) => DOUBLE_RULE_RE.test(l);
+const IS_SINGLE = (l: string) => SINGLE_RULE_RE.test(l);
+const cleanAnsi = (l: string) => l.replace(ANSI_RE, '').replace(CONTROL_CHARS_RE, '');
+
+const IS_STATUS = (line: string) => STATUS_RE.test(cleanAnsi(line));
 
-const IS_SUMMARY = (l: string) => /^\d+ tests?, \d+ passed, \d+ failed/.test(l.trim());
-const IS_MAESTRO_VERBOSE = (l: string) => /disableAnsi=false/.test(l) || /\(\[\s*(INFO|DEBUG|ERROR|WARN|TRACE)\s*\]\)/.test(l);
-const IS_SYSTEM = (l: string) => l.trim().startsWith('[System]') || l.trim().startsWith('[Error]') || /^\s*(Output|Log|Report|STDERR|STDOUT):/.test(l) || IS_MAESTRO_VERBOSE(l);
+const IS_SUMMARY = (l: string) => SUMMARY_RE.test(l);
+const IS_MAESTRO_VERBOSE = (l: string) => MAESTRO_VERBOSE_RE.test(l);
+const IS_SYSTEM = (l: string) => SYSTEM_PREFIX_RE.test(l) || IS_MAESTRO_VERBOSE(l);
 const IS_MAESTRO_SUITE_START = (l: string) => l.includes("Debug output path:") || l.includes("Waiting for flows to complete...");
-const IS_MAESTRO_SUITE_END = (l: string) => /Flow (Passed|Failed) in/.test(l) || /\d+\/\d+ Flow (Passed|Failed) in/.test(l);
+const IS_MAESTRO_SUITE_END = (l: string) => MAESTRO_SUITE_END_RE.test(l);
 const IS_MAESTRO_TEST_START = (l: string) => l.includes("Running flow ");
-const IS_MAESTRO_TEST_END = (l: string) => /^\[(Passed|Failed)\]\s+.*\(\d+s\)/.test(l.trim());
+const IS_MAESTRO_TEST_END = (l: string) => MAESTRO_TEST_END_RE.test(l);
 const IS_MAVEN_TEST_START = (l: string) => l.startsWith("[INFO] Running ");
 const IS_MAVEN_TEST_END = (l: string) => l.includes("Tests run: ") && l.includes("Failures: ");
 const IS_ROBOT_RUNNER_TEST_START = (l: string) => l.startsWith("[RobotRunner-Test-Start]") || l.startsWith("[RR-TEST-START]");
 const IS_RR_SUITE_START = (l: string) => l.startsWith("[RR-SUITE-START]");
 const IS_RR_SUITE_END = (l: string) => l.startsWith("[RR-SUITE-END]");
 const IS_RR_TEST_END = (l: string) => l.startsWith("[RR-TEST-END]");
-const IS_REDUNDANT_SYSTEM = (l: string) => l.trim().startsWith('[System]') || /^\s*(Output|Log|Report):/.test(l) || IS_STATUS(l) || l.startsWith("[RR-");
+const IS_REDUNDANT_SYSTEM = (l: string) => REDUNDANT_PREFIX_RE.test(l) || IS_STATUS(l) || l.startsWith("[RR-");
 
 const extractOutputXmlPath = (l: string): string | undefined => {
     const clean = cleanAnsi(l).trim();
@@ -60,11 +74,14 @@ const splitNameAndDoc = (raw: string) => {
 
 /**
  * Parses raw logs incrementally to build a heuristic tree representation of the test execution.
+ * `indexOffset` is the number of lines already trimmed from the front of `logs`, so node ids stay
+ * unique across a capped log history.
  */
 export function parseHeuristicLogs(
     logs: string[],
     prevParsedNodes: LinearNode[],
-    processedCount: number
+    processedCount: number,
+    indexOffset: number = 0
 ): HeuristicParserResult {
     const newLogs = logs.slice(processedCount);
     const linearNodes = [...prevParsedNodes];
@@ -94,7 +111,7 @@ export function parseHeuristicLogs(
 
         if (!line) continue;
 
-        const nodeIdx = processedCount + i;
+        const nodeIdx = indexOffset + processedCount + i;
 
         if (IS_DOUBLE(line)) {
             const last = linearNodes[linearNodes.length - 1];
@@ -131,14 +148,14 @@ export function parseHeuristicLogs(
                     const node = linearNodes[linearNodes.length - 1 - k];
                     if (!node || node.type !== 'text') break;
                     if (IS_STATUS(node.content)) {
-                        const match = node.content.match(/^(.*?)\s*\|\s+(PASS|FAIL|SKIP)\s+\|\s*$/);
+                        const match = node.content.match(STATUS_LINE_RE);
                         if (match) statusNodeIndex = linearNodes.length - 1 - k;
                         break;
                     }
                 }
                 if (statusNodeIndex !== -1) {
                     const statusNode = linearNodes[statusNodeIndex] as TextNode;
-                    const match = statusNode.content.match(/^(.*?)\s*\|\s+(PASS|FAIL|SKIP)\s+\|\s*$/);
+                    const match = statusNode.content.match(STATUS_LINE_RE);
                     if (match) {
                         const name = match[1].trim();
                         const status = match[2] as 'PASS' | 'FAIL' | 'SKIP';
@@ -236,7 +253,7 @@ export function parseHeuristicLogs(
             const testLogs = currentTest.logs;
             for (let j = testLogs.length - 1; j >= 0; j--) {
                 const cleanLog = cleanAnsi(testLogs[j]);
-                const match = cleanLog.match(/\|\s+(PASS|FAIL|SKIP)\s+\|/);
+                const match = cleanLog.match(STATUS_RE);
                 if (match) {
                     const finalStatus = match[1] as 'PASS' | 'FAIL' | 'SKIP';
                     currentTest.status = finalStatus;
@@ -1,3 +1,5 @@
+import { XMLParser } from 'fast-xml-parser';
+
 export interface InspectorNode {
     id: string; // generated unique id
     tagName: string;
@@ -7,18 +9,50 @@ export interface InspectorNode {
     parent?: InspectorNode;
 }
 
+// Fallback for bounds strings that are not exactly "[x1,y1][x2,y2]" (e.g. surrounding text)
+const BOUNDS_PATTERN = /\[(\d+),(\d+)\]\[(\d+),(\d+)\]/;
+
+/**
+ * Reads the four numbers of an exact "[x1,y1][x2,y2]" string with a single character scan.
+ */
+function scanBounds(boundsStr: string): [number, number, number, number] | null {
+    const values: [number, number, number, number] = [0, 0, 0, 0];
+    let i = 0;
+    for (let k = 0; k < 4; k++) {
+        // '[' opens each pair, ',' separates its two numbers
+        if (boundsStr.charCodeAt(i) !== (k % 2 === 0 ? 91 : 44)) return null;
+        i++;
+
+        const start = i;
+        let value = 0;
+        for (let c = boundsStr.charCodeAt(i); c >= 48 && c <= 57; c = boundsStr.charCodeAt(++i)) {
+            value = value * 10 + (c - 48);
+        }
+        if (i === start) return null;
+        values[k] = value;
+
+        // ']' closes each pair
+        if (k % 2 === 1) {
+            if (boundsStr.charCodeAt(i) !== 93) return null;
+            i++;
+        }
+    }
+    return i === boundsStr.length ? values : null;
+}
+
 /**
  * Parses Android uiautomator bounds string: "[0,0][1080,2400]"
  */
 export function parseBounds(boundsStr: string): { x: number; y: number; w: number; h: number } | undefined {
-    // Regex matches [x1,y1][x2,y2]
-    const match = boundsStr.match(/\[(\d+),(\d+)\]\[(\d+),(\d+)\]/);
-    if (!match) return undefined;
+    // Called for every node of every dump; the exact format is by far the common case
+    let values = scanBounds(boundsStr);
+    if (!values) {
+        const match = boundsStr.match(BOUNDS_PATTERN);
+        if (!match) return undefined;
+        values = [parseInt(match[1], 10), parseInt(match[2], 10), parseInt(match[3], 10), parseInt(match[4], 10)];
+    }
 
-    const x1 = parseInt(match[1], 10);
-    const y1 = parseInt(match[2], 10);
-    const x2 = parseInt(match[3], 10);
-    const y2 = parseInt(match[4], 10);
+    const [x1, y1, x2, y2] = values;
 
     return {
         x: x1,
@@ -58,47 +92,91 @@ export function transformBounds(
 }
 
 /**
- * Recursively converts the raw fast-xml-parser object into a cleaner InspectorNode tree.
- * Adds computed bounds and parent references.
+ * Shared parser for UI dumps; the options never change, so one instance serves every refresh.
+ */
+export const uiDumpParser = new XMLParser({
+    ignoreAttributes: false,
+    attributeNamePrefix: "",
+    textNodeName: "_text"
+});
+
+function decodeHtmlEntities(str: string): string {
+    // Most attribute values carry no entities at all, so skip the replace chain for them
+    if (!str || !str.includes('&')) return str;
+    return str
+        .replace(/&#(\d+);/g, (_, dec) => String.fromCharCode(dec))
+        .replace(/&#x([0-9a-fA-F]+);/g, (_, hex) => String.fromCharCode(parseInt(hex, 16)))
+        .replace(/&quot;/g, '"')
+        .replace(/&apos;/g, "'")
+        .replace(/&lt;/g, '<')
+        .replace(/&gt;/g, '>')
+        .replace(/&amp;/g, '&');
+}
+
+/**
+ * Per-dump state gathered while the tree is built, so the root fix-ups need no extra traversal.
  */
+interface TreeBuildContext {
+    classCounts: Record<string, number>;
+    maxX: number;
+    maxY: number;
+}
+
 /**
  * Recursively converts the raw fast-xml-parser object into a cleaner InspectorNode tree.
  * Agnostic to tag names (handles node, hierarchy, or class-based tags).
  */
 export function transformXmlToTree(rawNode: any, parent?: InspectorNode, keyName: string = 'node', isRoot: boolean = true): InspectorNode {
+    const context: TreeBuildContext | undefined = isRoot ? { classCounts: {}, maxX: 0, maxY: 0 } : undefined;
+    const node = buildTreeNode(rawNode, keyName, context);
+    node.parent = parent;
+
+    if (context) {
+        // Calculate the bounding box of the entire tree to find the maximum extent of all elements.
+        // Android UI Automator coordinates are absolute physical screen coordinates.
+        // If the dump only contains a modal/dialog (common on payment terminals or secure screens),
+        // the root node bounds may be restricted to the modal, causing viewport scaling mismatch
+        // and clipping the modal elements outside the viewport container.
+        // Forcing the root bounds to start at (0, 0) and cover all elements' max extent solves this.
+        const { maxX, maxY } = context;
+
+        const currentBounds = node.bounds;
+        if (!currentBounds || currentBounds.x !== 0 || currentBounds.y !== 0 || currentBounds.w < maxX || currentBounds.h < maxY) {
+            if (maxX > 0 && maxY > 0) {
+                const finalW = currentBounds && currentBounds.x === 0 ? Math.max(currentBounds.w, maxX) : maxX;
+                const finalH = currentBounds && currentBounds.y === 0 ? Math.max(currentBounds.h, maxY) : maxY;
+
+                node.bounds = {
+                    x: 0,
+                    y: 0,
+                    w: finalW,
+                    h: finalH
+                };
+            }
+        }
+    }
+
+    return node;
+}
+
+/**
+ * Builds one node and its subtree in a single walk. When a context is given, the 'instance'
+ * attribute and the tree's max extent are collected on the way, in the same pre-order as assignInstances.
+ */
+function buildTreeNode(rawNode: any, keyName: string, context?: TreeBuildContext): InspectorNode {
     const attributes: Record<string, string> = {};
     const children: InspectorNode[] = [];
+    const keys = Object.keys(rawNode);
 
-    const decodeHtmlEntities = (str: string): string => {
-        if (!str) return str;
-        return str
-            .replace(/&#(\d+);/g, (_, dec) => String.fromCharCode(dec))
-            .replace(/&#x([0-9a-fA-F]+);/g, (_, hex) => String.fromCharCode(parseInt(hex, 16)))
-            .replace(/&quot;/g, '"')
-            .replace(/&apos;/g, "'")
-            .replace(/&lt;/g, '<')
-            .replace(/&gt;/g, '>')
-            .replace(/&amp;/g, '&');
-    };
-
-    // Iterate over all keys to find children and attributes
-    Object.keys(rawNode).forEach(key => {
+    // Attributes first, so this node is counted before any of its descendants
+    for (const key of keys) {
         const value = rawNode[key];
-        
         if (key === '_text') {
             attributes['text'] = decodeHtmlEntities(String(value));
-        } else if (Array.isArray(value)) {
-            value.forEach((v: any) => {
-                if (typeof v === 'object' && v !== null) {
-                    children.push(transformXmlToTree(v, undefined, key, false));
-                }
-            });
-        } else if (typeof value === 'object' && value !== null) {
-            children.push(transformXmlToTree(value, undefined, key, false));
-        } else {
+        } else if (typeof value !== 'object' || value === null) {
             attributes[key] = decodeHtmlEntities(String(value));
         }
-    });
+    }
 
     // Normalize tagName to class name if generic 'node' is used
     let tagName = keyName;
@@ -107,12 +185,34 @@ export function transformXmlToTree(rawNode: any, parent?: InspectorNode, keyName
         tagName = fullClass.includes('.') ? fullClass.split('.').pop()! : fullClass;
     }
 
+    if (context) {
+        const className = attributes['class'] || tagName;
+        if (className) {
+            const count = context.classCounts[className] ?? 0;
+            attributes['instance'] = String(count);
+            context.classCounts[className] = count + 1;
+        }
+    }
+
+    for (const key of keys) {
+        if (key === '_text') continue;
+        const value = rawNode[key];
+        if (Array.isArray(value)) {
+            value.forEach((v: any) => {
+                if (typeof v === 'object' && v !== null) {
+                    children.push(buildTreeNode(v, key, context));
+                }
+            });
+        } else if (typeof value === 'object' && value !== null) {
+            children.push(buildTreeNode(value, key, context));
+        }
+    }
+
     const node: InspectorNode = {
         id: Math.random().toString(36).substr(2, 9),
         tagName: tagName,
         attributes: attributes,
-        children: children,
-        parent: parent
+        children: children
     };
 
     if (attributes['bounds']) {
@@ -146,42 +246,9 @@ export function transformXmlToTree(rawNode: any, parent?: InspectorNode, keyName
         }
     }
 
-    if (isRoot) {
-        // Calculate the bounding box of the entire tree to find the maximum extent of all elements.
-        // Android UI Automator coordinates are absolute physical screen coordinates.
-        // If the dump only contains a modal/dialog (common on payment terminals or secure screens),
-        // the root node bounds may be restricted to the modal, causing viewport scaling mismatch
-        // and clipping the modal elements outside the viewport container.
-        // Forcing the root bounds to start at (0, 0) and cover all elements' max extent solves this.
-        let maxX = 0;
-        let maxY = 0;
-
-        const traverseForMax = (n: InspectorNode) => {
-            if (n.bounds) {
-                maxX = Math.max(maxX, n.bounds.x + n.bounds.w);
-                maxY = Math.max(maxY, n.bounds.y + n.bounds.h);
-            }
-            n.children.forEach(traverseForMax);
-        };
-
-        traverseForMax(node);
-
-        const currentBounds = node.bounds;
-        if (!currentBounds || currentBounds.x !== 0 || currentBounds.y !== 0 || currentBounds.w < maxX || currentBounds.h < maxY) {
-            if (maxX > 0 && maxY > 0) {
-                const finalW = currentBounds && currentBounds.x === 0 ? Math.max(currentBounds.w, maxX) : maxX;
-                const finalH = currentBounds && currentBounds.y === 0 ? Math.max(currentBounds.h, maxY) : maxY;
-
-                node.bounds = {
-                    x: 0,
-                    y: 0,
-                    w: finalW,
-                    h: finalH
-                };
-            }
-        }
-
-        assignInstances(node);
+    if (context && node.bounds) {
+        context.maxX = Math.max(context.maxX, node.bounds.x + node.bounds.w);
+        context.maxY = Math.max(context.maxY, node.bounds.y + node.bounds.h);
     }
 
     return node;
@@ -206,45 +273,94 @@ export function assignInstances(root: InspectorNode): void {
     traverse(root);
 }
 
+interface HitTestIndex {
+    nodes: InspectorNode[];
+    rects: Float64Array; // x1, y1, x2, y2 per node, in tree order
+    areas: Float64Array;
+}
+
+// Flattened bounds per tree, built on the first hit-test and dropped with the tree itself
+const hitTestIndexes = new WeakMap<InspectorNode, HitTestIndex>();
+
+function getHitTestIndex(root: InspectorNode): HitTestIndex {
+    const cached = hitTestIndexes.get(root);
+    if (cached) return cached;
+
+    const nodes: InspectorNode[] = [];
+    const collect = (n: InspectorNode) => {
+        if (n.bounds) nodes.push(n);
+        n.children.forEach(collect);
+    };
+    collect(root);
+
+    const rects = new Float64Array(nodes.length * 4);
+    const areas = new Float64Array(nodes.length);
+    nodes.forEach((n, i) => {
+        const { x, y, w, h } = n.bounds!;
+        rects[i * 4] = x;
+        rects[i * 4 + 1] = y;
+        rects[i * 4 + 2] = x + w;
+        rects[i * 4 + 3] = y + h;
+        areas[i] = (w || 0) * (h || 0);
+    });
+
+    const index = { nodes, rects, areas };
+    hitTestIndexes.set(root, index);
+    return index;
+}
+
 /**
  * Finds all nodes that contain the given coordinates.
  * Returns an array sorted by area (ascending).
  */
 export function findNodesAtCoords(node: InspectorNode, x: number, y: number): InspectorNode[] {
-    const candidates: InspectorNode[] = [];
-
-    function traverse(currentNode: InspectorNode) {
-        // If node has bounds, check intersection
-        if (currentNode.bounds) {
-            const { x: bx, y: by, w, h } = currentNode.bounds;
-            if (x >= bx && x <= bx + w && y >= by && y <= by + h) {
-                candidates.push(currentNode);
-            }
-        }
-
-        // Always verify children
-        if (currentNode.children) {
-            currentNode.children.forEach(traverse);
+    // Runs on every pointer move over the viewport, so scan the flat bounds arrays instead of walking the tree
+    const { nodes, rects, areas } = getHitTestIndex(node);
+    const hits: number[] = [];
+
+    for (let i = 0; i < nodes.length; i++) {
+        const o = i * 4;
+        if (x >= rects[o] && x <= rects[o + 2] && y >= rects[o + 1] && y <= rects[o + 3]) {
+            hits.push(i);
         }
     }
 
-    traverse(node);
-
     // Sort by area (ascending)
-    candidates.sort((a, b) => {
-        const areaA = (a.bounds?.w || 0) * (a.bounds?.h || 0);
-        const areaB = (b.bounds?.w || 0) * (b.bounds?.h || 0);
+    hits.sort((a, b) => areas[a] - areas[b]);
 
-        return areaA - areaB;
-    });
-
-    return candidates;
+    return hits.map(i => nodes[i]);
 }
 
 /**
- * Finds all nodes matching a given locator string.
- * Supports XPath, ID, Accessibility ID, Name, or ClassName.
+ * Lower-cased attribute values matched by the free-text searches; absent values are ''.
  */
+interface NodeSearchFields {
+    resourceId: string;
+    desc: string;
+    text: string;
+    className: string;
+    tagName: string;
+}
+
+// Filled on a node's first search, so further keystrokes over the same dump skip the lower-casing
+const searchFields = new WeakMap<InspectorNode, NodeSearchFields>();
+
+function getSearchFields(node: InspectorNode): NodeSearchFields {
+    let fields = searchFields.get(node);
+    if (!fields) {
+        const attr = node.attributes;
+        fields = {
+            resourceId: (attr['resource-id'] || "").toLowerCase(),
+            desc: (attr['content-desc'] || "").toLowerCase(),
+            text: (attr['text'] || "").toLowerCase(),
+            className: (attr['class'] || "").toLowerCase(),
+            tagName: (node.tagName || "").toLowerCase()
+        };
+        searchFields.set(node, fields);
+    }
+    return fields;
+}
+
 /**
  * Finds all nodes matching a given locator string.
  * Supports XPath, ID, Accessibility ID, Name, or ClassName.
@@ -256,10 +372,9 @@ export function findNodesByText(root: InspectorNode, query: string): InspectorNo
     if (!normalizedQuery) return results;
 
     function traverse(node: InspectorNode) {
-        const text = (node.attributes['text'] || "").toLowerCase();
-        const desc = (node.attributes['content-desc'] || "").toLowerCase();
-        
-        if (text.includes(normalizedQuery) || desc.includes(normalizedQuery) || normalizedQuery.includes(text && text.length > 3 ? text : "___never___")) {
+        const { text, desc } = getSearchFields(node);
+
+        if (text.includes(normalizedQuery) || desc.includes(normalizedQuery) || (text.length > 3 && normalizedQuery.includes(text))) {
             results.push(node);
         }
         for (const child of node.children) {
@@ -271,6 +386,15 @@ export function findNodesByText(root: InspectorNode, query: string): InspectorNo
     return results;
 }
 
+// UiSelector method names whose attribute is not simply the kebab-cased method name
+const UI_SELECTOR_ATTRIBUTES: Record<string, string> = {
+    'resourceId': 'resource-id',
+    'description': 'content-desc',
+    'text': 'text',
+    'className': 'class',
+    'longClickable': 'long-clickable'
+};
+
 export function findNodesByLocator(root: InspectorNode, locator: string): InspectorNode[] {
     const results: InspectorNode[] = [];
     if (!locator) return results;
@@ -357,84 +481,78 @@ export function findNodesByLocator(root: InspectorNode, locator: string): Inspec
     if (trimmed.includes('UiSelector()')) {
         const methodMatch = trimmed.match(/\.\w+\s*\([^)]*\)/g);
         if (methodMatch) {
-            const search = (node: InspectorNode) => {
-                let matchesAll = true;
-                methodMatch.forEach(m => {
-                    if (m.startsWith('.instance') || m.startsWith('.childSelector') || m.startsWith('.fromParent')) return;
-
-                    const parts = m.match(/\.(\w+)\s*\(\s*([\s\S]*?)\s*\)/);
-                    if (parts) {
-                        const [, method, rawVal] = parts;
-                        let baseMethod = method;
-                        let op: 'equals' | 'contains' | 'startsWith' | 'endsWith' | 'matches' = 'equals';
-
-                        if (method.endsWith('Contains')) {
-                            baseMethod = method.replace('Contains', '');
-                            op = 'contains';
-                        } else if (method.endsWith('StartsWith')) {
-                            baseMethod = method.replace('StartsWith', '');
-                            op = 'startsWith';
-                        } else if (method.endsWith('EndsWith')) {
-                            baseMethod = method.replace('EndsWith', '');
-                            op = 'endsWith';
-                        } else if (method.endsWith('Matches')) {
-                            baseMethod = method.replace('Matches', '');
-                            op = 'matches';
-                        }
+            // Each selector method becomes one attribute test, parsed once rather than per node
+            const conditions: ((attributes: Record<string, string>) => boolean)[] = [];
+            methodMatch.forEach(m => {
+                if (m.startsWith('.instance') || m.startsWith('.childSelector') || m.startsWith('.fromParent')) return;
+
+                const parts = m.match(/\.(\w+)\s*\(\s*([\s\S]*?)\s*\)/);
+                if (!parts) return;
+
+                const [, method, rawVal] = parts;
+                let baseMethod = method;
+                let op: 'equals' | 'contains' | 'startsWith' | 'endsWith' | 'matches' = 'equals';
+
+                if (method.endsWith('Contains')) {
+                    baseMethod = method.replace('Contains', '');
+                    op = 'contains';
+                } else if (method.endsWith('StartsWith')) {
+                    baseMethod = method.replace('StartsWith', '');
+                    op = 'startsWith';
+                } else if (method.endsWith('EndsWith')) {
+                    baseMethod = method.replace('EndsWith', '');
+                    op = 'endsWith';
+                } else if (method.endsWith('Matches')) {
+                    baseMethod = method.replace('Matches', '');
+                    op = 'matches';
+                }
 
-                        // Clean rawVal (could be "string", 'string', true, false, 3)
-                        let val: string | boolean | number = rawVal.trim();
-                        if ((val.startsWith('"') && val.endsWith('"')) || (val.startsWith("'") && val.endsWith("'"))) {
-                            val = val.slice(1, -1);
-                        } else if (val === 'true') {
-                            val = true;
-                        } else if (val === 'false') {
-                            val = false;
-                        } else if (/^\d+$/.test(val)) {
-                            val = parseInt(val, 10);
-                        }
+                // Clean rawVal (could be "string", 'string', true, false, 3)
+                let val: string | boolean | number = rawVal.trim();
+                if ((val.startsWith('"') && val.endsWith('"')) || (val.startsWith("'") && val.endsWith("'"))) {
+                    val = val.slice(1, -1);
+                } else if (val === 'true') {
+                    val = true;
+                } else if (val === 'false') {
+                    val = false;
+                } else if (/^\d+$/.test(val)) {
+                    val = parseInt(val, 10);
+                }
 
-                        const attrMap: Record<string, string> = {
-                            'resourceId': 'resource-id',
-                            'description': 'content-desc',
-                            'text': 'text',
-                            'className': 'class',
-                            'longClickable': 'long-clickable'
-                        };
-                        const attr = attrMap[baseMethod] || baseMethod.replace(/([A-Z])/g, '-$1').toLowerCase();
-                        const nodeVal = node.attributes[attr];
-
-                        // If it's a boolean check
-                        if (typeof val === 'boolean') {
-                            const nodeBool = nodeVal === 'true';
-                            if (nodeBool !== val) matchesAll = false;
-                        }
-                        // If it's an integer check
-                        else if (typeof val === 'number') {
-                            if (baseMethod === 'index') {
-                                const nodeInt = parseInt(nodeVal || "0", 10);
-                                if (nodeInt !== val) matchesAll = false;
-                            }
-                        }
-                        // String checks
-                        else {
-                            const nodeString = nodeVal || "";
-                            switch (op) {
-                                case 'contains': if (!nodeString.includes(val)) matchesAll = false; break;
-                                case 'startsWith': if (!nodeString.startsWith(val)) matchesAll = false; break;
-                                case 'endsWith': if (!nodeString.endsWith(val)) matchesAll = false; break;
-                                case 'matches':
-                                    try {
-                                        const re = new RegExp(val);
-                                        if (!re.test(nodeString)) matchesAll = false;
-                                    } catch { matchesAll = false; }
-                                    break;
-                                default: if (nodeString !== val) matchesAll = false;
-                            }
+                const attr = UI_SELECTOR_ATTRIBUTES[baseMethod] || baseMethod.replace(/([A-Z])/g, '-$1').toLowerCase();
+
+                // If it's a boolean check
+                if (typeof val === 'boolean') {
+                    const expected = val;
+                    conditions.push(attributes => (attributes[attr] === 'true') === expected);
+                }
+                // If it's an integer check
+                else if (typeof val === 'number') {
+                    if (baseMethod === 'index') {
+                        const expected = val;
+                        conditions.push(attributes => parseInt(attributes[attr] || "0", 10) === expected);
+                    }
+                }
+                // String checks
+                else {
+                    const expected = val;
+                    switch (op) {
+                        case 'contains': conditions.push(attributes => (attributes[attr] || "").includes(expected)); break;
+                        case 'startsWith': conditions.push(attributes => (attributes[attr] || "").startsWith(expected)); break;
+                        case 'endsWith': conditions.push(attributes => (attributes[attr] || "").endsWith(expected)); break;
+                        case 'matches': {
+                            let re: RegExp | null = null;
+                            try { re = new RegExp(expected); } catch { re = null; }
+                            conditions.push(attributes => re !== null && re.test(attributes[attr] || ""));
+                            break;
                         }
+                        default: conditions.push(attributes => (attributes[attr] || "") === expected);
                     }
-                });
-                if (matchesAll) results.push(node);
+                }
+            });
+
+            const search = (node: InspectorNode) => {
+                if (conditions.every(test => test(node.attributes))) results.push(node);
                 node.children.forEach(search);
             };
             search(root);
@@ -632,15 +750,15 @@ export function findNodesByLocator(root: InspectorNode, locator: string): Inspec
     }
 
     // 6. Default Fallback
+    const locatorLower = locator.toLowerCase();
     function search(node: InspectorNode) {
-        const attr = node.attributes;
-        const locatorLower = locator.toLowerCase();
+        const fields = getSearchFields(node);
         const matches =
-            (attr['resource-id'] && attr['resource-id'].toLowerCase().includes(locatorLower)) ||
-            (attr['content-desc'] && attr['content-desc'].toLowerCase().includes(locatorLower)) ||
-            (attr['text'] && attr['text'].toLowerCase().includes(locatorLower)) ||
-            (attr['class'] && attr['class'].toLowerCase().includes(locatorLower)) ||
-            (node.tagName && node.tagName.toLowerCase().includes(locatorLower));
+            fields.resourceId.includes(locatorLower) ||
+            fields.desc.includes(locatorLower) ||
+            fields.text.includes(locatorLower) ||
+            fields.className.includes(locatorLower) ||
+            fields.tagName.includes(locatorLower);
 
         if (matches) results.push(node);
         node.children.forEach(search);
@@ -668,6 +786,36 @@ export function escapeXPath(val: string): string {
     return `concat(${result})`;
 }
 
+type LocatorMatch = 'equals' | 'contains' | 'startsWith' | 'endsWith' | 'matches';
+
+// Locator building blocks by attribute and match type, looked up instead of re-switched per call
+const XPATH_PREDICATES: Record<LocatorMatch, (attr: string, escaped: string) => string> = {
+    equals: (attr, escaped) => `@${attr}=${escaped}`,
+    contains: (attr, escaped) => `contains(@${attr}, ${escaped})`,
+    startsWith: (attr, escaped) => `starts-with(@${attr}, ${escaped})`,
+    endsWith: (attr, escaped) => `ends-with(@${attr}, ${escaped})`,
+    matches: (attr, escaped) => `matches(@${attr}, ${escaped})`
+};
+
+const UI_SELECTOR_METHODS: Record<string, string> = {
+    'resource-id': 'resourceId',
+    'content-desc': 'description',
+    'text': 'text',
+    'class': 'className'
+};
+
+const UI_SELECTOR_OPS: Record<LocatorMatch, string> = {
+    equals: '',
+    contains: 'Contains',
+    startsWith: 'StartsWith',
+    endsWith: 'EndsWith',
+    matches: 'Matches'
+};
+
+const BOOLEAN_SELECTOR_ATTRIBUTES = new Set([
+    'checkable', 'checked', 'clickable', 'long-clickable', 'longClickable', 'enabled', 'focusable', 'focused', 'scrollable', 'selected'
+]);
+
 export function generateXPath(
     node: InspectorNode,
     attr?: string,
@@ -727,14 +875,7 @@ export function generateXPath(
     if (preferredAttr && attributes[preferredAttr]) {
         const val = attributes[preferredAttr];
         const escaped = escapeXPath(val);
-        let base = "";
-        switch (type) {
-            case 'contains': base = `//${className}[contains(@${preferredAttr}, ${escaped})]`; break;
-            case 'startsWith': base = `//${className}[starts-with(@${preferredAttr}, ${escaped})]`; break;
-            case 'endsWith': base = `//${className}[ends-with(@${preferredAttr}, ${escaped})]`; break;
-            case 'matches': base = `//${className}[matches(@${preferredAttr}, ${escaped})]`; break;
-            default: base = `//${className}[@${preferredAttr}=${escaped}]`;
-        }
+        let base = `//${className}[${XPATH_PREDICATES[type](preferredAttr, escaped)}]`;
 
         if (addons.length > 0) {
             const extra = addons
@@ -746,19 +887,28 @@ export function generateXPath(
         return base;
     }
 
-    let path = '';
-    let current: InspectorNode | undefined = node;
-
-    while (current && current.parent) {
-        const parentNode: InspectorNode = current.parent;
-        const siblings = parentNode.children.filter(c => c.attributes['class'] === current?.attributes['class']);
-        const index = siblings.indexOf(current) + 1;
+    return '/' + getAbsolutePath(node);
+}
 
-        path = `/${current.attributes['class']}[${index}]` + path;
-        current = parentNode;
+// Positional paths by node, built from the parent's path so walking a whole tree stays linear
+const absolutePaths = new WeakMap<InspectorNode, string>();
+
+function getAbsolutePath(node: InspectorNode): string {
+    if (!node.parent) return '';
+    const cached = absolutePaths.get(node);
+    if (cached !== undefined) return cached;
+
+    // Number all of the parent's children in one pass instead of filtering siblings per node
+    const parentPath = getAbsolutePath(node.parent);
+    const classCounts = new Map<string | undefined, number>();
+    for (const child of node.parent.children) {
+        const className = child.attributes['class'];
+        const index = (classCounts.get(className) ?? 0) + 1;
+        classCounts.set(className, index);
+        absolutePaths.set(child, `${parentPath}/${className}[${index}]`);
     }
 
-    return '/' + path;
+    return absolutePaths.get(node) ?? `${parentPath}/${node.attributes['class']}[0]`;
 }
 
 /**
@@ -866,41 +1016,19 @@ export function generateUiSelector(node: InspectorNode, options: {
         : options.attr;
     const value = attributes[preferredAttr] || "";
 
-    let method = "";
-    switch (preferredAttr) {
-        case 'resource-id': method = "resourceId"; break;
-        case 'content-desc': method = "description"; break;
-        case 'text': method = "text"; break;
-        case 'class': method = "className"; break;
-        default: method = "text"; break;
-    }
-
-    let op = "";
-    switch (options.type) {
-        case 'equals': op = ""; break;
-        case 'contains': op = "Contains"; break;
-        case 'startsWith': op = "StartsWith"; break;
-        case 'endsWith': op = "EndsWith"; break;
-        case 'matches': op = "Matches"; break;
-    }
+    const method = UI_SELECTOR_METHODS[preferredAttr] ?? "text";
+    const op = UI_SELECTOR_OPS[options.type];
 
     let selectorArr = [`${method}${op}("${value}")`];
 
     if (options.addons && options.addons.length > 0) {
         options.addons.forEach(a => {
-            let m = "";
-            switch (a) {
-                case 'resource-id': m = "resourceId"; break;
-                case 'content-desc': m = "description"; break;
-                case 'text': m = "text"; break;
-                case 'class': m = "className"; break;
-                default: m = a.replace(/-([a-z])/g, g => g[1].toUpperCase());
-            }
+            const m = UI_SELECTOR_METHODS[a] ?? a.replace(/-([a-z])/g, g => g[1].toUpperCase());
             const attrValue = node.attributes[a];
             if (attrValue === undefined || attrValue === null || attrValue === "") {
                 return;
             }
-            if (['checkable', 'checked', 'clickable', 'long-clickable', 'longClickable', 'enabled', 'focusable', 'focused', 'scrollable', 'selected'].includes(a)) {
+            if (BOOLEAN_SELECTOR_ATTRIBUTES.has(a)) {
                 selectorArr.push(`${m}(${attrValue === 'true'})`);
             } else if (a === 'index' || a === 'instance') {
                 selectorArr.push(`${m}(${parseInt(attrValue, 10) || 0})`);
@@ -915,14 +1043,13 @@ export function generateUiSelector(node: InspectorNode, options: {
 }
 
 /**
- * Calculates the absolute position and size for a highlighter overlay based on node bounds and image layout.
+ * Maps a node's bounds into the displayed image's coordinate space.
  */
-export function getHighlighterStyle(
+export function getHighlighterRect(
     node: InspectorNode | null,
-    color: string,
     imgLayout?: { width: number, height: number, naturalWidth: number, naturalHeight: number } | null
-): React.CSSProperties {
-    if (!node?.bounds || !imgLayout) return { display: 'none' };
+): { x: number; y: number; w: number; h: number } | null {
+    if (!node?.bounds || !imgLayout) return null;
 
     let transformedBounds = node.bounds;
     let root: InspectorNode | undefined = node;
@@ -943,10 +1070,29 @@ export function getHighlighterStyle(
     const scaleY = imgLayout.height / imgLayout.naturalHeight;
 
     return {
-        left: transformedBounds.x * scaleX,
-        top: transformedBounds.y * scaleY,
-        width: transformedBounds.w * scaleX,
-        height: transformedBounds.h * scaleY,
+        x: transformedBounds.x * scaleX,
+        y: transformedBounds.y * scaleY,
+        w: transformedBounds.w * scaleX,
+        h: transformedBounds.h * scaleY
+    };
+}
+
+/**
+ * Calculates the absolute position and size for a highlighter overlay based on node bounds and image layout.
+ */
+export function getHighlighterStyle(
+    node: InspectorNode | null,
+    color: string,
+    imgLayout?: { width: number, height: number, naturalWidth: number, naturalHeight: number } | null
+): React.CSSProperties {
+    const rect = getHighlighterRect(node, imgLayout);
+    if (!rect) return { display: 'none' };
+
+    return {
+        left: rect.x,
+        top: rect.y,
+        width: rect.w,
+        height: rect.h,
         borderColor: color,
         backgroundColor: `${color}15` // 15 is ~8% opacity in hex
     };
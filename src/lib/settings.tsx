@@ -356,6 +356,9 @@ interface SettingsContextType {
 
 const SettingsContext = createContext<SettingsContextType | undefined>(undefined);
 
+// System version probes currently running, keyed like their localStorage cache entry
+const inFlightVersionChecks = new Map<string, Promise<SystemVersions>>();
+
 export function SettingsProvider({ children }: { children: ReactNode }) {
     const [storeData, setStoreData] = useState<SettingsStoreData>({
         activeProfileId: 'default',
@@ -825,12 +828,19 @@ export function SettingsProvider({ children }: { children: ReactNode }) {
         }
 
         try {
-            // Conditionally skip ngrok and automator dependencies checks
-            const versions = await invoke<SystemVersions>('get_system_versions', {
-                checkAutomator: mode !== 'explorer',
-                framework: framework,
-                checkNgrok: isNgrokEnabled
-            });
+            // Conditionally skip ngrok and automator dependencies checks. The startup check can
+            // take seconds (JVM/Node probes); callers arriving meanwhile (settings page mount,
+            // onboarding) share the in-flight probe instead of spawning the whole set again.
+            let request = inFlightVersionChecks.get(cacheKey);
+            if (!request) {
+                request = invoke<SystemVersions>('get_system_versions', {
+                    checkAutomator: mode !== 'explorer',
+                    framework: framework,
+                    checkNgrok: isNgrokEnabled
+                }).finally(() => inFlightVersionChecks.delete(cacheKey));
+                inFlightVersionChecks.set(cacheKey, request);
+            }
+            const versions = await request;
 
             localStorage.setItem(cacheKey, JSON.stringify(versions));
             processVersions(versions);
@@ -930,3 +940,18 @@ function deepMerge<T>(target: T, source: Partial<T>): T {
 function isObject(item: unknown): item is Record<string, unknown> {
     return (item !== null && typeof item === 'object' && !Array.isArray(item));
 }
+
+// Last parsed app package setting; every toolbox tool reads the same comma-separated value
+let appPackagesCache: { raw: string, packages: string[] } = { raw: '', packages: [] };
+
+/**
+ * Splits the comma-separated app package setting into trimmed, non-empty package names.
+ * The result is shared between callers and must not be mutated.
+ */
+export function getAppPackages(raw: string | undefined): string[] {
+    const value = raw || '';
+    if (value !== appPackagesCache.raw) {
+        appPackagesCache = { raw: value, packages: value.split(',').map(p => p.trim()).filter(Boolean) };
+    }
+    return appPackagesCache.packages;
+}
@@ -17,6 +17,7 @@ export interface TestSession {
     deviceUdid: string;
     testPath: string;
     logs: string[];
+    droppedLogCount?: number; // Lines trimmed from the front of `logs` by the history cap
     status: 'running' | 'finished' | 'stopped' | 'error' | 'stopping';
     exitCode?: string;
     argumentsFile?: string | null;
@@ -40,7 +41,7 @@ export interface TestSession {
 
 interface TestOutputPayload {
     run_id: string;
-    message: string;
+    lines: string[];
 }
 
 interface TestFinishedPayload {
@@ -65,6 +66,22 @@ interface TestSessionContextType {
     appiumRunning: boolean;
 }
 
+// How long test output is allowed to accumulate before it is applied to session state
+const OUTPUT_FLUSH_MS = 50;
+// Console history kept per session; older lines are dropped so hours-long runs stay bounded
+const MAX_SESSION_LOG_LINES = 10000;
+
+function appendSessionLogs(session: TestSession, lines: string[]): TestSession {
+    const logs = session.logs.concat(lines);
+    const overflow = logs.length - MAX_SESSION_LOG_LINES;
+    if (overflow <= 0) return { ...session, logs };
+    return {
+        ...session,
+        logs: logs.slice(overflow),
+        droppedLogCount: (session.droppedLogCount ?? 0) + overflow
+    };
+}
+
 const TestSessionContext = createContext<TestSessionContextType | undefined>(undefined);
 
 export function TestSessionProvider({ children }: { children: React.ReactNode }) {
@@ -94,18 +111,51 @@ export function TestSessionProvider({ children }: { children: React.ReactNode })
         return () => clearInterval(interval);
     }, [settings.appiumHost, settings.appiumPort, isTestRunning]);
     useEffect(() => {
+        // Output lines are queued per run and applied in a single state update shortly after they arrive,
+        // instead of copying every session's log array for each line. Nothing is scheduled while idle.
+        const pendingOutput = new Map<string, string[]>();
+        let flushTimer: ReturnType<typeof setTimeout> | null = null;
+
+        const flushOutput = () => {
+            if (flushTimer !== null) {
+                clearTimeout(flushTimer);
+                flushTimer = null;
+            }
+            if (pendingOutput.size === 0) return;
+
+            const batch = new Map(pendingOutput);
+            pendingOutput.clear();
+            setSessions(prev => {
+                // Output can keep arriving for a run whose tab was already closed; drop it
+                // without producing a new sessions array so nothing re-renders for it
+                let changed = false;
+                const next = prev.map(s => {
+                    const lines = batch.get(s.runId) ?? (s.activeRunId ? batch.get(s.activeRunId) : undefined);
+                    if (!lines) return s;
+                    changed = true;
+                    return appendSessionLogs(s, lines);
+                });
+                return changed ? next : prev;
+            });
+        };
+
         const unlistenOutputPromise = listen<TestOutputPayload>('test-output', (event) => {
-            const { run_id, message } = event.payload;
-            setSessions(prev => prev.map(s => {
-                if (s.runId === run_id || s.activeRunId === run_id) {
-                    return { ...s, logs: [...s.logs, message] };
-                }
-                return s;
-            }));
+            const { run_id, lines } = event.payload;
+            const queued = pendingOutput.get(run_id);
+            if (queued) {
+                queued.push(...lines);
+            } else {
+                pendingOutput.set(run_id, [...lines]);
+            }
+            if (flushTimer === null) {
+                flushTimer = setTimeout(flushOutput, OUTPUT_FLUSH_MS);
+            }
         });
 
         const unlistenFinishedPromise = listen<TestFinishedPayload>('test-finished', (event) => {
             const { run_id, exit_code } = event.payload;
+            // Land any queued output before the finish marker so log order is preserved
+            flushOutput();
             
             // Find the session before state update to trigger side effects
             setSessions(prev => {
@@ -218,6 +268,9 @@ export function TestSessionProvider({ children }: { children: React.ReactNode })
                     }
                 }
 
+                // The tab was closed before its run finished; nothing to update
+                if (!sessionToFinish) return prev;
+
                 // Return updated state
                 return prev.map(s => {
                     if (s.runId === run_id || s.activeRunId === run_id) {
@@ -238,6 +291,7 @@ export function TestSessionProvider({ children }: { children: React.ReactNode })
         });
 
         return () => {
+            if (flushTimer !== null) clearTimeout(flushTimer);
             unlistenOutputPromise.then(f => f());
             unlistenFinishedPromise.then(f => f());
         };
@@ -265,6 +319,7 @@ export function TestSessionProvider({ children }: { children: React.ReactNode })
                         type: 'test',
                         testPath,
                         logs: [`[System] Starting test session: ${runId}`, `[System] Device: ${deviceName}`, `[System] Suite: ${testPath}`, '----------------------------------------'],
+                        droppedLogCount: 0,
                         status: 'running',
                         outputDir,
                         argumentsFile,
@@ -593,7 +648,7 @@ export function TestSessionProvider({ children }: { children: React.ReactNode })
     }, []);
 
     const addSessionLog = useCallback((runId: string, message: string) => {
-        setSessions(prev => prev.map(s => (s.runId === runId || s.activeRunId === runId) ? { ...s, logs: [...s.logs, message] } : s));
+        setSessions(prev => prev.map(s => (s.runId === runId || s.activeRunId === runId) ? appendSessionLogs(s, [message]) : s));
     }, []);
 
     const markSessionFinished = useCallback((runId: string, exitCode: string) => {
@@ -1,7 +1,7 @@
 import { Scale, GitBranch, Bot, RefreshCcw, Cpu, Users, Info, User } from "lucide-react";
 import { PageHeader } from "@/components/organisms/PageHeader";
 import { useTranslation } from "react-i18next";
-import { useState } from "react";
+import { useMemo, useState } from "react";
 import packageJson from '../../package.json';
 import { useSettings } from "@/lib/settings";
 import { Button } from "@/components/atoms/Button";
@@ -10,7 +10,7 @@ import { Section } from "@/components/organisms/Section";
 import { InfoCard } from "@/components/molecules/InfoCard";
 import { ExpressiveLoading } from "@/components/atoms/ExpressiveLoading";
 import { UpdateModal } from "@/components/organisms/UpdateModal";
-import ReactMarkdown from 'react-markdown';
+import ReactMarkdown, { type Components } from 'react-markdown';
 
 
 const TOOLS = [
@@ -26,6 +26,23 @@ const TOOLS = [
     { key: 'lucide', url: 'https://lucide.dev' }
 ];
 
+const CONTRIBUTORS = [
+    { name: 'Lucas de Eiroz Rodrigues', url: 'https://github.com/lucasdeeiroz', roleKey: 'about.lead' },
+    { name: 'Alessandra Gomes de Almeida', url: 'https://github.com/alealmeida31', roleKey: 'about.dev_collaborator' },
+    { name: 'Sarah Shelly Da Silva Farias', url: 'https://github.com/sarahssf', roleKey: 'about.qa_collaborator' },
+    { name: 'Abel Freire de Andrade', url: 'https://github.com/abelandrad', roleKey: 'about.qa_collaborator' }
+] as const;
+
+// Hoisted so the markdown renderer keeps stable component identities across renders
+const LICENSE_MARKDOWN_COMPONENTS: Components = {
+    p: ({ children }) => <p className="mb-1 last:mb-0">{children}</p>,
+    strong: ({ children }) => <strong className="font-bold text-on-surface/90">{children}</strong>,
+    ul: ({ children }) => <ul className="space-y-0.5 mb-2">{children}</ul>,
+    li: ({ children }) => <li className="ml-4 list-disc mb-1 last:mb-0">{children}</li>,
+    h1: ({ children }) => <h1 className="text-lg font-bold text-on-surface mb-2 mt-4 first:mt-0">{children}</h1>,
+    h2: ({ children }) => <h2 className="text-md font-bold text-on-surface mb-2 mt-3 first:mt-0">{children}</h2>
+};
+
 interface AboutPageProps {
     onNavigate?: (page: string) => void;
 }
@@ -39,6 +56,25 @@ export function AboutPage({ onNavigate: _onNavigate }: AboutPageProps) {
     const [isChecking, setIsChecking] = useState(false);
     const [isUpdateModalOpen, setIsUpdateModalOpen] = useState(false);
 
+    // Resolve the static catalog strings once per language instead of on every render
+    // (the update check and title clicks re-render this page frequently). `t` changes
+    // identity when the language switches, which invalidates these.
+    const channelOptions = useMemo(() => [
+        { value: 'stable', label: t('about.channel_stable') },
+        { value: 'beta', label: t('about.channel_beta') },
+        { value: 'alpha', label: t('about.channel_alpha') }
+    ], [t]);
+    const toolCards = useMemo(() => TOOLS.map(tool => ({
+        ...tool,
+        name: t(`about.tools_list.${tool.key}.name` as any) as string,
+        desc: t(`about.tools_list.${tool.key}.desc` as any) as string
+    })), [t]);
+    const licenseText = useMemo(() => (
+        <ReactMarkdown components={LICENSE_MARKDOWN_COMPONENTS}>
+            {t('about.license_desc')}
+        </ReactMarkdown>
+    ), [t]);
+
     // Check global state
     const updateAvailable = updateInfo?.available || false;
 
@@ -92,24 +128,18 @@ export function AboutPage({ onNavigate: _onNavigate }: AboutPageProps) {
 
                             <div className="flex items-center gap-2 bg-surface-variant/20 px-3 py-1.5 rounded-2xl border border-outline-variant/30 w-max mr-2">
                                 <span className="text-xs text-on-surface-variant font-medium whitespace-nowrap">{t('about.update_channel')}:</span>
-                                <div className="w-28">
-                                    <Select
-                                        value={settings.updateChannel || 'stable'}
-                                        onChange={(e) => {
-                                            const value = e.target.value;
-                                            if (value === 'stable' || value === 'beta' || value === 'alpha') {
-                                                updateSetting('updateChannel', value as UpdateChannel);
-                                            }
-                                        }}
-                                        containerClassName="!space-y-0"
-                                        className="!py-1 !px-2 !min-h-0 bg-transparent border-none shadow-none focus:ring-0 text-xs font-medium"
-                                        options={[
-                                            { value: 'stable', label: t('about.channel_stable') },
-                                            { value: 'beta', label: t('about.channel_beta') },
-                                            { value: 'alpha', label: t('about.channel_alpha') }
-                                        ]}
-                                    />
-                                </div>
+                                <Select
+                                    value={settings.updateChannel || 'stable'}
+                                    onChange={(e) => {
+                                        const value = e.target.value;
+                                        if (value === 'stable' || value === 'beta' || value === 'alpha') {
+                                            updateSetting('updateChannel', value as UpdateChannel);
+                                        }
+                                    }}
+                                    containerClassName="!space-y-0 w-28"
+                                    className="!py-1 !px-2 !min-h-0 bg-transparent border-none shadow-none focus:ring-0 text-xs font-medium"
+                                    options={channelOptions}
+                                />
                             </div>
                             <span>v{appVersion}</span>
                             <div className="w-px h-3 bg-primary/20 mx-0.5" />
@@ -151,14 +181,14 @@ export function AboutPage({ onNavigate: _onNavigate }: AboutPageProps) {
                             description={t('about.tools_desc')}
                         >
                             <div className="grid grid-cols-1 sm:grid-cols-2 gap-3">
-                                {TOOLS.map(tool => (
+                                {toolCards.map(tool => (
                                     <InfoCard
                                         key={tool.key}
-                                        title={t(`about.tools_list.${tool.key}.name` as any)}
+                                        title={tool.name}
                                         href={tool.url}
                                         headerRight={<span className="text-on-surface/80">↗</span>}
                                     >
-                                        {t(`about.tools_list.${tool.key}.desc` as any)}
+                                        {tool.desc}
                                     </InfoCard>
                                 ))}
                             </div>
@@ -175,21 +205,8 @@ export function AboutPage({ onNavigate: _onNavigate }: AboutPageProps) {
                                         {t('about.license')}
                                         <span className="text-[10px] uppercase font-bold bg-success-container text-on-success-container px-1.5 py-0.5 rounded border border-success-container/20">Non-Commercial</span>
                                     </div>
-                                    <div className="max-h-91.5 overflow-y-auto custom-scrollbar pr-2">
-                                        <div className="text-sm text-on-surface-variant/80 leading-relaxed">
-                                            <ReactMarkdown
-                                                components={{
-                                                    p: ({ children }) => <p className="mb-1 last:mb-0">{children}</p>,
-                                                    strong: ({ children }) => <strong className="font-bold text-on-surface/90">{children}</strong>,
-                                                    ul: ({ children }) => <ul className="space-y-0.5 mb-2">{children}</ul>,
-                                                    li: ({ children }) => <li className="ml-4 list-disc mb-1 last:mb-0">{children}</li>,
-                                                    h1: ({ children }) => <h1 className="text-lg font-bold text-on-surface mb-2 mt-4 first:mt-0">{children}</h1>,
-                                                    h2: ({ children }) => <h2 className="text-md font-bold text-on-surface mb-2 mt-3 first:mt-0">{children}</h2>
-                                                }}
-                                            >
-                                                {t('about.license_desc')}
-                                            </ReactMarkdown>
-                                        </div>
+                                    <div className="max-h-91.5 overflow-y-auto custom-scrollbar pr-2 text-sm text-on-surface-variant/80 leading-relaxed">
+                                        {licenseText}
                                     </div>
                                 </div>
 
@@ -212,54 +229,21 @@ export function AboutPage({ onNavigate: _onNavigate }: AboutPageProps) {
                             className="md:col-span-2"
                         >
                             <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
-                                <InfoCard
-                                    title="Lucas de Eiroz Rodrigues"
-                                    href="https://github.com/lucasdeeiroz"
-                                    headerRight={<span>↗</span>}
-                                    icon={
-                                        <div className="w-12 h-12 bg-surface-variant/30 rounded-2xl flex items-center justify-center text-on-surface-variant/80">
-                                            <User size={24} />
-                                        </div>
-                                    }
-                                >
-                                    {t('about.lead')}
-                                </InfoCard>
-                                <InfoCard
-                                    title="Alessandra Gomes de Almeida"
-                                    href="https://github.com/alealmeida31"
-                                    headerRight={<span>↗</span>}
-                                    icon={
-                                        <div className="w-12 h-12 bg-surface-variant/30 rounded-2xl flex items-center justify-center text-on-surface-variant/80">
-                                            <User size={24} />
-                                        </div>
-                                    }
-                                >
-                                    {t('about.dev_collaborator')}
-                                </InfoCard>
-                                <InfoCard
-                                    title="Sarah Shelly Da Silva Farias"
-                                    href="https://github.com/sarahssf"
-                                    headerRight={<span>↗</span>}
-                                    icon={
-                                        <div className="w-12 h-12 bg-surface-variant/30 rounded-2xl flex items-center justify-center text-on-surface-variant/80">
-                                            <User size={24} />
-                                        </div>
-                                    }
-                                >
-                                    {t('about.qa_collaborator')}
-                                </InfoCard>
-                                <InfoCard
-                                    title="Abel Freire de Andrade"
-                                    href="https://github.com/abelandrad"
-                                    headerRight={<span>↗</span>}
-                                    icon={
-                                        <div className="w-12 h-12 bg-surface-variant/30 rounded-2xl flex items-center justify-center text-on-surface-variant/80">
-                                            <User size={24} />
-                                        </div>
-                                    }
-                                >
-                                    {t('about.qa_collaborator')}
-                                </InfoCard>
+                                {CONTRIBUTORS.map(person => (
+                                    <InfoCard
+                                        key={person.url}
+                                        title={person.name}
+                                        href={person.url}
+                                        headerRight={<span>↗</span>}
+                                        icon={
+                                            <div className="w-12 h-12 bg-surface-variant/30 rounded-2xl flex items-center justify-center text-on-surface-variant/80">
+                                                <User size={24} />
+                                            </div>
+                                        }
+                                    >
+                                        {t(person.roleKey)}
+                                    </InfoCard>
+                                ))}
                             </div>
                         </Section>
                     </div>
@@ -51,6 +51,14 @@ export function RunPage({ onNavigate, initialTab }: RunPageProps) {
         return 'tests';
     });
 
+    // Connect/Inspector are only mounted once first opened (and then kept alive to preserve their state),
+    // so startup doesn't pay for their adb probes and viewport setup when the user never visits them
+    const [visitedTabs, setVisitedTabs] = useState<Set<TabType>>(() => new Set([activeTab]));
+    useEffect(() => {
+        setVisitedTabs(prev => prev.has(activeTab) ? prev : new Set(prev).add(activeTab));
+    }, [activeTab]);
+    const isTabMounted = (tab: TabType) => tab === activeTab || visitedTabs.has(tab);
+
     // Safety check if status updates later
     useEffect(() => {
         if (activeTab === 'tests' && isLauncherDisabled) {
@@ -170,17 +178,21 @@ export function RunPage({ onNavigate, initialTab }: RunPageProps) {
                     </div>
                 )}
 
-                <div className={clsx("h-full flex-1 min-h-0", activeTab === 'connect' ? "flex flex-col" : "hidden")}>
-                    <ConnectSubTab onDeviceConnected={loadDevices} selectedDevice={selectedDevices[0]} />
-                </div>
+                {isTabMounted('connect') && (
+                    <div className={clsx("h-full flex-1 min-h-0", activeTab === 'connect' ? "flex flex-col" : "hidden")}>
+                        <ConnectSubTab onDeviceConnected={loadDevices} selectedDevice={selectedDevices[0]} />
+                    </div>
+                )}
 
-                <div className={clsx("h-full flex-1 min-h-0", activeTab === 'inspector' ? "flex flex-col" : "hidden")}>
-                    <InspectorSubTab
-                        selectedDevice={selectedDevices[0] || ""}
-                        isActive={activeTab === 'inspector'}
-                        isTestRunning={selectedDevices[0] ? busyDeviceIds.includes(selectedDevices[0]) : false}
-                    />
-                </div>
+                {isTabMounted('inspector') && (
+                    <div className={clsx("h-full flex-1 min-h-0", activeTab === 'inspector' ? "flex flex-col" : "hidden")}>
+                        <InspectorSubTab
+                            selectedDevice={selectedDevices[0] || ""}
+                            isActive={activeTab === 'inspector'}
+                            isTestRunning={selectedDevices[0] ? busyDeviceIds.includes(selectedDevices[0]) : false}
+                        />
+                    </div>
+                )}
             </div>
         </div >
     );
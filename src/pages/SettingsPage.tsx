@@ -52,6 +52,18 @@ import { ExpressiveLoading } from "@/components/atoms/ExpressiveLoading";
 
 import { useRemoteConfig } from "@/lib/RemoteConfigProvider";
 
+/** How often the Appium status is re-checked when no server event has arrived. */
+const APPIUM_STATUS_FALLBACK_MS = 10000;
+
+/** Appium logs this once its HTTP interface accepts connections. */
+const APPIUM_READY_RE = /listener started/i;
+
+/** Lines of Appium output kept for the settings log view. */
+const MAX_APPIUM_LOG_LINES = 500;
+
+/** How long Appium output lines are collected before being applied in one update. */
+const APPIUM_LOG_FLUSH_MS = 100;
+
 interface SettingsPageProps {
     onNavigate?: (page: string) => void;
 }
@@ -313,21 +325,37 @@ export function SettingsPage({ onNavigate: _onNavigate }: SettingsPageProps) {
         // Initial status check
         checkAppiumStatus(isTestRunningRef.current);
 
-        // Poll status every 2 seconds
-        const interval = setInterval(() => checkAppiumStatus(isTestRunningRef.current), 2000);
-
-        // Listen for logs
-        const unlistenPromise = listen<string>('appium-output', (event) => {
+        // The server we spawn reports its own readiness and exit, so polling is only a fallback
+        // for servers started outside the app (e.g. in a terminal window)
+        const interval = setInterval(() => checkAppiumStatus(isTestRunningRef.current), APPIUM_STATUS_FALLBACK_MS);
+
+        // Listen for logs. Appium emits one event per line, so lines are coalesced and applied
+        // (and trimmed to the cap) in one state update per flush
+        let pendingLogs: string[] = [];
+        let flushTimer: ReturnType<typeof setTimeout> | undefined;
+        const flushLogs = () => {
+            flushTimer = undefined;
+            const batch = pendingLogs;
+            pendingLogs = [];
             setAppiumLogs(prev => {
-                const newLogs = [...prev, event.payload];
-                if (newLogs.length > 500) return newLogs.slice(-500); // Limit logs
-                return newLogs;
+                const keep = Math.max(0, MAX_APPIUM_LOG_LINES - batch.length);
+                return prev.slice(Math.max(0, prev.length - keep)).concat(batch.slice(-MAX_APPIUM_LOG_LINES));
             });
+        };
+        const unlistenPromise = listen<string>('appium-output', (event) => {
+            if (APPIUM_READY_RE.test(event.payload)) {
+                checkAppiumStatus(isTestRunningRef.current);
+            }
+            pendingLogs.push(event.payload);
+            if (!flushTimer) flushTimer = setTimeout(flushLogs, APPIUM_LOG_FLUSH_MS);
         });
+        const unlistenExitPromise = listen('appium-exited', () => checkAppiumStatus(isTestRunningRef.current));
 
         return () => {
             clearInterval(interval);
+            clearTimeout(flushTimer);
             unlistenPromise.then(unlisten => unlisten());
+            unlistenExitPromise.then(unlisten => unlisten());
         };
     }, []);
 
@@ -89,14 +89,17 @@ export function TestsPage({ onNavigate }: TestsPageProps) {
     useEffect(() => {
         if (!isGridView) return;
 
-        const updateGrid = () => {
-            if (!gridContainerRef.current) return;
-            const width = gridContainerRef.current.offsetWidth;
+        // Only the column count that fits matters, so a resize that keeps it is a no-op
+        let lastMaxCols: number | null = null;
+
+        const updateGrid = (width: number) => {
             const minWidth = 360; // Increased min-width to avoid crowding
             const count = visibleSessions.length;
             if (count === 0) return;
 
             const maxCols = Math.max(1, Math.floor(width / minWidth));
+            if (maxCols === lastMaxCols) return;
+            lastMaxCols = maxCols;
 
             // If only 1 col fits, accept it.
             if (maxCols === 1) {
@@ -121,12 +124,29 @@ export function TestsPage({ onNavigate }: TestsPageProps) {
             setGridCols(bestCols);
         };
 
-        const observer = new ResizeObserver(updateGrid);
-        if (gridContainerRef.current) observer.observe(gridContainerRef.current);
-        // Also run on session count change
-        updateGrid();
+        // Dragging the window fires the observer on every frame; recompute at most once per
+        // ~33ms, using the size the observer already measured instead of reading offsetWidth
+        let resizeTimeoutId: ReturnType<typeof setTimeout> | null = null;
+        let observedWidth = 0;
+        const observer = new ResizeObserver(entries => {
+            const entry = entries[entries.length - 1];
+            observedWidth = entry.borderBoxSize?.[0]?.inlineSize ?? entry.contentRect.width;
+            if (resizeTimeoutId !== null) return;
+            resizeTimeoutId = setTimeout(() => {
+                resizeTimeoutId = null;
+                updateGrid(observedWidth);
+            }, 33);
+        });
+        if (gridContainerRef.current) {
+            observer.observe(gridContainerRef.current);
+            // Also run on session count change
+            updateGrid(gridContainerRef.current.offsetWidth);
+        }
 
-        return () => observer.disconnect();
+        return () => {
+            observer.disconnect();
+            if (resizeTimeoutId !== null) clearTimeout(resizeTimeoutId);
+        };
     }, [isGridView, visibleSessions.length]);
 
     // Auto-disable grid if items drop below 2